@@ -4,14 +4,25 @@ REST API to serve model predictions
 Author: Jay Prakash
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from resource_budget import ResourceBudget
+
+# Size BLAS/OpenMP thread pools to this worker's share of the CPU budget before numpy loads
+budget = ResourceBudget.from_env().apply()
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, validator
 from typing import List, Dict
 import pickle
 import numpy as np
 import json
-import os
+import time
 from datetime import datetime
 
 # Initialize FastAPI app
@@ -42,6 +53,10 @@ scaler = None
 feature_names = None
 metadata = None
 
+# Readiness flips only after the model is loaded and warmup has finished
+model_ready = False
+warmup_stats = {}
+
 
 def load_model_components():
     """Load model and preprocessing components"""
@@ -66,11 +81,43 @@ def load_model_components():
         raise
 
 
+async def warmup_model(n_warm_requests=20, batch_sizes=(8, 64)):
+    """
+    Run representative single and batch predictions through the endpoint
+    handlers so BLAS, sklearn validation and pydantic paths are hot.
+    """
+    global model_ready, warmup_stats
+    
+    start = time.perf_counter()
+    example = PatientData(**PatientData.Config.schema_extra["example"])
+    
+    latencies = []
+    for _ in range(n_warm_requests + 1):
+        request_start = time.perf_counter()
+        await predict(example)
+        latencies.append((time.perf_counter() - request_start) * 1000)
+    
+    for batch_size in batch_sizes:
+        await predict_batch([example] * min(batch_size, 100))
+    
+    warmup_stats = {
+        "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+        "cold_latency_ms": round(latencies[0], 2),
+        "warm_latency_ms": round(float(np.median(latencies[1:])), 2)
+    }
+    model_ready = True
+    
+    print(f"✓ Warmup finished in {warmup_stats['duration_ms']:.1f} ms "
+          f"(cold request: {warmup_stats['cold_latency_ms']:.2f} ms, "
+          f"warm request: {warmup_stats['warm_latency_ms']:.2f} ms)")
+
+
 # Load components on startup
 @app.on_event("startup")
 async def startup_event():
-    """Load model components when API starts"""
+    """Load model components and warm them up when API starts"""
     load_model_components()
+    await warmup_model()
 
 
 # Pydantic models for request/response validation
@@ -152,6 +199,26 @@ async def health_check():
     )
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive", "timestamp": datetime.now().isoformat()}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: the model is loaded and warmup has completed"""
+    return JSONResponse(
+        status_code=200 if model_ready else 503,
+        content={
+            "status": "ready" if model_ready else "not ready",
+            "model_loaded": model is not None,
+            "warmup": warmup_stats,
+            "timestamp": datetime.now().isoformat()
+        }
+    )
+
+
 @app.get("/model/info", response_model=Dict)
 async def get_model_info():
     """Get model information and metadata"""
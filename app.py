@@ -5,25 +5,79 @@ Author: Jay Prakash kumar
 """
 
 from flask import Flask, render_template, request, jsonify
+from jinja2.utils import htmlsafe_json_dumps
 import pickle
 import numpy as np
 import pandas as pd
 import os
+import sys
+import time
 from datetime import datetime
 import json
+import hashlib
+import gzip
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from tree_inference import compile_ensemble, is_supported
+from resource_budget import ResourceBudget
+from chart_data import CHART_SECTIONS, load_chart_payloads
+from browser_model import browser_model_payload, risk_level
+from static_assets import ASSET_URL_PREFIX, IMMUTABLE_CACHE_CONTROL, AssetManifest
+
+# Size native thread pools to this worker's share of the CPU budget
+budget = ResourceBudget.from_env().apply()
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'heart-disease-prediction-2025'
 
+# Fingerprinted, precompressed static files; templates link them with asset_url()
+asset_manifest = AssetManifest(app.static_folder)
+app.jinja_env.globals['asset_url'] = asset_manifest.url
+
 # Global variables for model components
 model = None
+predictor = None
 scaler = None
 feature_names = None
 metadata = None
 
+# Serialized chart data and strong ETags per section, built once at startup
+chart_payloads = {}
+
+# Serialized browser model artifact and its version, or None if the model cannot be exported
+browser_model = None
+
+# Responses derived from the metadata, built once at startup and inlined into the main page
+model_info_data = None
+models_comparison_data = None
+bootstrap_json = htmlsafe_json_dumps({})
+index_page = None
+
+# Readiness flips only after the model is loaded and warmup has finished
+model_ready = False
+warmup_stats = {}
+
+# Representative patients used to exercise the prediction path at startup
+WARMUP_PATIENTS = [
+    {
+        'age': 63, 'sex': 1, 'chest_pain_type': 3, 'resting_blood_pressure': 145,
+        'cholesterol': 233, 'fasting_blood_sugar': 1, 'resting_ecg': 0,
+        'max_heart_rate': 150, 'exercise_induced_angina': 0, 'st_depression': 2.3,
+        'st_slope': 0, 'num_major_vessels': 0, 'thalassemia': 1
+    },
+    {
+        'age': 35, 'sex': 0, 'chest_pain_type': 0, 'resting_blood_pressure': 120,
+        'cholesterol': 180, 'fasting_blood_sugar': 0, 'resting_ecg': 0,
+        'max_heart_rate': 180, 'exercise_induced_angina': 0, 'st_depression': 0.0,
+        'st_slope': 1, 'num_major_vessels': 0, 'thalassemia': 2
+    }
+]
+
 def load_model_components():
     """Load the trained model and preprocessing components"""
-    global model, scaler, feature_names, metadata
+    global model, predictor, scaler, feature_names, metadata, chart_payloads, browser_model
+    global model_info_data, models_comparison_data, bootstrap_json, index_page
     
     models_dir = 'models'
     
@@ -34,6 +88,13 @@ def load_model_components():
             with open(model_path, 'rb') as f:
                 model = pickle.load(f)
             print(f"✓ Loaded model from: {model_path}")
+            
+            # Serve tree ensembles through the flattened-array engine
+            if is_supported(model):
+                predictor = compile_ensemble(model)
+                print(f"✓ Compiled {type(model).__name__} ({predictor.n_trees} trees) for fast inference")
+            else:
+                predictor = model
         else:
             print(f"⚠️ Model file not found: {model_path}")
             return False
@@ -59,54 +120,168 @@ def load_model_components():
                 metadata = json.load(f)
             print("✓ Loaded metadata")
         
+        # Precompute the metadata responses and the main page's bootstrap payload
+        model_info_data = build_model_info()
+        models_comparison_data = build_models_comparison()
+        bootstrap_json = htmlsafe_json_dumps({
+            'model_info': model_info_data,
+            'models_comparison': models_comparison_data
+        })
+        index_page = None
+        
+        # Export the model for in-browser inference
+        browser_model = browser_model_payload(model, scaler, feature_names)
+        if browser_model:
+            print(f"✓ Exported model for in-browser inference ({len(browser_model[0]) / 1024:.1f} KB, "
+                  f"version {browser_model[1][:8]})")
+        
+        # Load chart data
+        chart_payloads = load_chart_payloads(models_dir)
+        if chart_payloads:
+            print(f"✓ Loaded chart data ({len(chart_payloads['all'][0]) / 1024:.1f} KB)")
+        
         return True
     except Exception as e:
         print(f"Error loading model components: {e}")
         return False
 
-# Load model on startup
-print("\n" + "=" * 60)
-print("INITIALIZING DISEASE PREDICTIONIQ APPLICATION")
-print("=" * 60)
-load_model_components()
-print("=" * 60 + "\n")
+def warmup_model(n_warm_requests=20, batch_sizes=(8, 64)):
+    """
+    Run representative predictions through the full request path so BLAS,
+    sklearn validation and Flask/JSON code paths are hot before traffic arrives.
+    """
+    global model_ready, warmup_stats
+    
+    if model is None:
+        print("⚠️ Skipping warmup: model not loaded")
+        return False
+    
+    start = time.perf_counter()
+    client = app.test_client()
+    
+    # Single predictions through the HTTP handler
+    latencies = []
+    for i in range(n_warm_requests + 1):
+        request_start = time.perf_counter()
+        response = client.post('/api/predict', json=WARMUP_PATIENTS[i % len(WARMUP_PATIENTS)])
+        latencies.append((time.perf_counter() - request_start) * 1000)
+        if response.status_code != 200:
+            print(f"⚠️ Warmup prediction failed: {response.get_json()}")
+            return False
+    
+    # Batch predictions through scaler and model
+    for batch_size in batch_sizes:
+        batch = np.array([list(WARMUP_PATIENTS[i % len(WARMUP_PATIENTS)].values())
+                          for i in range(batch_size)], dtype=float)
+        batch_scaled = scaler.transform(batch) if scaler else batch
+        predictor.predict(batch_scaled)
+        predictor.predict_proba(batch_scaled)
+    
+    warmup_stats = {
+        'duration_ms': round((time.perf_counter() - start) * 1000, 2),
+        'cold_latency_ms': round(latencies[0], 2),
+        'warm_latency_ms': round(float(np.median(latencies[1:])), 2)
+    }
+    model_ready = True
+    
+    print(f"✓ Warmup finished in {warmup_stats['duration_ms']:.1f} ms "
+          f"(cold request: {warmup_stats['cold_latency_ms']:.2f} ms, "
+          f"warm request: {warmup_stats['warm_latency_ms']:.2f} ms)")
+    return True
+
+def build_model_info():
+    """Build the /api/model-info response from the metadata, or None without metadata"""
+    if not metadata:
+        return None
+    
+    # Get performance metrics and convert to expected format
+    perf_metrics = metadata.get('performance_metrics', {})
+    
+    # Calculate overall score as average of all metrics
+    overall_score = sum([
+        perf_metrics.get('test_accuracy', 0),
+        perf_metrics.get('test_precision', 0),
+        perf_metrics.get('test_recall', 0),
+        perf_metrics.get('test_f1_score', 0),
+        perf_metrics.get('test_roc_auc', 0)
+    ]) / 5
+    
+    return {
+        'success': True,
+        'model_name': metadata.get('model_name', 'Unknown'),
+        'model_type': metadata.get('model_type', 'Unknown'),
+        'creation_date': metadata.get('creation_date', 'Unknown'),
+        'metrics': {
+            'accuracy': perf_metrics.get('test_accuracy', 0),
+            'precision': perf_metrics.get('test_precision', 0),
+            'recall': perf_metrics.get('test_recall', 0),
+            'f1_score': perf_metrics.get('test_f1_score', 0),
+            'roc_auc': perf_metrics.get('test_roc_auc', 0),
+            'overall_score': overall_score
+        },
+        'features': feature_names if feature_names else []
+    }
+
+def build_models_comparison():
+    """Build the /api/models-comparison response from the metadata, or None if it is missing"""
+    models_data = (metadata or {}).get('models_comparison')
+    if not models_data:
+        return None
+    
+    # Sort by ROC-AUC score (descending)
+    models_data_sorted = sorted(models_data, key=lambda x: x['roc_auc'], reverse=True)
+    
+    return {
+        'success': True,
+        'total_models': len(models_data),
+        'models': models_data_sorted,
+        'categories': sorted(set(m['category'] for m in models_data)),
+        'best_model': next((m for m in models_data if m['is_best']), models_data_sorted[0])
+    }
 
 @app.route('/')
 def index():
-    """Render the main page"""
-    return render_template('index.html')
+    """Render the main page with the model info and comparison inlined"""
+    global index_page
+    
+    # The page only changes when the model is reloaded; templates are re-read in debug mode
+    if index_page is None or app.debug:
+        body = render_template('index.html', bootstrap_json=bootstrap_json).encode()
+        index_page = ({'gzip': gzip.compress(body, compresslevel=9, mtime=0), 'identity': body},
+                      hashlib.sha256(body).hexdigest()[:32])
+    
+    variants, etag = index_page
+    encoding = request.accept_encodings.best_match(list(variants)) or 'identity'
+    response = app.response_class(variants[encoding], mimetype='text/html')
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(f"{etag}-{encoding}")
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+@app.route(f'{ASSET_URL_PREFIX}/<path:filename>', methods=['GET'])
+def static_asset(filename):
+    """Serve a fingerprinted static file, precompressed when the client accepts it"""
+    asset, current = asset_manifest.lookup(filename)
+    if asset is None:
+        return jsonify({'success': False, 'message': 'Asset not found'}), 404
+    
+    encoding = request.accept_encodings.best_match(list(asset.variants)) or 'identity'
+    response = app.response_class(asset.variants[encoding], mimetype=asset.mimetype)
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(f"{asset.digest}-{encoding}")
+    # A stale fingerprint (page rendered before a deploy) gets today's file, revalidated
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL if current else 'no-cache'
+    return response.make_conditional(request)
 
 @app.route('/api/model-info', methods=['GET'])
 def get_model_info():
     """Get information about the loaded model"""
-    if metadata:
-        # Get performance metrics and convert to expected format
-        perf_metrics = metadata.get('performance_metrics', {})
-        
-        # Calculate overall score as average of all metrics
-        overall_score = sum([
-            perf_metrics.get('test_accuracy', 0),
-            perf_metrics.get('test_precision', 0),
-            perf_metrics.get('test_recall', 0),
-            perf_metrics.get('test_f1_score', 0),
-            perf_metrics.get('test_roc_auc', 0)
-        ]) / 5
-        
-        return jsonify({
-            'success': True,
-            'model_name': metadata.get('model_name', 'Unknown'),
-            'model_type': metadata.get('model_type', 'Unknown'),
-            'creation_date': metadata.get('creation_date', 'Unknown'),
-            'metrics': {
-                'accuracy': perf_metrics.get('test_accuracy', 0),
-                'precision': perf_metrics.get('test_precision', 0),
-                'recall': perf_metrics.get('test_recall', 0),
-                'f1_score': perf_metrics.get('test_f1_score', 0),
-                'roc_auc': perf_metrics.get('test_roc_auc', 0),
-                'overall_score': overall_score
-            },
-            'features': feature_names if feature_names else []
-        })
+    if model_info_data:
+        return jsonify(model_info_data)
     else:
         return jsonify({
             'success': False,
@@ -146,28 +321,20 @@ def predict():
             features_scaled = features_array
         
         # Make prediction
-        prediction = model.predict(features_scaled)[0]
-        prediction_proba = model.predict_proba(features_scaled)[0]
+        prediction = predictor.predict(features_scaled)[0]
+        prediction_proba = predictor.predict_proba(features_scaled)[0]
         
         # Determine risk level
         probability = float(prediction_proba[1] * 100)
         
-        if probability < 30:
-            risk_level = 'Low'
-            risk_color = '#10b981'
-        elif probability < 60:
-            risk_level = 'Moderate'
-            risk_color = '#f59e0b'
-        else:
-            risk_level = 'High'
-            risk_color = '#ef4444'
+        level, risk_color = risk_level(probability)
         
         # Prepare response
         response = {
             'success': True,
             'prediction': int(prediction),
             'probability': round(probability, 2),
-            'risk_level': risk_level,
+            'risk_level': level,
             'risk_color': risk_color,
             'diagnosis': 'Heart Disease Detected' if prediction == 1 else 'No Heart Disease Detected',
             'confidence': round(max(prediction_proba) * 100, 2),
@@ -224,161 +391,51 @@ def get_recommendations(prediction, probability, patient_data):
 
 @app.route('/api/models-comparison', methods=['GET'])
 def get_models_comparison():
-    """Get comparison data for all trained models"""
-    # Data from the training notebook - all 14 models comparison
-    models_data = [
-        {
-            'name': 'Neural Network (MLP)',
-            'accuracy': 0.6875,
-            'precision': 0.673,
-            'recall': 0.841,
-            'f1_score': 0.747,
-            'roc_auc': 0.7355,
-            'category': 'Deep Learning',
-            'is_best': True
-        },
-        {
-            'name': 'AdaBoost',
-            'accuracy': 0.7125,
-            'precision': 0.714,
-            'recall': 0.795,
-            'f1_score': 0.752,
-            'roc_auc': 0.7655,
-            'category': 'Boosting',
-            'is_best': False
-        },
-        {
-            'name': 'LightGBM',
-            'accuracy': 0.6875,
-            'precision': 0.702,
-            'recall': 0.750,
-            'f1_score': 0.725,
-            'roc_auc': 0.7462,
-            'category': 'Boosting',
-            'is_best': False
-        },
-        {
-            'name': 'Gradient Boosting',
-            'accuracy': 0.6750,
-            'precision': 0.688,
-            'recall': 0.727,
-            'f1_score': 0.707,
-            'roc_auc': 0.7260,
-            'category': 'Boosting',
-            'is_best': False
-        },
-        {
-            'name': 'XGBoost',
-            'accuracy': 0.6500,
-            'precision': 0.650,
-            'recall': 0.705,
-            'f1_score': 0.676,
-            'roc_auc': 0.7058,
-            'category': 'Boosting',
-            'is_best': False
-        },
-        {
-            'name': 'Extra Trees',
-            'accuracy': 0.6125,
-            'precision': 0.649,
-            'recall': 0.662,
-            'f1_score': 0.655,
-            'roc_auc': 0.7121,
-            'category': 'Ensemble',
-            'is_best': False
-        },
-        {
-            'name': 'K-Nearest Neighbors',
-            'accuracy': 0.6625,
-            'precision': 0.662,
-            'recall': 0.733,
-            'f1_score': 0.695,
-            'roc_auc': 0.6951,
-            'category': 'Instance-based',
-            'is_best': False
-        },
-        {
-            'name': 'Naive Bayes',
-            'accuracy': 0.6500,
-            'precision': 0.650,
-            'recall': 0.705,
-            'f1_score': 0.689,
-            'roc_auc': 0.7216,
-            'category': 'Probabilistic',
-            'is_best': False
-        },
-        {
-            'name': 'Random Forest',
-            'accuracy': 0.6750,
-            'precision': 0.685,
-            'recall': 0.750,
-            'f1_score': 0.716,
-            'roc_auc': 0.7380,
-            'category': 'Ensemble',
-            'is_best': False
-        },
-        {
-            'name': 'Decision Tree',
-            'accuracy': 0.6500,
-            'precision': 0.660,
-            'recall': 0.705,
-            'f1_score': 0.682,
-            'roc_auc': 0.6850,
-            'category': 'Tree-based',
-            'is_best': False
-        },
-        {
-            'name': 'Logistic Regression',
-            'accuracy': 0.7000,
-            'precision': 0.700,
-            'recall': 0.773,
-            'f1_score': 0.735,
-            'roc_auc': 0.7500,
-            'category': 'Linear',
-            'is_best': False
-        },
-        {
-            'name': 'SVM (RBF)',
-            'accuracy': 0.6875,
-            'precision': 0.690,
-            'recall': 0.750,
-            'f1_score': 0.719,
-            'roc_auc': 0.7420,
-            'category': 'Kernel-based',
-            'is_best': False
-        },
-        {
-            'name': 'SVM (Linear)',
-            'accuracy': 0.6750,
-            'precision': 0.680,
-            'recall': 0.727,
-            'f1_score': 0.703,
-            'roc_auc': 0.7250,
-            'category': 'Linear',
-            'is_best': False
-        },
-        {
-            'name': 'Linear Discriminant Analysis',
-            'accuracy': 0.6625,
-            'precision': 0.665,
-            'recall': 0.720,
-            'f1_score': 0.691,
-            'roc_auc': 0.7100,
-            'category': 'Linear',
-            'is_best': False
-        }
-    ]
+    """Get comparison data for all trained models, as written by the training pipeline"""
+    if not models_comparison_data:
+        return jsonify({
+            'success': False,
+            'message': 'Model comparison not available. Run the training pipeline to generate it.'
+        }), 404
     
-    # Sort by ROC-AUC score (descending)
-    models_data_sorted = sorted(models_data, key=lambda x: x['roc_auc'], reverse=True)
+    return jsonify(models_comparison_data)
+
+@app.route('/api/chart-data', methods=['GET'])
+@app.route('/api/chart-data/<section>', methods=['GET'])
+def get_chart_data(section='all'):
+    """Precomputed chart data for client-side rendering, revalidated with a strong ETag"""
+    if section != 'all' and section not in CHART_SECTIONS:
+        return jsonify({
+            'success': False,
+            'message': f"Unknown chart data section '{section}'. Available: {', '.join(CHART_SECTIONS)}"
+        }), 404
+    if not chart_payloads:
+        return jsonify({
+            'success': False,
+            'message': 'Chart data not available. Run the training pipeline to generate it.'
+        }), 404
     
-    return jsonify({
-        'success': True,
-        'total_models': len(models_data),
-        'models': models_data_sorted,
-        'categories': list(set([m['category'] for m in models_data])),
-        'best_model': next(m for m in models_data if m['is_best'])
-    })
+    body, etag = chart_payloads[section]
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    # Clients may keep the payload but must revalidate; unchanged data costs a 304
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+@app.route('/api/model-export', methods=['GET'])
+def get_model_export():
+    """Model weights and scaler for in-browser inference, revalidated with a strong ETag"""
+    if not browser_model:
+        return jsonify({
+            'success': False,
+            'message': 'In-browser inference is not available for this model. Use /api/predict.'
+        }), 404
+    
+    body, version = browser_model
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(version)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -390,6 +447,32 @@ def health_check():
         'timestamp': datetime.now().isoformat()
     })
 
+@app.route('/api/health/live', methods=['GET'])
+def liveness_check():
+    """Liveness probe: the process is up and serving requests"""
+    return jsonify({
+        'status': 'alive',
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/api/health/ready', methods=['GET'])
+def readiness_check():
+    """Readiness probe: the model is loaded and warmup has completed"""
+    return jsonify({
+        'status': 'ready' if model_ready else 'not ready',
+        'model_loaded': model is not None,
+        'warmup': warmup_stats,
+        'timestamp': datetime.now().isoformat()
+    }), 200 if model_ready else 503
+
+# Load model and warm it up on startup
+print("\n" + "=" * 60)
+print("INITIALIZING DISEASE PREDICTIONIQ APPLICATION")
+print("=" * 60)
+if load_model_components():
+    warmup_model()
+print("=" * 60 + "\n")
+
 if __name__ == '__main__':
     # Ensure templates and static directories exist
     os.makedirs('templates', exist_ok=True)
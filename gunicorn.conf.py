@@ -0,0 +1,20 @@
+"""
+Gunicorn Configuration for Disease PredictionIQ
+Splits the CPU budget between workers so their BLAS/OpenMP pools do not compete
+Author: Jay Prakash
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from resource_budget import WORKERS_ENV_VAR, ResourceBudget
+
+
+def post_fork(server, worker):
+    """Apply each worker's share of the budget before it imports the app."""
+    # Every request thread of every worker may run model code concurrently
+    os.environ[WORKERS_ENV_VAR] = str(server.cfg.workers * server.cfg.threads)
+    budget = ResourceBudget.from_env().apply()
+    server.log.info(f"Worker {worker.pid}: {budget}")
@@ -0,0 +1,264 @@
+"""
+Adaptive Hyperparameter Search Module for Disease PredictionIQ
+Budgeted successive halving with adaptive sampling of continuous parameters
+Author: Jay Prakash
+"""
+
+import math
+import time
+import numpy as np
+from sklearn.base import clone
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import StratifiedKFold
+
+
+class LogUniform:
+    """Continuous parameter sampled uniformly on a log scale, e.g. SVM `C`."""
+
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def sample(self, rng):
+        return float(np.exp(rng.uniform(np.log(self.low), np.log(self.high))))
+
+    def perturb(self, value, rng, scale=0.5):
+        """Sample near `value` in log space, clipped to the bounds."""
+        log_value = np.log(value) + rng.normal(0, scale)
+        return float(np.exp(np.clip(log_value, np.log(self.low), np.log(self.high))))
+
+
+class Uniform:
+    """Continuous parameter sampled uniformly between two bounds."""
+
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def sample(self, rng):
+        return float(rng.uniform(self.low, self.high))
+
+    def perturb(self, value, rng, scale=0.1):
+        """Sample near `value`, clipped to the bounds."""
+        width = (self.high - self.low) * scale
+        return float(np.clip(value + rng.normal(0, width), self.low, self.high))
+
+
+class SearchResult:
+    """
+    Outcome of a budgeted search, exposing the same attributes as GridSearchCV
+    (best_params_, best_score_, best_estimator_, cv_results_) plus cost figures.
+
+    cv_results_ is a dict of columns like GridSearchCV's: 'params' and
+    'mean_test_score' always, plus search-specific columns such as
+    successive halving's 'bracket', 'rung' and 'resource'.
+    """
+
+    def __init__(self, best_params, best_score, best_estimator, cv_results,
+                 n_fits, elapsed_time, time_to_best):
+        self.best_params_ = best_params
+        self.best_score_ = best_score
+        self.best_estimator_ = best_estimator
+        self.cv_results_ = cv_results
+        self.n_fits_ = n_fits
+        self.elapsed_time_ = elapsed_time
+        self.time_to_best_ = time_to_best
+
+
+class SuccessiveHalvingSearch:
+    """
+    Budgeted successive-halving search over data size or estimator count.
+
+    Each bracket samples candidates, scores them on a small resource, keeps the
+    best 1/eta and multiplies the resource by eta until the full resource is
+    reached. Brackets repeat until the fit or time budget runs out; a rung the
+    budget interrupts is discarded, so every comparison and every reported
+    score comes from candidates evaluated at the same resource. After the
+    first bracket, part of every new bracket is sampled adaptively around the
+    best full-resource configurations found so far, which refines continuous
+    parameters such as `C` instead of drawing them blindly.
+    """
+
+    def __init__(self, estimator, param_space, resource='n_samples', min_resource=None,
+                 max_resource=None, eta=3, n_candidates=27, max_fits=None, max_time=None,
+                 cv=5, scoring='accuracy', adaptive_fraction=0.5, random_state=42):
+        """
+        Initialize the search.
+
+        Args:
+            estimator: Unfitted sklearn estimator
+            param_space (dict): {param: list of values | LogUniform | Uniform}
+            resource (str): 'n_samples' or an integer estimator parameter such as 'n_estimators'
+            min_resource (int): Resource of the first rung (default: max_resource / eta^2)
+            max_resource (int): Resource of the final rung (default: all training rows)
+            eta (int): Fraction of candidates kept per rung is 1/eta
+            n_candidates (int): Candidates sampled per bracket
+            max_fits (int): Budget on the number of model fits
+            max_time (float): Budget on wall-clock seconds
+            cv (int): Number of stratified cross-validation folds
+            scoring (str): sklearn scoring name
+            adaptive_fraction (float): Share of each later bracket sampled around the best configs
+            random_state (int): Random seed
+        """
+        if max_fits is None and max_time is None:
+            raise ValueError("Set max_fits or max_time to bound the search")
+
+        self.estimator = estimator
+        self.param_space = param_space
+        self.resource = resource
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.eta = eta
+        self.n_candidates = n_candidates
+        self.max_fits = max_fits
+        self.max_time = max_time
+        self.cv = cv
+        self.scoring = scoring
+        self.adaptive_fraction = adaptive_fraction
+        self.random_state = random_state
+
+    def _sample(self, rng):
+        """Draw one configuration from the parameter space."""
+        params = {}
+        for name, space in self.param_space.items():
+            if isinstance(space, (LogUniform, Uniform)):
+                params[name] = space.sample(rng)
+            else:
+                params[name] = space[rng.integers(len(space))]
+        return params
+
+    def _sample_near(self, params, rng):
+        """Draw a configuration close to `params`: continuous values are perturbed."""
+        new_params = dict(params)
+        for name, space in self.param_space.items():
+            if isinstance(space, (LogUniform, Uniform)):
+                new_params[name] = space.perturb(params[name], rng)
+        return new_params
+
+    def _budget_left(self, n_fits, start, needed):
+        if self.max_fits is not None and n_fits + needed > self.max_fits:
+            return False
+        if self.max_time is not None and time.perf_counter() - start > self.max_time:
+            return False
+        return True
+
+    def _bracket_fits(self, n_candidates, n_rungs):
+        """Number of fits one bracket of `n_candidates` needs across all rungs."""
+        fits = 0
+        for _ in range(n_rungs):
+            fits += n_candidates * self.cv
+            n_candidates = max(1, n_candidates // self.eta)
+        return fits
+
+    def _score(self, params, resource, X, y, folds):
+        """Cross-validate one configuration at the given resource level."""
+        scorer = get_scorer(self.scoring)
+        scores = []
+        for train_idx, test_idx in folds:
+            estimator = clone(self.estimator).set_params(**params)
+            if self.resource == 'n_samples':
+                train_idx = train_idx[:resource]
+            else:
+                estimator.set_params(**{self.resource: resource})
+            estimator.fit(X[train_idx], y[train_idx])
+            scores.append(scorer(estimator, X[test_idx], y[test_idx]))
+        return float(np.mean(scores))
+
+    def fit(self, X, y):
+        """
+        Run the search.
+
+        Args:
+            X (array-like): Training features
+            y (array-like): Training target
+
+        Returns:
+            SearchResult: Best configuration, score and cost figures
+        """
+        X = np.asarray(X)
+        y = np.asarray(y)
+        rng = np.random.default_rng(self.random_state)
+
+        # Shared folds; training rows are shuffled once so prefixes are random subsamples
+        folds = []
+        for train_idx, test_idx in StratifiedKFold(n_splits=self.cv).split(X, y):
+            folds.append((rng.permutation(train_idx), test_idx))
+
+        if self.resource == 'n_samples':
+            max_resource = self.max_resource or min(len(train_idx) for train_idx, _ in folds)
+        else:
+            max_resource = self.max_resource or self.estimator.get_params()[self.resource]
+        min_resource = self.min_resource or max(1, max_resource // self.eta ** 2)
+        n_rungs = int(math.floor(math.log(max_resource / min_resource, self.eta))) + 1
+
+        start = time.perf_counter()
+        n_fits = 0
+        cv_results = {'params': [], 'mean_test_score': [], 'bracket': [], 'rung': [],
+                      'resource': []}
+        finalists = []  # (score, params) evaluated at the full resource
+        best_score = -np.inf
+        best_params = None
+        time_to_best = None
+        bracket = 0
+
+        while self._budget_left(n_fits, start, self.cv):
+            # Shrink the bracket so it can reach the full resource within the fit budget
+            n_candidates = self.n_candidates
+            if self.max_fits is not None:
+                while n_candidates > 1 and \
+                        n_fits + self._bracket_fits(n_candidates, n_rungs) > self.max_fits:
+                    n_candidates -= 1
+                if n_fits + self._bracket_fits(n_candidates, n_rungs) > self.max_fits:
+                    break
+
+            n_adaptive = int(n_candidates * self.adaptive_fraction) if finalists else 0
+            top = [params for _, params in sorted(finalists, key=lambda f: -f[0])[:3]]
+            candidates = [self._sample_near(top[i % len(top)], rng) for i in range(n_adaptive)]
+            candidates += [self._sample(rng) for _ in range(n_candidates - n_adaptive)]
+
+            for rung in range(n_rungs):
+                resource = max_resource if rung == n_rungs - 1 else int(min_resource * self.eta ** rung)
+                scored = []
+                for params in candidates:
+                    if not self._budget_left(n_fits, start, self.cv):
+                        break
+                    score = self._score(params, resource, X, y, folds)
+                    n_fits += self.cv
+                    scored.append((score, params, time.perf_counter() - start))
+
+                # An interrupted rung is dropped: its survivors would be chosen from a partial
+                # field, and the bracket stops at its last complete rung
+                if len(scored) < len(candidates):
+                    break
+
+                for score, params, elapsed in scored:
+                    for column, value in (('params', params), ('mean_test_score', score),
+                                          ('bracket', bracket), ('rung', rung),
+                                          ('resource', resource)):
+                        cv_results[column].append(value)
+                    if resource == max_resource:
+                        finalists.append((score, params))
+                        if score > best_score:
+                            best_score = score
+                            best_params = params
+                            time_to_best = elapsed
+
+                scored.sort(key=lambda s: -s[0])
+                candidates = [params for _, params, _ in scored[:max(1, len(scored) // self.eta)]]
+            bracket += 1
+
+        if best_params is None:
+            raise RuntimeError("Budget too small to evaluate any configuration at the full resource")
+
+        if self.resource != 'n_samples':
+            best_params = {**best_params, self.resource: max_resource}
+        best_estimator = clone(self.estimator).set_params(**best_params)
+        best_estimator.fit(X, y)
+        n_fits += 1
+
+        # One row per (candidate, rung) evaluation, as arrays like GridSearchCV's columns
+        for column in ('mean_test_score', 'bracket', 'rung', 'resource'):
+            cv_results[column] = np.asarray(cv_results[column])
+
+        return SearchResult(best_params, best_score, best_estimator, cv_results,
+                            n_fits, time.perf_counter() - start, time_to_best)
@@ -0,0 +1,231 @@
+"""
+Chart Data Module for Disease PredictionIQ
+Builds the compact chart data the web UI renders client-side, and serves it with strong ETags
+Author: Jay Prakash
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from evaluation import decimate_curve, evaluate_scores, model_scores
+
+CHART_DATA_FILENAME = 'chart_data.json'
+CHART_DATA_VERSION = 1
+
+# Sections that can be fetched on their own from /api/chart-data/<section>
+CHART_SECTIONS = ('metrics', 'models', 'feature_distributions')
+
+METRIC_COLUMNS = ['name', 'category', 'accuracy', 'precision', 'recall', 'f1_score', 'roc_auc',
+                  'is_best']
+
+# Points per ROC curve in the browser; a 400 px wide chart cannot show more
+MAX_CHART_POINTS = 100
+
+# Columns with at most this many levels are charted per level, wider ones as histograms
+MAX_LEVELS = 10
+
+
+def _rounded(values, decimals=4):
+    return [round(float(v), decimals) for v in values]
+
+
+def feature_distributions(df, target_column='heart_disease', bins=20):
+    """
+    Per-class counts of every feature, as levels or histogram bins.
+
+    Args:
+        df (pd.DataFrame): Dataset including the target column
+        target_column (str): Name of the target column
+        bins (int): Histogram bins for wide columns
+
+    Returns:
+        dict: {feature: {'kind', 'levels' or 'edges', 'counts': {class: [...]}}}
+    """
+    target = df[target_column].to_numpy()
+    classes = np.unique(target)
+    distributions = {}
+    for feature in df.columns.drop(target_column):
+        values = df[feature].to_numpy()
+        levels = np.unique(values[~pd.isna(values)])
+        if len(levels) <= MAX_LEVELS:
+            distributions[feature] = {
+                'kind': 'levels',
+                'levels': _rounded(levels),
+                'counts': {str(c): np.bincount(np.searchsorted(levels, values[target == c]),
+                                               minlength=len(levels)).tolist()
+                           for c in classes}
+            }
+        else:
+            edges = np.histogram_bin_edges(values, bins=bins)
+            distributions[feature] = {
+                'kind': 'histogram',
+                'edges': _rounded(edges),
+                'counts': {str(c): np.histogram(values[target == c], bins=edges)[0].tolist()
+                           for c in classes}
+            }
+    return distributions
+
+
+def model_chart(roc_curve, confusion_matrix, roc_auc, max_points=MAX_CHART_POINTS):
+    """
+    Chart entry of one model: a decimated ROC curve and its confusion matrix.
+
+    Args:
+        roc_curve (dict): {'fpr', 'tpr'} (thresholds are dropped; the first is inf,
+            which JSON cannot represent)
+        confusion_matrix (list): [[tn, fp], [fn, tp]]
+        roc_auc (float): AUC of the full curve
+        max_points (int): Maximum ROC points kept
+
+    Returns:
+        dict: {'roc': {'fpr', 'tpr', 'auc'}, 'confusion_matrix'}
+    """
+    fpr, tpr = np.asarray(roc_curve['fpr']), np.asarray(roc_curve['tpr'])
+    keep = decimate_curve(fpr, tpr, max_points)
+    return {
+        'roc': {'fpr': _rounded(fpr[keep]), 'tpr': _rounded(tpr[keep]),
+                'auc': round(float(roc_auc), 4)},
+        'confusion_matrix': [[int(c) for c in row] for row in confusion_matrix]
+    }
+
+
+def build_chart_data(comparison, results, df, target_column='heart_disease',
+                     max_points=MAX_CHART_POINTS):
+    """
+    Assemble the chart data document written at training time.
+
+    Args:
+        comparison (list): Entries of the models comparison (see model_benchmarking)
+        results (pd.DataFrame): evaluate_models output with 'ROC Curve' and
+            'Confusion Matrix' columns (may cover a subset of the compared models)
+        df (pd.DataFrame): Full dataset
+        target_column (str): Name of the target column
+        max_points (int): Maximum ROC points per model
+
+    Returns:
+        dict: Chart data document
+    """
+    ranked = sorted(comparison, key=lambda m: m['roc_auc'], reverse=True)
+    charted = set(results['Model'])
+    return {
+        'version': CHART_DATA_VERSION,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'metrics': {
+            'columns': METRIC_COLUMNS,
+            'rows': [[entry.get(column) for column in METRIC_COLUMNS] for entry in ranked]
+        },
+        'models': {row['Model']: model_chart(row['ROC Curve'], row['Confusion Matrix'],
+                                             row['ROC-AUC'], max_points)
+                   for _, row in results.iterrows()},
+        # Compared models whose predictions were not available to chart
+        'models_without_curves': [entry['name'] for entry in ranked
+                                  if entry['name'] not in charted],
+        'feature_distributions': feature_distributions(df, target_column)
+    }
+
+
+def write_chart_data(chart_data, models_dir='models'):
+    """
+    Write chart_data.json atomically in compact form.
+
+    Args:
+        chart_data (dict): Output of build_chart_data
+        models_dir (str): Directory of the deployment artifacts
+
+    Returns:
+        str: Path of the written file
+    """
+    path = os.path.join(models_dir, CHART_DATA_FILENAME)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(chart_data, f, separators=(',', ':'), allow_nan=False)
+    os.replace(path + '.tmp', path)
+    print(f"✓ Saved: {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+    return path
+
+
+def load_chart_payloads(models_dir='models'):
+    """
+    Serialize the chart data once for serving, with a strong ETag per payload.
+
+    Args:
+        models_dir (str): Directory holding chart_data.json
+
+    Returns:
+        dict: {'all' or section name: (JSON bytes, ETag)}, empty if the file is missing
+    """
+    path = os.path.join(models_dir, CHART_DATA_FILENAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    chart_data = json.loads(raw)
+    payloads = {'all': raw}
+    for section in CHART_SECTIONS:
+        payload = {'version': chart_data['version'], 'generated_at': chart_data['generated_at'],
+                   section: chart_data[section]}
+        if section == 'models':
+            payload['models_without_curves'] = chart_data.get('models_without_curves', [])
+        payloads[section] = json.dumps(payload, separators=(',', ':')).encode()
+    # Content hashes: identical bytes always get the same tag, on every worker
+    return {name: (body, hashlib.sha256(body).hexdigest()[:32])
+            for name, body in payloads.items()}
+
+
+def build_from_artifacts(data_path, models_dir='models', target_column='heart_disease'):
+    """
+    Rebuild chart data for already exported artifacts without retraining.
+
+    The metric table comes from model_metadata.json; the ROC curve and
+    confusion matrix are computed for the exported model on its test split.
+    Only the exported model is shipped, so every other compared model is
+    listed under models_without_curves; a pipeline run charts them all.
+
+    Args:
+        data_path (str): Path to the dataset CSV
+        models_dir (str): Directory of the deployment artifacts
+        target_column (str): Name of the target column
+
+    Returns:
+        dict: Chart data document
+    """
+    from data_preprocessing import preprocess_data
+
+    with open(os.path.join(models_dir, 'model_metadata.json'), 'r') as f:
+        metadata = json.load(f)
+    with open(os.path.join(models_dir, 'best_heart_disease_model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+
+    df = pd.read_csv(data_path)
+    _, X_test, _, y_test, _, _ = preprocess_data(df, target_column)
+    summary = evaluate_scores(y_test, model_scores(model, X_test.values),
+                              y_pred=model.predict(X_test.values), max_curve_points=1000)
+    results = pd.DataFrame([{'Model': metadata['model_name'], 'ROC Curve': summary['roc_curve'],
+                             'Confusion Matrix': summary['confusion_matrix'],
+                             'ROC-AUC': summary['roc_auc']}])
+    return build_chart_data(metadata.get('models_comparison', []), results, df, target_column)
+
+
+def main(argv=None):
+    """Command-line entry point: regenerate chart_data.json from exported artifacts."""
+    parser = argparse.ArgumentParser(description='Build chart data for the web UI')
+    parser.add_argument('--data', default='heart_disease_dataset.csv')
+    parser.add_argument('--models-dir', default='models')
+    parser.add_argument('--target', default='heart_disease')
+    args = parser.parse_args(argv)
+
+    write_chart_data(build_from_artifacts(args.data, args.models_dir, args.target),
+                     args.models_dir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
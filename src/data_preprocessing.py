@@ -4,27 +4,219 @@ Handles data loading, cleaning, and preparation for modeling
 Author: Jay Prakash
 """
 
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 
+from data_profiling import MomentAccumulator
 
-def load_data(filepath):
+# Compact dtypes for the dataset columns: small categorical codes fit in int8,
+# clinical measurements in int16, and the one fractional column in float32
+DATASET_SCHEMA = {
+    'age': 'int16',
+    'sex': 'int8',
+    'chest_pain_type': 'int8',
+    'resting_blood_pressure': 'int16',
+    'cholesterol': 'int16',
+    'fasting_blood_sugar': 'int8',
+    'resting_ecg': 'int8',
+    'max_heart_rate': 'int16',
+    'exercise_induced_angina': 'int8',
+    'st_depression': 'float32',
+    'st_slope': 'int8',
+    'num_major_vessels': 'int8',
+    'thalassemia': 'int8',
+    'heart_disease': 'int8'
+}
+
+
+def _file_sha256(filepath, block_size=1 << 20):
+    """SHA-256 of a file's contents, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_dir(filepath):
+    """Binary column cache directory kept next to the CSV."""
+    directory, name = os.path.split(os.path.abspath(filepath))
+    return os.path.join(directory, f'.{name}.cache')
+
+
+def _read_cache_manifest(filepath):
+    """
+    Return the cache manifest if it still matches the CSV, else None.
+    
+    Size and mtime are checked first. If either changed, the contents are
+    hashed, so a file that was only touched keeps its cache.
+    """
+    manifest_path = os.path.join(_cache_dir(filepath), 'manifest.json')
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if 'generation' not in manifest:
+        return None  # columns written in place by an older version; rebuild
+    
+    stat = os.stat(filepath)
+    if stat.st_size == manifest['source_size'] and stat.st_mtime_ns == manifest['source_mtime_ns']:
+        return manifest
+    if stat.st_size != manifest['source_size'] or _file_sha256(filepath) != manifest['source_sha256']:
+        return None
+    
+    manifest['source_mtime_ns'] = stat.st_mtime_ns
+    try:
+        _write_json_atomic(manifest, manifest_path)
+    except OSError:
+        pass  # read-only cache: the hash is checked again next time
+    return manifest
+
+
+def _write_json_atomic(obj, path):
+    with open(path + '.tmp', 'w') as f:
+        json.dump(obj, f, indent=4)
+    os.replace(path + '.tmp', path)
+
+
+def _build_cache(filepath, df, parse_time):
+    """
+    Write each column of a parsed CSV as a .npy file plus a manifest.
+    
+    Every build writes a new generation directory and then switches the
+    manifest to it. Files that earlier loads still have memory-mapped are
+    never overwritten, only unlinked once the new generation is live.
+    """
+    if any(df[column].dtype == object for column in df.columns):
+        return  # text columns would need pickling; keep parsing those files
+    
+    cache_dir = _cache_dir(filepath)
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest_path = os.path.join(cache_dir, 'manifest.json')
+    generation_dir = tempfile.mkdtemp(prefix='gen-', dir=cache_dir)
+    
+    try:
+        stat = os.stat(filepath)
+        for i, column in enumerate(df.columns):
+            np.save(os.path.join(generation_dir, f'{i:03d}.npy'), df[column].to_numpy())
+        
+        # The manifest is switched last, so a cache is only used once complete
+        _write_json_atomic({
+            'source_size': stat.st_size,
+            'source_mtime_ns': stat.st_mtime_ns,
+            'source_sha256': _file_sha256(filepath),
+            'generation': os.path.basename(generation_dir),
+            'columns': list(df.columns),
+            'n_rows': len(df),
+            'parse_time': parse_time
+        }, manifest_path)
+    except OSError:
+        shutil.rmtree(generation_dir, ignore_errors=True)
+        raise
+    
+    for name in os.listdir(cache_dir):
+        if name in ('manifest.json', os.path.basename(generation_dir)):
+            continue
+        path = os.path.join(cache_dir, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def load_data(filepath, compact=False, columns=None, use_cache=True, mmap=True):
     """
     Load the heart disease dataset from CSV file.
     
+    Parsed columns are kept in a binary cache next to the CSV (one .npy per
+    column), keyed on file size, mtime and content hash. Later loads read
+    only the requested columns from the cache and rebuild it when the CSV changes.
+    
     Args:
         filepath (str): Path to the CSV file
+        compact (bool): Use the DATASET_SCHEMA dtypes instead of int64/float64
+        columns (list): Columns to load (default: all)
+        use_cache (bool): Read and maintain the binary column cache; an
+            unwritable cache location falls back to parsing the CSV
+        mmap (bool): Memory-map cached columns instead of reading them up front
         
     Returns:
         pd.DataFrame: Loaded dataset
     """
-    df = pd.read_csv(filepath)
+    dtype = DATASET_SCHEMA if compact else None
+    manifest = _read_cache_manifest(filepath) if use_cache else None
+    
+    if manifest is not None:
+        start = time.perf_counter()
+        selected = columns or manifest['columns']
+        generation_dir = os.path.join(_cache_dir(filepath), manifest['generation'])
+        data = {}
+        try:
+            for column in selected:
+                index = manifest['columns'].index(column)
+                # Copy-on-write maps: pages load on access and the frame stays writable
+                data[column] = np.asarray(np.load(os.path.join(generation_dir, f'{index:03d}.npy'),
+                                                  mmap_mode='c' if mmap else None))
+        except OSError:
+            manifest = None  # replaced by a concurrent rebuild; parse the CSV instead
+    
+    if manifest is not None:
+        df = pd.DataFrame(data, copy=False)
+        if compact:
+            df = df.astype({c: t for c, t in DATASET_SCHEMA.items() if c in df.columns})
+        load_time = time.perf_counter() - start
+        print(f"Dataset loaded successfully. Shape: {df.shape}")
+        print(f"Loaded from binary cache in {load_time:.4f}s vs {manifest['parse_time']:.4f}s "
+              f"CSV parse ({manifest['parse_time'] / max(load_time, 1e-9):.1f}x)")
+        return df
+    
+    start = time.perf_counter()
+    if use_cache:
+        # Cache every column with default dtypes so any later projection or dtype can be served
+        df = pd.read_csv(filepath)
+        parse_time = time.perf_counter() - start
+        try:
+            _build_cache(filepath, df, parse_time)
+        except OSError as e:
+            print(f"Binary cache not written ({e}); the CSV will be parsed next time")
+        if columns is not None:
+            df = df[columns]
+        if compact:
+            df = df.astype({c: t for c, t in DATASET_SCHEMA.items() if c in df.columns})
+    else:
+        df = pd.read_csv(filepath, dtype=dtype, usecols=columns)
+        parse_time = time.perf_counter() - start
     print(f"Dataset loaded successfully. Shape: {df.shape}")
+    print(f"Parsed CSV in {parse_time:.4f}s")
     return df
 
 
+def iter_data_chunks(filepath, chunksize=1_000_000):
+    """
+    Read the dataset in chunks with the compact schema, for files larger than RAM.
+    
+    Args:
+        filepath (str): Path to the CSV file
+        chunksize (int): Rows per chunk
+        
+    Yields:
+        pd.DataFrame: Next chunk of rows
+    """
+    yield from pd.read_csv(filepath, dtype=DATASET_SCHEMA, chunksize=chunksize)
+
+
 def check_data_quality(df):
     """
     Perform initial data quality checks.
@@ -121,6 +313,97 @@ def preprocess_data(df, target_column='heart_disease', test_size=0.2, random_sta
     return X_train_scaled, X_test_scaled, y_train, y_test, feature_names, scaler
 
 
+def preprocess_arrays(df, target_column='heart_disease', test_size=0.2, random_state=42):
+    """
+    Array-native preprocessing: contiguous float32 features scaled in place.
+    
+    Produces the same stratified split and scaling as preprocess_data, but
+    each split is gathered column by column straight into a preallocated
+    C-contiguous float32 matrix and scaled in place, so the training matrix
+    is never copied into float64 or re-wrapped in a DataFrame.
+    
+    Args:
+        df (pd.DataFrame): Input dataset
+        target_column (str): Name of target column
+        test_size (float): Proportion of data for testing
+        random_state (int): Random seed for reproducibility
+        
+    Returns:
+        dict: X_train, X_test (float32), y_train, y_test (int8), train_index,
+              test_index (row positions in df), feature_names and the fitted scaler
+    """
+    feature_names = [c for c in df.columns if c != target_column]
+    y = df[target_column].to_numpy(dtype=np.int8)
+    
+    # Same split as train_test_split on the frame: it only depends on y and the seed
+    train_index, test_index = train_test_split(
+        np.arange(len(df)), test_size=test_size, random_state=random_state, stratify=y)
+    
+    X_train = np.empty((len(train_index), len(feature_names)), dtype=np.float32)
+    X_test = np.empty((len(test_index), len(feature_names)), dtype=np.float32)
+    for j, column in enumerate(feature_names):
+        values = df[column].to_numpy()
+        X_train[:, j] = values[train_index]
+        X_test[:, j] = values[test_index]
+    
+    # fit() would upcast the whole matrix to float64; partial_fit over row blocks does not
+    scaler = StandardScaler(copy=False)
+    for start in range(0, len(X_train), 65536):
+        scaler.partial_fit(X_train[start:start + 65536])
+    scaler.transform(X_train)
+    scaler.transform(X_test)
+    # Scale in place and keep the scaler copying for later callers
+    scaler.copy = True
+    
+    print(f"\nFeatures ({len(feature_names)}): {feature_names}")
+    print(f"Training set: {X_train.shape} float32 | Testing set: {X_test.shape} float32")
+    
+    return {
+        'X_train': X_train,
+        'X_test': X_test,
+        'y_train': y[train_index],
+        'y_test': y[test_index],
+        'train_index': train_index,
+        'test_index': test_index,
+        'feature_names': feature_names,
+        'scaler': scaler
+    }
+
+
+def compare_preprocessing_memory(df, target_column='heart_disease', test_size=0.2,
+                                 random_state=42):
+    """
+    Compare peak memory of preprocess_data and preprocess_arrays with tracemalloc.
+    
+    Args:
+        df (pd.DataFrame): Input dataset
+        target_column (str): Name of target column
+        test_size (float): Proportion of data for testing
+        random_state (int): Random seed for reproducibility
+        
+    Returns:
+        dict: Peak traced bytes of each path and the input frame size
+    """
+    import tracemalloc
+    
+    peaks = {}
+    for name, func in (('preprocess_data', preprocess_data),
+                       ('preprocess_arrays', preprocess_arrays)):
+        tracemalloc.start()
+        result = func(df, target_column, test_size, random_state)
+        peaks[name] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del result
+    
+    input_bytes = int(df.memory_usage(index=True).sum())
+    print("\n=== Preprocessing Peak Memory ===")
+    print(f"Input frame:       {input_bytes / 1024**2:10.1f} MB")
+    for name, peak in peaks.items():
+        print(f"{name + ':':18s} {peak / 1024**2:10.1f} MB peak ({peak / input_bytes:.2f}x input)")
+    print(f"Reduction: {peaks['preprocess_data'] / peaks['preprocess_arrays']:.1f}x")
+    return {'input_bytes': input_bytes, **peaks}
+
+
 def get_feature_correlations(df, target_column='heart_disease'):
     """
     Calculate correlations between features and target variable.
@@ -132,7 +415,104 @@ def get_feature_correlations(df, target_column='heart_disease'):
     Returns:
         pd.Series: Correlation values sorted by absolute value
     """
-    correlations = df.corr()[target_column].drop(target_column).sort_values(ascending=False)
+    # One pass of target co-moments instead of the full feature-by-feature matrix
+    numeric_columns = df.select_dtypes(include='number').columns
+    correlations = MomentAccumulator(numeric_columns, target_column).update(df).correlations()
     print("\n=== Feature Correlations with Target ===")
     print(correlations)
     return correlations
+
+
+def _split_masks(n_rows, rng, test_size):
+    """Draw the test-set mask for the next `n_rows` rows from a seeded stream."""
+    return rng.random(n_rows) < test_size
+
+
+def preprocess_to_memmap(filepath, output_dir, target_column='heart_disease', test_size=0.2,
+                         random_state=42, chunksize=1_000_000):
+    """
+    Split and scale a dataset that does not fit in memory into float32 .npy memmaps.
+    
+    Two passes over the CSV:
+    1. Count train/test rows and fit the scaler on training rows with partial_fit
+    2. Scale each chunk and write it into preallocated memory-mapped arrays
+    
+    Each row goes to the test set with probability `test_size`, drawn from one
+    seeded random stream in file order, so the split does not depend on the
+    chunk size and both passes see the same split. On large files this keeps
+    the class balance of a stratified split to within sampling noise.
+    
+    Args:
+        filepath (str): Path to the CSV file
+        output_dir (str): Directory for X_train.npy, X_test.npy, y_train.npy, y_test.npy
+        target_column (str): Name of target column
+        test_size (float): Proportion of data for testing
+        random_state (int): Random seed for the split
+        chunksize (int): Rows read per chunk
+        
+    Returns:
+        tuple: (X_train, X_test, y_train, y_test, feature_names, scaler) with
+               read-only memory-mapped arrays
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Pass 1: split sizes and incremental scaler fit on training rows
+    scaler = StandardScaler()
+    rng = np.random.default_rng(random_state)
+    n_train = n_test = 0
+    feature_names = None
+    for chunk in iter_data_chunks(filepath, chunksize):
+        if feature_names is None:
+            feature_names = [c for c in chunk.columns if c != target_column]
+        test_mask = _split_masks(len(chunk), rng, test_size)
+        X = chunk[feature_names].to_numpy(dtype=np.float64)
+        if (~test_mask).any():
+            scaler.partial_fit(X[~test_mask])
+        n_test += int(test_mask.sum())
+        n_train += len(chunk) - int(test_mask.sum())
+    
+    print(f"\nFeatures ({len(feature_names)}): {feature_names}")
+    print(f"Data split: {n_train} training rows, {n_test} testing rows")
+    
+    paths = {name: os.path.join(output_dir, f'{name}.npy')
+             for name in ('X_train', 'X_test', 'y_train', 'y_test')}
+    arrays = {
+        'X_train': np.lib.format.open_memmap(paths['X_train'], mode='w+', dtype=np.float32,
+                                             shape=(n_train, len(feature_names))),
+        'X_test': np.lib.format.open_memmap(paths['X_test'], mode='w+', dtype=np.float32,
+                                            shape=(n_test, len(feature_names))),
+        'y_train': np.lib.format.open_memmap(paths['y_train'], mode='w+', dtype=np.int8,
+                                             shape=(n_train,)),
+        'y_test': np.lib.format.open_memmap(paths['y_test'], mode='w+', dtype=np.int8,
+                                            shape=(n_test,))
+    }
+    
+    # Pass 2: replay the same split stream, scale in float32 and write in place
+    mean = scaler.mean_.astype(np.float32)
+    scale = scaler.scale_.astype(np.float32)
+    rng = np.random.default_rng(random_state)
+    train_pos = test_pos = 0
+    for chunk in iter_data_chunks(filepath, chunksize):
+        test_mask = _split_masks(len(chunk), rng, test_size)
+        X = chunk[feature_names].to_numpy(dtype=np.float32)
+        X -= mean
+        X /= scale
+        y = chunk[target_column].to_numpy(dtype=np.int8)
+        
+        n_chunk_test = int(test_mask.sum())
+        n_chunk_train = len(chunk) - n_chunk_test
+        arrays['X_train'][train_pos:train_pos + n_chunk_train] = X[~test_mask]
+        arrays['y_train'][train_pos:train_pos + n_chunk_train] = y[~test_mask]
+        arrays['X_test'][test_pos:test_pos + n_chunk_test] = X[test_mask]
+        arrays['y_test'][test_pos:test_pos + n_chunk_test] = y[test_mask]
+        train_pos += n_chunk_train
+        test_pos += n_chunk_test
+    
+    for array in arrays.values():
+        array.flush()
+    del arrays
+    print(f"Scaled float32 arrays written to {output_dir}")
+    
+    loaded = {name: np.load(path, mmap_mode='r') for name, path in paths.items()}
+    return (loaded['X_train'], loaded['X_test'], loaded['y_train'], loaded['y_test'],
+            feature_names, scaler)
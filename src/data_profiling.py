@@ -0,0 +1,615 @@
+"""
+Data Profiling Module for Disease PredictionIQ
+Single-pass streaming data-quality profile built from mergeable sketches
+Author: Jay Prakash
+"""
+
+import io
+import os
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from executors import budget_options, get_executor
+from resource_budget import ResourceBudget
+
+
+def _hash_values(values):
+    """Deterministic 64-bit hashes of a 1-D array."""
+    return pd.util.hash_array(np.asarray(values))
+
+
+def _normalize_numeric(chunk):
+    """
+    Cast numeric columns to float64 so equal values hash alike in every chunk.
+
+    A chunk whose column has a missing value parses as float while another
+    parses as int; without this the same value would hash differently.
+    """
+    numeric = chunk.select_dtypes(include='number').columns
+    return chunk.astype({column: np.float64 for column in numeric})
+
+
+class HyperLogLog:
+    """
+    Approximate distinct counter over 64-bit hashes.
+
+    The first `precision` bits of a hash select a register, which keeps the
+    longest run of leading zeros seen in the remaining bits. Two sketches
+    merge by taking the register-wise maximum.
+    """
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) == 0:
+            return
+        n_rest = 64 - self.precision
+        index = (hashes >> np.uint64(n_rest)).astype(np.int64)
+        rest = hashes & np.uint64((1 << n_rest) - 1)
+        # Rank = leading zeros in the remaining bits + 1
+        _, exponent = np.frexp(rest.astype(np.float64))
+        rank = (n_rest - exponent + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * m and zeros:
+            return float(m * np.log(m / zeros))  # linear counting for small ranges
+        return float(raw)
+
+
+class DistinctCounter:
+    """
+    Distinct counter that is exact while small and falls back to HyperLogLog.
+
+    Unique hashes are kept exactly up to `exact_limit` values; beyond that
+    only the HyperLogLog sketch is kept.
+    """
+
+    def __init__(self, exact_limit=10000, precision=14):
+        self.exact_limit = exact_limit
+        self.exact = np.empty(0, dtype=np.uint64)
+        self.hll = HyperLogLog(precision)
+
+    def add_hashes(self, hashes):
+        self.hll.add_hashes(hashes)
+        if self.exact is not None:
+            self.exact = np.union1d(self.exact, hashes)
+            if len(self.exact) > self.exact_limit:
+                self.exact = None
+
+    def merge(self, other):
+        self.hll.merge(other.hll)
+        if self.exact is not None and other.exact is not None:
+            self.exact = np.union1d(self.exact, other.exact)
+            if len(self.exact) > self.exact_limit:
+                self.exact = None
+        else:
+            self.exact = None
+        return self
+
+    @property
+    def is_exact(self):
+        return self.exact is not None
+
+    def estimate(self):
+        if self.exact is not None:
+            return len(self.exact)
+        return int(round(self.hll.estimate()))
+
+
+class QuantileSketch:
+    """
+    KLL-style mergeable quantile sketch.
+
+    Values enter level 0 with weight 1. When a level holds more than `k`
+    items it is sorted and every other item (from a random offset) is
+    promoted to the next level with double weight. Up to `k` values the
+    sketch is exact; beyond that rank error shrinks with larger `k`.
+    """
+
+    def __init__(self, k=4096, random_state=0):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.n = 0
+        self.rng = np.random.default_rng(random_state)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                # An odd leftover stays at this level so total weight is preserved
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                promoted = pairs[self.rng.integers(2)::2]
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = keep
+            level += 1
+
+    def merge(self, other):
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantiles(self, qs):
+        """
+        Estimate quantiles with the same linear interpolation as pandas.
+
+        Args:
+            qs (list): Quantiles in [0, 1]
+
+        Returns:
+            np.ndarray: One estimate per quantile (NaN if the sketch is empty)
+        """
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level)
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values = values[order]
+        # Highest 0-based rank covered by each item
+        last_rank = np.cumsum(weights[order]) - 1
+
+        estimates = []
+        total = last_rank[-1]
+        for q in qs:
+            position = q * total
+            lower = values[np.searchsorted(last_rank, np.floor(position))]
+            upper = values[np.searchsorted(last_rank, np.ceil(position))]
+            estimates.append(lower + (upper - lower) * (position - np.floor(position)))
+        return np.array(estimates)
+
+
+def _merge_moments(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+    """Chan et al. pairwise merge of counts, means and sums of squared deviations."""
+    n = n_a + n_b
+    safe_n = np.where(n > 0, n, 1)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / safe_n
+    m2 = m2_a + m2_b + delta ** 2 * n_a * n_b / safe_n
+    return n, mean, m2
+
+
+class MomentAccumulator:
+    """
+    Mergeable running mean, variance and target covariance (Welford/Chan).
+
+    Each chunk is reduced to per-column counts, means and sums of squared
+    deviations, which are merged into the running totals with Chan's
+    parallel update, so chunks and workers combine in any order without
+    the precision loss of raw sums of squares. Missing values are skipped
+    per column; with a target column, feature-target co-moments use
+    pairwise-complete rows like df.corr().
+    """
+
+    def __init__(self, columns, target_column=None):
+        """
+        Initialize empty accumulators.
+
+        Args:
+            columns (list): Numeric columns to summarize
+            target_column (str): Column to correlate every other column with
+        """
+        self.columns = list(columns)
+        self.target_column = target_column
+        p = len(self.columns)
+        self.n = np.zeros(p)
+        self.mean = np.zeros(p)
+        self.m2 = np.zeros(p)
+        self.minimum = np.full(p, np.nan)
+        self.maximum = np.full(p, np.nan)
+        # Pairwise-complete (feature, target) moments
+        self.pair_n = np.zeros(p)
+        self.pair_mean_x = np.zeros(p)
+        self.pair_mean_y = np.zeros(p)
+        self.pair_m2_x = np.zeros(p)
+        self.pair_m2_y = np.zeros(p)
+        self.pair_c = np.zeros(p)
+
+    def update(self, chunk):
+        """
+        Add a chunk of rows.
+
+        Args:
+            chunk (pd.DataFrame): Rows containing `columns`
+
+        Returns:
+            MomentAccumulator: self
+        """
+        X = chunk[self.columns].to_numpy(dtype=np.float64)
+        present = ~np.isnan(X)
+        n_b = present.sum(axis=0).astype(np.float64)
+        safe_n = np.where(n_b > 0, n_b, 1)
+        mean_b = np.where(present, X, 0.0).sum(axis=0) / safe_n
+        deviation = np.where(present, X - mean_b, 0.0)
+        m2_b = (deviation ** 2).sum(axis=0)
+        self.n, self.mean, self.m2 = _merge_moments(self.n, self.mean, self.m2, n_b, mean_b, m2_b)
+        if len(X):
+            # fmin/fmax skip NaN; an all-NaN column stays NaN
+            self.minimum = np.fmin(self.minimum, np.fmin.reduce(X, axis=0))
+            self.maximum = np.fmax(self.maximum, np.fmax.reduce(X, axis=0))
+
+        if self.target_column is not None:
+            y = chunk[self.target_column].to_numpy(dtype=np.float64)[:, None]
+            pair = present & ~np.isnan(y)
+            pair_n_b = pair.sum(axis=0).astype(np.float64)
+            safe_n = np.where(pair_n_b > 0, pair_n_b, 1)
+            mean_x = np.where(pair, X, 0.0).sum(axis=0) / safe_n
+            mean_y = np.where(pair, y, 0.0).sum(axis=0) / safe_n
+            dx = np.where(pair, X - mean_x, 0.0)
+            dy = np.where(pair, y - mean_y, 0.0)
+            self._merge_pairs(pair_n_b, mean_x, mean_y, (dx ** 2).sum(axis=0),
+                              (dy ** 2).sum(axis=0), (dx * dy).sum(axis=0))
+        return self
+
+    def _merge_pairs(self, n_b, mean_x_b, mean_y_b, m2_x_b, m2_y_b, c_b):
+        n_a = self.pair_n
+        n = n_a + n_b
+        safe_n = np.where(n > 0, n, 1)
+        self.pair_c = self.pair_c + c_b + \
+            (mean_x_b - self.pair_mean_x) * (mean_y_b - self.pair_mean_y) * n_a * n_b / safe_n
+        _, self.pair_mean_x, self.pair_m2_x = _merge_moments(
+            n_a, self.pair_mean_x, self.pair_m2_x, n_b, mean_x_b, m2_x_b)
+        self.pair_n, self.pair_mean_y, self.pair_m2_y = _merge_moments(
+            n_a, self.pair_mean_y, self.pair_m2_y, n_b, mean_y_b, m2_y_b)
+
+    def merge(self, other):
+        """
+        Combine another accumulator over the same columns into this one.
+
+        Args:
+            other (MomentAccumulator): Accumulator of other rows
+
+        Returns:
+            MomentAccumulator: self
+        """
+        self.n, self.mean, self.m2 = _merge_moments(self.n, self.mean, self.m2,
+                                                    other.n, other.mean, other.m2)
+        self.minimum = np.fmin(self.minimum, other.minimum)
+        self.maximum = np.fmax(self.maximum, other.maximum)
+        if self.target_column is not None:
+            self._merge_pairs(other.pair_n, other.pair_mean_x, other.pair_mean_y,
+                              other.pair_m2_x, other.pair_m2_y, other.pair_c)
+        return self
+
+    def variance(self, ddof=0):
+        return self.m2 / np.maximum(self.n - ddof, 1)
+
+    def describe(self):
+        """
+        Count, mean, std (ddof=1), min and max per column, as in df.describe().
+
+        Returns:
+            pd.DataFrame: One column per summarized column
+        """
+        std = np.where(self.n > 1, np.sqrt(self.variance(ddof=1)), np.nan)
+        return pd.DataFrame({'count': self.n, 'mean': self.mean, 'std': std,
+                             'min': self.minimum, 'max': self.maximum},
+                            index=self.columns).T
+
+    def correlations(self):
+        """
+        Pearson correlation of every other column with the target column.
+
+        Returns:
+            pd.Series: Correlations sorted in descending order
+        """
+        if self.target_column is None:
+            raise ValueError("MomentAccumulator was created without a target_column")
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = self.pair_c / np.sqrt(self.pair_m2_x * self.pair_m2_y)
+        correlations = pd.Series(corr, index=self.columns, name=self.target_column)
+        return correlations.drop(self.target_column, errors='ignore').sort_values(ascending=False)
+
+    def to_scaler(self, columns=None):
+        """
+        Build a fitted StandardScaler from the accumulated statistics.
+
+        Args:
+            columns (list): Feature columns in model input order (default: all
+                columns except the target)
+
+        Returns:
+            StandardScaler: Scaler equivalent to fitting on the same rows
+        """
+        if columns is None:
+            columns = [c for c in self.columns if c != self.target_column]
+        index = [self.columns.index(c) for c in columns]
+
+        scaler = StandardScaler()
+        scaler.mean_ = self.mean[index].copy()
+        scaler.var_ = self.variance()[index]
+        scale = np.sqrt(scaler.var_)
+        scale[scale < 10 * np.finfo(scale.dtype).eps] = 1.0  # constant features
+        scaler.scale_ = scale
+        n_seen = self.n[index].astype(np.int64)
+        scaler.n_samples_seen_ = int(n_seen[0]) if (n_seen == n_seen[0]).all() else n_seen
+        scaler.n_features_in_ = len(columns)
+        scaler.feature_names_in_ = np.asarray(columns, dtype=object)
+        return scaler
+
+
+class DataProfile:
+    """
+    Mergeable data-quality profile built in one pass over chunks.
+
+    Tracks row count, per-column null counts, non-null counts, min/max,
+    distinct counts and quantiles, plus duplicate rows from row hashes.
+    Duplicates are exact (sorted unique row hashes) unless
+    `exact_duplicates=False`, which uses a HyperLogLog sketch instead.
+    Profiles of different chunks or workers combine with merge().
+    """
+
+    def __init__(self, quantile_k=4096, exact_distinct_limit=10000, hll_precision=14,
+                 exact_duplicates=True, target_column=None, random_state=0):
+        """
+        Initialize an empty profile.
+
+        Args:
+            quantile_k (int): Items per level of each quantile sketch
+            exact_distinct_limit (int): Distinct values counted exactly per column
+            hll_precision (int): HyperLogLog register bits
+            exact_duplicates (bool): Keep all row hashes for an exact duplicate count
+            target_column (str): Column whose correlations with the others are tracked
+            random_state (int): Seed for quantile sketch compaction
+        """
+        self.quantile_k = quantile_k
+        self.exact_distinct_limit = exact_distinct_limit
+        self.hll_precision = hll_precision
+        self.exact_duplicates = exact_duplicates
+        self.target_column = target_column
+        self.random_state = random_state
+
+        self.columns = None
+        self.moments = None
+        self.n_rows = 0
+        self.null_counts = None
+        self.minimums = None
+        self.maximums = None
+        self.distinct = {}
+        self.quantile_sketches = {}
+        self.row_hashes = np.empty(0, dtype=np.uint64) if exact_duplicates \
+            else HyperLogLog(hll_precision)
+
+    def _init_columns(self, columns):
+        self.columns = list(columns)
+        self.null_counts = pd.Series(0, index=self.columns, dtype=np.int64)
+        self.minimums = pd.Series(np.nan, index=self.columns)
+        self.maximums = pd.Series(np.nan, index=self.columns)
+        for column in self.columns:
+            self.distinct[column] = DistinctCounter(self.exact_distinct_limit, self.hll_precision)
+            self.quantile_sketches[column] = QuantileSketch(self.quantile_k, self.random_state)
+
+    def update(self, chunk):
+        """
+        Add a chunk of rows to the profile.
+
+        Args:
+            chunk (pd.DataFrame): Rows with the same columns as earlier chunks
+
+        Returns:
+            DataProfile: self
+        """
+        if self.columns is None:
+            self._init_columns(chunk.columns)
+        chunk = _normalize_numeric(chunk)
+        self.n_rows += len(chunk)
+        self.null_counts += chunk.isnull().sum()
+
+        numeric = chunk.select_dtypes(include='number')
+        if self.moments is None:
+            self.moments = MomentAccumulator(numeric.columns, self.target_column)
+        self.moments.update(numeric)
+        if len(numeric.columns):
+            self.minimums[numeric.columns] = np.fmin(self.minimums[numeric.columns], numeric.min())
+            self.maximums[numeric.columns] = np.fmax(self.maximums[numeric.columns], numeric.max())
+
+        for column in self.columns:
+            values = chunk[column].dropna().to_numpy()
+            self.distinct[column].add_hashes(_hash_values(values))
+            if column in numeric.columns:
+                self.quantile_sketches[column].update(values)
+
+        row_hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        if self.exact_duplicates:
+            self.row_hashes = np.union1d(self.row_hashes, row_hashes)
+        else:
+            self.row_hashes.add_hashes(row_hashes)
+        return self
+
+    def merge(self, other):
+        """
+        Combine another profile into this one.
+
+        Args:
+            other (DataProfile): Profile of other rows with the same columns
+
+        Returns:
+            DataProfile: self
+        """
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self._init_columns(other.columns)
+        self.n_rows += other.n_rows
+        self.null_counts += other.null_counts
+        self.minimums = np.fmin(self.minimums, other.minimums)
+        self.maximums = np.fmax(self.maximums, other.maximums)
+        for column in self.columns:
+            self.distinct[column].merge(other.distinct[column])
+            self.quantile_sketches[column].merge(other.quantile_sketches[column])
+        if other.moments is not None:
+            if self.moments is None:
+                self.moments = MomentAccumulator(other.moments.columns, other.moments.target_column)
+            self.moments.merge(other.moments)
+
+        if self.exact_duplicates:
+            self.row_hashes = np.union1d(self.row_hashes, other.row_hashes)
+        else:
+            self.row_hashes.merge(other.row_hashes)
+        return self
+
+    @property
+    def duplicates(self):
+        """Rows identical to an earlier row (df.duplicated().sum())."""
+        if self.exact_duplicates:
+            return self.n_rows - len(self.row_hashes)
+        return max(0, self.n_rows - int(round(self.row_hashes.estimate())))
+
+    def quality_report(self):
+        """
+        Summarize the profile like check_data_quality().
+
+        Returns:
+            dict: Shape, missing values and duplicate rows
+        """
+        report = {
+            'shape': (self.n_rows, len(self.columns)),
+            'missing_values': int(self.null_counts.sum()),
+            'duplicates': int(self.duplicates),
+            'duplicates_exact': self.exact_duplicates
+        }
+
+        print("\n=== Data Quality Report (streaming) ===")
+        print(f"Shape: {report['shape']}")
+        print(f"Missing values: {report['missing_values']}")
+        print(f"Duplicate rows: {report['duplicates']}"
+              + ('' if self.exact_duplicates else ' (approximate)'))
+        return report
+
+    def describe(self, percentiles=(0.25, 0.5, 0.75)):
+        """
+        Per-column statistics in the layout of df.describe() plus nulls and distincts.
+
+        Args:
+            percentiles (tuple): Quantiles to estimate
+
+        Returns:
+            pd.DataFrame: Rows count, nulls, distinct, mean, std, min, percentiles, max
+        """
+        moments = self.moments.describe() if self.moments is not None else pd.DataFrame()
+        stats = {}
+        for column in self.columns:
+            quantiles = self.quantile_sketches[column].quantiles(percentiles)
+            stats[column] = {
+                'count': self.n_rows - int(self.null_counts[column]),
+                'nulls': int(self.null_counts[column]),
+                'distinct': self.distinct[column].estimate(),
+                'mean': moments[column]['mean'] if column in moments else np.nan,
+                'std': moments[column]['std'] if column in moments else np.nan,
+                'min': self.minimums[column],
+                **{f'{q * 100:g}%': value for q, value in zip(percentiles, quantiles)},
+                'max': self.maximums[column]
+            }
+        return pd.DataFrame(stats)
+
+
+class _RangeReader(io.RawIOBase):
+    """Read-only view of the byte range [start, end) of a file."""
+
+    def __init__(self, f, start, end):
+        self.f = f
+        self.f.seek(start)
+        self.remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = min(len(buffer), self.remaining)
+        if n <= 0:
+            return 0
+        data = self.f.read(n)
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        return len(data)
+
+
+def _byte_ranges(filepath, n_parts):
+    """Split a CSV body into byte ranges that start and end on line boundaries."""
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as f:
+        f.readline()  # header
+        body_start = f.tell()
+        offsets = [body_start]
+        for i in range(1, n_parts):
+            f.seek(max(body_start + (size - body_start) * i // n_parts, offsets[-1]))
+            if f.tell() > body_start:
+                f.readline()
+            offsets.append(max(f.tell(), offsets[-1]))
+    offsets.append(size)
+    return [(start, end) for start, end in zip(offsets[:-1], offsets[1:]) if end > start]
+
+
+def _profile_range(shared, start, end):
+    """Profile one byte range of a CSV on a worker."""
+    profile = DataProfile(**shared['profile_options'])
+    with open(shared['filepath'], 'rb') as f:
+        reader = io.BufferedReader(_RangeReader(f, start, end))
+        for chunk in pd.read_csv(reader, header=None, names=shared['columns'],
+                                 dtype=shared['dtype'], chunksize=shared['chunksize']):
+            profile.update(chunk)
+    return profile
+
+
+def profile_csv(filepath, chunksize=1_000_000, n_workers=None, backend='process', dtype=None,
+                **profile_options):
+    """
+    Profile a CSV in one streaming pass, splitting it across workers.
+
+    The file is cut into byte ranges on line boundaries; each worker
+    streams its range in chunks and the partial profiles are merged.
+
+    Args:
+        filepath (str): Path to the CSV file
+        chunksize (int): Rows per chunk within a worker
+        n_workers (int): Worker processes (default: one per core of the CPU budget)
+        backend (str): Executor backend ('process', 'dask' or 'sequential')
+        dtype (dict): Column dtypes passed to read_csv, e.g. DATASET_SCHEMA
+        **profile_options: Passed to DataProfile
+
+    Returns:
+        DataProfile: Profile of the whole file
+    """
+    columns = list(pd.read_csv(filepath, nrows=0).columns)
+    n_workers = n_workers or ResourceBudget.from_env(n_workers=1).n_jobs
+    ranges = _byte_ranges(filepath, n_workers)
+
+    shared = {'filepath': filepath, 'columns': columns, 'dtype': dtype,
+              'chunksize': chunksize, 'profile_options': profile_options}
+    with get_executor(backend, **budget_options(backend, n_workers=n_workers)) as executor:
+        partial_profiles = executor.run(_profile_range, ranges, shared)
+
+    profile = DataProfile(**profile_options)
+    for partial in partial_profiles:
+        profile.merge(partial)
+    if profile.columns is None:
+        profile._init_columns(columns)
+    return profile
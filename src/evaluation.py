@@ -0,0 +1,160 @@
+"""
+Evaluation Module for Disease PredictionIQ
+Single-sort vectorized computation of threshold, ROC and precision-recall metrics
+Author: Jay Prakash
+"""
+
+import numpy as np
+
+
+def threshold_counts(y_true, scores):
+    """
+    Count true and false positives at every distinct score threshold.
+
+    Scores are sorted once in decreasing order; cumulative sums over the
+    sorted labels give the confusion matrix for every threshold in one pass.
+
+    Args:
+        y_true (array-like): Binary labels (0/1)
+        scores (array-like): Predicted scores, higher means more likely positive
+
+    Returns:
+        tuple: (fps, tps, thresholds, n_positive, n_negative)
+    """
+    y_true = np.asarray(y_true).astype(np.int8, copy=False)
+    scores = np.asarray(scores)
+
+    order = np.argsort(scores, kind='stable')[::-1]
+    sorted_scores = scores[order]
+    sorted_labels = y_true[order]
+    del order
+
+    # Last index of each run of equal scores closes a threshold
+    distinct = np.flatnonzero(np.diff(sorted_scores))
+    threshold_idx = np.append(distinct, len(sorted_scores) - 1)
+
+    tps = np.cumsum(sorted_labels, dtype=np.int64)[threshold_idx]
+    fps = threshold_idx + 1 - tps
+    thresholds = sorted_scores[threshold_idx]
+
+    n_positive = int(tps[-1]) if len(tps) else 0
+    n_negative = int(fps[-1]) if len(fps) else 0
+    return fps, tps, thresholds, n_positive, n_negative
+
+
+def decimate_curve(x, y, max_points=200):
+    """
+    Reduce a monotone curve to at most `max_points` points.
+
+    Points are picked at even steps of cumulative path length, so steep and
+    flat sections both keep their shape; the first and last points are kept.
+
+    Args:
+        x (np.ndarray): Curve x coordinates
+        y (np.ndarray): Curve y coordinates
+        max_points (int): Maximum number of points to keep
+
+    Returns:
+        np.ndarray: Indices of the kept points
+    """
+    n_points = len(x)
+    if n_points <= max_points:
+        return np.arange(n_points)
+
+    path = np.concatenate([[0.0], np.cumsum(np.hypot(np.diff(x), np.diff(y)))])
+    targets = np.linspace(0.0, path[-1], max_points)
+    keep = np.searchsorted(path, targets, side='left')
+    keep[-1] = n_points - 1
+    return np.unique(keep)
+
+
+def evaluate_scores(y_true, scores, y_pred=None, threshold=0.5, max_curve_points=200):
+    """
+    Compute classification metrics and down-sampled curves from one sort.
+
+    Args:
+        y_true (array-like): Binary labels (0/1)
+        scores (array-like): Predicted probability or decision score for class 1
+        y_pred (array-like): Predicted labels; if None they are `scores >= threshold`
+        threshold (float): Decision threshold used when y_pred is None
+        max_curve_points (int): Maximum points kept per ROC / PR curve
+
+    Returns:
+        dict: Accuracy, precision, recall, F1, ROC-AUC, average precision,
+              confusion matrix and down-sampled ROC / PR curves
+    """
+    y_true = np.asarray(y_true).astype(np.int8, copy=False)
+    fps, tps, thresholds, n_positive, n_negative = threshold_counts(y_true, scores)
+
+    # Threshold metrics: confusion matrix from predicted labels or from the curve
+    if y_pred is not None:
+        counts = np.bincount(2 * y_true + np.asarray(y_pred).astype(np.int8, copy=False),
+                             minlength=4)
+        tn, fp, fn, tp = (int(c) for c in counts)
+    else:
+        # thresholds are decreasing; count thresholds >= cut-off
+        idx = np.searchsorted(-thresholds, -threshold, side='right') - 1
+        tp = int(tps[idx]) if idx >= 0 else 0
+        fp = int(fps[idx]) if idx >= 0 else 0
+        fn = n_positive - tp
+        tn = n_negative - fp
+
+    n_total = tn + fp + fn + tp
+    accuracy = (tp + tn) / n_total if n_total else 0.0
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+    # ROC curve starts at (0, 0)
+    tpr = np.concatenate([[0.0], tps / n_positive]) if n_positive else np.zeros(len(tps) + 1)
+    fpr = np.concatenate([[0.0], fps / n_negative]) if n_negative else np.zeros(len(fps) + 1)
+    roc_thresholds = np.concatenate([[np.inf], thresholds])
+    if n_positive and n_negative:
+        roc_auc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2)
+    else:
+        roc_auc = float('nan')
+
+    # Precision-recall curve and step-wise average precision
+    curve_precision = tps / (tps + fps)
+    curve_recall = tps / n_positive if n_positive else np.zeros(len(tps))
+    average_precision = float(np.sum(np.diff(np.concatenate([[0.0], curve_recall])) * curve_precision))
+
+    roc_keep = decimate_curve(fpr, tpr, max_curve_points)
+    pr_keep = decimate_curve(curve_recall, curve_precision, max_curve_points)
+
+    return {
+        'accuracy': accuracy,
+        'precision': precision,
+        'recall': recall,
+        'f1_score': f1,
+        'roc_auc': roc_auc,
+        'average_precision': average_precision,
+        'confusion_matrix': [[tn, fp], [fn, tp]],
+        'roc_curve': {
+            'fpr': fpr[roc_keep].tolist(),
+            'tpr': tpr[roc_keep].tolist(),
+            'thresholds': roc_thresholds[roc_keep].tolist()
+        },
+        'pr_curve': {
+            'recall': curve_recall[pr_keep].tolist(),
+            'precision': curve_precision[pr_keep].tolist(),
+            'thresholds': thresholds[pr_keep].tolist()
+        },
+        'n_samples': n_total
+    }
+
+
+def model_scores(model, X):
+    """
+    Get class-1 scores from a fitted classifier.
+
+    Args:
+        model: Fitted classifier
+        X (array-like): Features
+
+    Returns:
+        np.ndarray: predict_proba[:, 1] when available, otherwise decision_function
+    """
+    if hasattr(model, 'predict_proba'):
+        return model.predict_proba(X)[:, 1]
+    return model.decision_function(X)
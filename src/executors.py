@@ -0,0 +1,226 @@
+"""
+Execution Backends Module for Disease PredictionIQ
+Pluggable executors that run model fit tasks locally or on a multi-node cluster
+Author: Jay Prakash
+"""
+
+import os
+import socket
+import time
+import warnings
+
+from threadpoolctl import threadpool_limits
+
+from resource_budget import ResourceBudget
+
+# Data shipped once to each local worker process by the pool initializer
+_WORKER_SHARED = None
+
+
+def _timed_call(func, shared, args):
+    """Run one task and return its result with timing and worker identity."""
+    start = time.perf_counter()
+    result = func(shared, *args)
+    return result, time.perf_counter() - start, f'{socket.gethostname()}:{os.getpid()}'
+
+
+def _init_local_worker(shared, n_threads):
+    """Process pool initializer: keep the shared data and cap native threads."""
+    global _WORKER_SHARED
+    warnings.filterwarnings('ignore')
+    threadpool_limits(limits=n_threads)
+    _WORKER_SHARED = shared
+
+
+def _run_local_task(func, args):
+    return _timed_call(func, _WORKER_SHARED, args)
+
+
+class SequentialExecutor:
+    """Run tasks one after another in the current process (useful for debugging)."""
+
+    def __init__(self):
+        self.timings = []
+
+    def run(self, func, tasks, shared):
+        """
+        Run `func(shared, *task)` for every task.
+
+        Args:
+            func (callable): Module-level task function
+            tasks (list): Argument tuples, one per task
+            shared (dict): Data every task needs, e.g. {'X': X, 'y': y}
+
+        Returns:
+            list: Task results in task order
+        """
+        outputs = [_timed_call(func, shared, args) for args in tasks]
+        return self._collect(outputs)
+
+    def _collect(self, outputs):
+        results = []
+        self.timings = []
+        for index, (result, elapsed, worker) in enumerate(outputs):
+            results.append(result)
+            self.timings.append({'task': index, 'elapsed': elapsed, 'worker': worker})
+        return results
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LocalProcessExecutor(SequentialExecutor):
+    """
+    Run tasks on a local process pool kept for the executor's lifetime.
+
+    The shared data is passed to each worker once through the pool
+    initializer instead of being pickled with every task. The pool is
+    started by the first run() and reused by later runs with the same
+    shared data (e.g. one run per tuning rung), until close() or the end of
+    the `with` block. A run with different shared data restarts the pool.
+    """
+
+    def __init__(self, n_workers=None, threads_per_worker=1):
+        """
+        Initialize the executor.
+
+        Args:
+            n_workers (int): Worker processes (default: all cores; use
+                budget_options to size the pool to the CPU budget)
+            threads_per_worker (int): Native BLAS/OpenMP threads per worker
+        """
+        super().__init__()
+        self.n_workers = n_workers or os.cpu_count()
+        self.threads_per_worker = threads_per_worker
+        self._pool = None
+        self._shared = None
+
+    @staticmethod
+    def _same_shared(a, b):
+        """Shared dicts holding the very same objects (a rebuilt dict of the same arrays matches)."""
+        return a is b or (a is not None and b is not None and a.keys() == b.keys()
+                          and all(a[key] is b[key] for key in a))
+
+    def _get_pool(self, shared):
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self._pool is not None and not self._same_shared(shared, self._shared):
+            self._pool.shutdown()
+            self._pool = None
+        if self._pool is None:
+            # Workers start on demand, so short runs do not spawn the whole pool
+            self._pool = ProcessPoolExecutor(max_workers=self.n_workers,
+                                             initializer=_init_local_worker,
+                                             initargs=(shared, self.threads_per_worker))
+            self._shared = shared
+        return self._pool
+
+    def run(self, func, tasks, shared):
+        pool = self._get_pool(shared)
+        futures = [pool.submit(_run_local_task, func, args) for args in tasks]
+        outputs = [future.result() for future in futures]
+        return self._collect(outputs)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._shared = None
+
+
+class DaskExecutor(SequentialExecutor):
+    """
+    Run tasks on a Dask distributed scheduler.
+
+    Connects to an existing scheduler when `address` is given, otherwise
+    starts a local multi-process cluster that stands in for a multi-node
+    deployment. The shared data is broadcast to every worker once.
+    """
+
+    def __init__(self, address=None, n_workers=None, threads_per_worker=1):
+        """
+        Initialize the executor.
+
+        Args:
+            address (str): Scheduler address, e.g. 'tcp://10.0.0.5:8786'
+            n_workers (int): Workers of the local stand-in cluster
+            threads_per_worker (int): Threads per worker of the local stand-in cluster
+        """
+        super().__init__()
+        try:
+            from dask.distributed import Client, LocalCluster
+        except ImportError as e:
+            raise ImportError("The 'dask' backend requires dask.distributed: "
+                              "pip install 'dask[distributed]'") from e
+
+        self.cluster = None
+        if address:
+            self.client = Client(address)
+        else:
+            self.cluster = LocalCluster(n_workers=n_workers or os.cpu_count(),
+                                        threads_per_worker=threads_per_worker,
+                                        processes=True, dashboard_address=None)
+            self.client = Client(self.cluster)
+
+    def run(self, func, tasks, shared):
+        shared_future = self.client.scatter(shared, broadcast=True)
+        futures = [self.client.submit(_timed_call, func, shared_future, args, pure=False)
+                   for args in tasks]
+        return self._collect(self.client.gather(futures))
+
+    def close(self):
+        self.client.close()
+        if self.cluster is not None:
+            self.cluster.close()
+
+
+def budget_options(backend, budget=None, n_workers=None):
+    """
+    Executor options that keep a backend's workers within the CPU budget.
+
+    The budget's cores are split between worker processes and their native
+    thread pools, as in BaselineModels.train_all_parallel: by default one
+    single-threaded worker per core.
+
+    Args:
+        backend (str): 'sequential', 'process' or 'dask'
+        budget (ResourceBudget): CPU budget (default: read from the environment)
+        n_workers (int): Worker processes (default: one per budgeted core)
+
+    Returns:
+        dict: Options for get_executor (empty for the sequential backend)
+    """
+    if backend == 'sequential':
+        return {}
+    budget = budget or ResourceBudget.from_env(n_workers=1)
+    n_workers = n_workers or budget.n_jobs
+    return {'n_workers': n_workers,
+            'threads_per_worker': max(1, budget.threads_per_worker // n_workers)}
+
+
+def get_executor(backend='process', **options):
+    """
+    Create an executor for a backend name.
+
+    Args:
+        backend (str): 'sequential', 'process' or 'dask'
+        **options: Passed to the executor constructor
+
+    Returns:
+        SequentialExecutor: Executor instance exposing run() and close()
+    """
+    executors = {
+        'sequential': SequentialExecutor,
+        'process': LocalProcessExecutor,
+        'dask': DaskExecutor
+    }
+    if backend not in executors:
+        raise ValueError(f"Unknown execution backend '{backend}'. "
+                         f"Choose from: {', '.join(executors)}")
+    return executors[backend](**options)
@@ -0,0 +1,133 @@
+"""
+Learning Curves Module for Disease PredictionIQ
+Finds the training-set size where validation scores plateau, using nested stratified subsamples
+Author: Jay Prakash
+"""
+
+import time
+import numpy as np
+from sklearn.base import clone
+from sklearn.model_selection import cross_val_score, StratifiedKFold
+
+
+def nested_stratified_order(y, random_state=42):
+    """
+    Order rows so that every prefix is a stratified random subsample.
+
+    Rows are shuffled within each class and then interleaved by their
+    relative position in the class, so the first n rows hold each class in
+    proportion and every smaller subsample is contained in every larger one.
+
+    Args:
+        y (array-like): Class labels
+        random_state (int): Random seed
+
+    Returns:
+        np.ndarray: Row positions; take order[:n] for a subsample of n rows
+    """
+    y = np.asarray(y)
+    rng = np.random.default_rng(random_state)
+    keys = np.empty(len(y))
+    for label in np.unique(y):
+        members = np.flatnonzero(y == label)
+        # Jittered evenly spaced keys: class k's i-th row lands at ~i / n_k
+        positions = np.arange(len(members)) + rng.random(len(members))
+        keys[rng.permutation(members)] = positions / len(members)
+    return np.argsort(keys, kind='stable')
+
+
+def geometric_sizes(n_rows, min_size=200, growth=2.0, max_fraction=0.5):
+    """
+    Subsample sizes growing geometrically from min_size.
+
+    Args:
+        n_rows (int): Rows available
+        min_size (int): Smallest subsample
+        growth (float): Ratio between consecutive sizes
+        max_fraction (float): Largest subsample as a fraction of n_rows;
+            sizes beyond it would save too little to be worth probing
+
+    Returns:
+        list: Increasing subsample sizes
+    """
+    limit = max(min_size, int(n_rows * max_fraction))
+    sizes = []
+    size = float(min(min_size, n_rows))
+    while int(size) <= limit and int(size) <= n_rows:
+        sizes.append(int(size))
+        size *= growth
+    return sizes
+
+
+def find_plateau(scores, tolerance=0.005, patience=2):
+    """
+    Index of the first size whose score later sizes do not beat by more than tolerance.
+
+    Args:
+        scores (list): Mean validation scores at increasing sizes
+        tolerance (float): Improvement that still counts as a plateau
+        patience (int): Larger sizes that must confirm the plateau
+
+    Returns:
+        int: Index into scores, or None if no plateau is confirmed yet
+    """
+    for index in range(len(scores) - patience):
+        if max(scores[index + 1:index + 1 + patience]) - scores[index] <= tolerance:
+            return index
+    return None
+
+
+def build_learning_curve(estimator, X, y, order, sizes, cv_folds=5, scoring='accuracy',
+                         tolerance=0.005, patience=2):
+    """
+    Cross-validate an estimator on growing nested subsamples until scores plateau.
+
+    Sizes are evaluated in order and probing stops as soon as a plateau is
+    confirmed, so the largest subsamples are only fitted when the curve is
+    still rising.
+
+    Args:
+        estimator: Unfitted sklearn estimator
+        X (pd.DataFrame or np.ndarray): Features
+        y (pd.Series or np.ndarray): Target
+        order (np.ndarray): Row order from nested_stratified_order
+        sizes (list): Increasing subsample sizes
+        cv_folds (int): Number of cross-validation folds
+        scoring (str): sklearn scoring name
+        tolerance (float): Improvement that still counts as a plateau
+        patience (int): Larger sizes that must confirm the plateau
+
+    Returns:
+        dict: sizes, mean_scores, std_scores, plateau_size (None if not
+            found), row_fits (training rows summed over all fits) and elapsed
+    """
+    start = time.perf_counter()
+    curve = {'sizes': [], 'mean_scores': [], 'std_scores': [], 'plateau_size': None,
+             'row_fits': 0}
+
+    print(f"{'Rows':>10}{'Mean':>10}{'Std':>10}")
+    for size in sizes:
+        rows = np.sort(order[:size])
+        X_sub = X.iloc[rows] if hasattr(X, 'iloc') else X[rows]
+        y_sub = y.iloc[rows] if hasattr(y, 'iloc') else y[rows]
+        scores = cross_val_score(clone(estimator), X_sub, y_sub, scoring=scoring,
+                                 cv=StratifiedKFold(n_splits=cv_folds))
+
+        curve['sizes'].append(size)
+        curve['mean_scores'].append(float(scores.mean()))
+        curve['std_scores'].append(float(scores.std()))
+        curve['row_fits'] += size * (cv_folds - 1)
+        print(f"{size:10d}{scores.mean():10.4f}{scores.std():10.4f}")
+
+        plateau = find_plateau(curve['mean_scores'], tolerance, patience)
+        if plateau is not None:
+            curve['plateau_size'] = curve['sizes'][plateau]
+            break
+
+    curve['elapsed'] = time.perf_counter() - start
+    if curve['plateau_size'] is None:
+        print(f"No plateau within {tolerance} up to {curve['sizes'][-1]} rows")
+    else:
+        print(f"Plateau at {curve['plateau_size']} rows (within {tolerance} over "
+              f"the next {patience} sizes)")
+    return curve
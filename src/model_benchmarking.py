@@ -0,0 +1,296 @@
+"""
+Model Benchmarking Module for Disease PredictionIQ
+Measures fit time, inference latency and model size, and selects a model under serving constraints
+Author: Jay Prakash
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+
+# Batch sizes served by the web apps: one patient, a form batch, a bulk upload
+BATCH_SIZES = (1, 32, 256)
+
+# Test metrics in a comparison entry that select_best_model can maximise
+SELECTION_METRICS = ('accuracy', 'precision', 'recall', 'f1_score', 'roc_auc')
+
+# Display categories used by the model comparison page
+MODEL_CATEGORIES = {
+    'MLPClassifier': 'Deep Learning',
+    'AdaBoostClassifier': 'Boosting',
+    'GradientBoostingClassifier': 'Boosting',
+    'LGBMClassifier': 'Boosting',
+    'XGBClassifier': 'Boosting',
+    'RandomForestClassifier': 'Ensemble',
+    'ExtraTreesClassifier': 'Ensemble',
+    'DecisionTreeClassifier': 'Tree-based',
+    'KNeighborsClassifier': 'Instance-based',
+    'GaussianNB': 'Probabilistic',
+    'LogisticRegression': 'Linear',
+    'LinearDiscriminantAnalysis': 'Linear',
+    'SVC': 'Kernel-based',
+    'CalibratedClassifierCV': 'Kernel-based'
+}
+
+
+def benchmark_batch_sizes(latency_batch_size=None):
+    """
+    Batch sizes to measure, including the one a latency limit applies to.
+
+    Args:
+        latency_batch_size (int): Batch size the latency limit applies to
+
+    Returns:
+        tuple: Sorted batch sizes
+    """
+    if latency_batch_size is None:
+        return BATCH_SIZES
+    if int(latency_batch_size) < 1:
+        raise ValueError(f"latency_batch_size must be at least 1, got {latency_batch_size}")
+    return tuple(sorted(set(BATCH_SIZES) | {int(latency_batch_size)}))
+
+
+def model_size_bytes(model):
+    """
+    Size of a model as it is shipped to the web apps.
+
+    Args:
+        model: Fitted estimator
+
+    Returns:
+        int: Length of the pickled model in bytes
+    """
+    return len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def measure_fit_time(model, X_train, y_train, n_repeats=1):
+    """
+    Time fitting an unfitted copy of a model on the full training set.
+
+    Args:
+        model: Estimator whose parameters are reused
+        X_train (array-like): Training features
+        y_train (array-like): Training target
+        n_repeats (int): Number of fits; the fastest is reported
+
+    Returns:
+        float: Fit time in seconds
+    """
+    times = []
+    for _ in range(n_repeats):
+        estimator = clone(model)
+        start = time.perf_counter()
+        estimator.fit(X_train, y_train)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure_inference_latency(model, X, batch_sizes=BATCH_SIZES, n_repeats=50):
+    """
+    Time predict_proba at each batch size, the call the web apps make.
+
+    Rows are drawn from X, tiling it when a batch is larger than X.
+
+    Args:
+        model: Fitted classifier
+        X (array-like): Rows to predict on
+        batch_sizes (tuple): Batch sizes to time
+        n_repeats (int): Timed calls per batch size
+
+    Returns:
+        dict: {batch_size: {'median_ms', 'p95_ms', 'per_row_us'}}
+    """
+    X = np.asarray(X)
+    latency = {}
+    for batch_size in batch_sizes:
+        batch = X[np.arange(batch_size) % len(X)]
+        model.predict_proba(batch)  # warm up caches and lazy initialisation
+
+        times = np.empty(n_repeats)
+        for i in range(n_repeats):
+            start = time.perf_counter()
+            model.predict_proba(batch)
+            times[i] = time.perf_counter() - start
+
+        median = float(np.median(times))
+        latency[batch_size] = {
+            'median_ms': median * 1e3,
+            'p95_ms': float(np.percentile(times, 95)) * 1e3,
+            'per_row_us': median / batch_size * 1e6
+        }
+    return latency
+
+
+def benchmark_models(models, X_train, y_train, X_bench, batch_sizes=BATCH_SIZES, n_repeats=50):
+    """
+    Measure fit time, latency and size of every candidate model.
+
+    Args:
+        models (dict): {display name: fitted model}
+        X_train (array-like): Training features used to time a fresh fit
+        y_train (array-like): Training target
+        X_bench (array-like): Rows used for latency measurements
+        batch_sizes (tuple): Batch sizes to time
+        n_repeats (int): Timed calls per batch size
+
+    Returns:
+        dict: {display name: {'fit_time_s', 'size_bytes', 'latency_ms'}}
+    """
+    print("\n" + "="*60)
+    print("Benchmarking Serving Cost")
+    print("="*60)
+    header = ''.join(f"{f'batch {b} (ms)':>16}" for b in batch_sizes)
+    print(f"{'Model':35s}{'Fit (s)':>10}{'Size (KB)':>12}{header}")
+
+    costs = {}
+    for name, model in models.items():
+        latency = measure_inference_latency(model, X_bench, batch_sizes, n_repeats)
+        costs[name] = {
+            'fit_time_s': round(measure_fit_time(model, X_train, y_train), 4),
+            'size_bytes': model_size_bytes(model),
+            # JSON object keys are strings
+            'latency_ms': {str(b): round(latency[b]['median_ms'], 4) for b in batch_sizes}
+        }
+        row = ''.join(f"{latency[b]['median_ms']:16.3f}" for b in batch_sizes)
+        print(f"{name:35s}{costs[name]['fit_time_s']:10.3f}"
+              f"{costs[name]['size_bytes'] / 1024:12.1f}{row}")
+    return costs
+
+
+def build_models_comparison(results, models, costs):
+    """
+    Combine test metrics and serving costs into the comparison entries.
+
+    Args:
+        results (pd.DataFrame): Output of BaselineModels.evaluate_models
+        models (dict): {display name: fitted model}
+        costs (dict): Output of benchmark_models
+
+    Returns:
+        list: One dict per model in the format of /api/models-comparison
+    """
+    comparison = []
+    for _, row in results.iterrows():
+        name = row['Model']
+        comparison.append({
+            'name': name,
+            'accuracy': round(float(row['Accuracy']), 4),
+            'precision': round(float(row['Precision']), 4),
+            'recall': round(float(row['Recall']), 4),
+            'f1_score': round(float(row['F1-Score']), 4),
+            'roc_auc': round(float(row['ROC-AUC']), 4),
+            'category': MODEL_CATEGORIES.get(type(models[name]).__name__, 'Other'),
+            'is_best': False,
+            **costs[name]
+        })
+    return comparison
+
+
+def select_best_model(comparison, metric='roc_auc', max_latency_ms=None,
+                      latency_batch_size=1, max_size_bytes=None):
+    """
+    Pick the best-scoring model that meets the serving constraints.
+
+    Args:
+        comparison (list): Entries from build_models_comparison
+        metric (str): Metric to maximise, one of SELECTION_METRICS
+        max_latency_ms (float): Latency limit at `latency_batch_size` rows
+        latency_batch_size (int): Batch size the latency limit applies to
+        max_size_bytes (int): Limit on the pickled model size
+
+    Returns:
+        dict: The selected entry (also marked with is_best=True)
+    """
+    batch_key = str(latency_batch_size)
+    for entry in comparison:
+        if max_latency_ms is not None and batch_key not in entry.get('latency_ms', {}):
+            raise ValueError(f"{entry['name']} has no latency measured at batch "
+                             f"{latency_batch_size}; benchmark with "
+                             f"benchmark_batch_sizes({latency_batch_size})")
+        if max_size_bytes is not None and 'size_bytes' not in entry:
+            raise ValueError(f"{entry['name']} has no measured size; run the benchmark first")
+
+    eligible = []
+    for entry in comparison:
+        if max_latency_ms is not None and entry['latency_ms'][batch_key] > max_latency_ms:
+            continue
+        if max_size_bytes is not None and entry['size_bytes'] > max_size_bytes:
+            continue
+        eligible.append(entry)
+
+    if not eligible:
+        raise ValueError(f"No model meets the constraints (max_latency_ms={max_latency_ms} "
+                         f"at batch {latency_batch_size}, max_size_bytes={max_size_bytes})")
+
+    best = max(eligible, key=lambda entry: entry[metric])
+    for entry in comparison:
+        entry['is_best'] = entry is best
+
+    latency = best.get('latency_ms', {}).get(batch_key)
+    costs = (f"{latency:.3f} ms at batch {latency_batch_size} | "
+             if latency is not None else '')
+    if 'size_bytes' in best:
+        costs += f"{best['size_bytes'] / 1024:.1f} KB "
+    print(f"\nSelected {best['name']}: {metric} {best[metric]:.4f} | {costs}"
+          f"({len(eligible)}/{len(comparison)} models met the constraints)")
+    return best
+
+
+def benchmark_artifacts(data_path, models_dir='models', target_column='heart_disease',
+                        batch_sizes=BATCH_SIZES):
+    """
+    Record the serving cost of an exported model in model_metadata.json.
+
+    Only the exported model is shipped, so only its models_comparison entry
+    gets cost fields; the other entries need a pipeline run to be measured.
+
+    Args:
+        data_path (str): Path to the dataset CSV
+        models_dir (str): Directory of the deployment artifacts
+        target_column (str): Name of the target column
+        batch_sizes (tuple): Batch sizes to time
+
+    Returns:
+        dict: The updated comparison entry
+    """
+    from data_preprocessing import preprocess_data
+
+    metadata_path = os.path.join(models_dir, 'model_metadata.json')
+    with open(metadata_path, 'r') as f:
+        metadata = json.load(f)
+    with open(os.path.join(models_dir, 'best_heart_disease_model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+
+    X_train, X_test, y_train, _, _, _ = preprocess_data(pd.read_csv(data_path), target_column)
+    name = metadata['model_name']
+    costs = benchmark_models({name: model}, X_train.values, y_train, X_test.values, batch_sizes)
+
+    entry = next(e for e in metadata['models_comparison'] if e['name'] == name)
+    entry.update(costs[name])
+    tmp_path = metadata_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(metadata, f, indent=4)
+    os.replace(tmp_path, metadata_path)
+    return entry
+
+
+def main(argv=None):
+    """Command-line entry point: benchmark the exported model without retraining."""
+    parser = argparse.ArgumentParser(description='Record the serving cost of the exported model')
+    parser.add_argument('--data', default='heart_disease_dataset.csv')
+    parser.add_argument('--models-dir', default='models')
+    parser.add_argument('--target', default='heart_disease')
+    args = parser.parse_args(argv)
+
+    benchmark_artifacts(args.data, args.models_dir, args.target)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,35 +4,178 @@ Implements baseline models and hyperparameter tuning
 Author: Jay Prakash
 """
 
+import time
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.svm import SVC
-from sklearn.model_selection import cross_val_score, GridSearchCV, StratifiedKFold
-from sklearn.metrics import (accuracy_score, precision_score, recall_score, 
-                             f1_score, roc_auc_score, confusion_matrix, roc_curve, auc)
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.model_selection import cross_val_score, GridSearchCV, StratifiedKFold, ParameterGrid
+from sklearn.metrics import (accuracy_score, f1_score, roc_auc_score, confusion_matrix,
+                             roc_curve, auc, get_scorer, brier_score_loss, log_loss)
+from adaptive_search import SuccessiveHalvingSearch, LogUniform, SearchResult
+from evaluation import evaluate_scores, model_scores
+from executors import budget_options, get_executor
+from learning_curves import nested_stratified_order, geometric_sizes, build_learning_curve
+from resource_budget import ResourceBudget
 import warnings
 warnings.filterwarnings('ignore')
 
 
+def _take_rows(data, indices):
+    """Select rows by position from a DataFrame, Series or array."""
+    if hasattr(data, 'iloc'):
+        return data.iloc[indices]
+    return data[indices]
+
+
+# How the final SVM gets probabilities; None falls back to SVC(probability=True)
+CALIBRATION_METHODS = ('sigmoid', 'isotonic', None)
+
+
+def calibrated(estimator, method='sigmoid', cv_folds=5):
+    """
+    Wrap a classifier so its probabilities are calibrated once on held-out folds.
+    
+    The base estimator's decision values are collected out-of-fold, one
+    calibrator is fit on them, and the base estimator is refit on all rows
+    (ensemble=False). This replaces SVC(probability=True), which repeats an
+    internal 5-fold Platt scaling inside every single fit.
+    
+    Args:
+        estimator: Unfitted classifier with decision_function
+        method (str): 'sigmoid' (Platt) or 'isotonic'
+        cv_folds (int): Folds used to collect held-out decision values
+        
+    Returns:
+        CalibratedClassifierCV: Unfitted calibrated classifier
+    """
+    return CalibratedClassifierCV(clone(estimator), method=method,
+                                  cv=StratifiedKFold(n_splits=cv_folds), ensemble=False)
+
+
+def with_probabilities(estimator, calibration='sigmoid', cv_folds=5):
+    """
+    Make an SVC-style classifier serve predict_proba.
+    
+    Args:
+        estimator: Unfitted classifier with decision_function
+        calibration (str): 'sigmoid' or 'isotonic' to calibrate once on held-out
+            folds, or None for the classic SVC(probability=True)
+        cv_folds (int): Folds used to collect held-out decision values
+        
+    Returns:
+        estimator: Unfitted classifier with predict_proba
+    """
+    if calibration is None:
+        return clone(estimator).set_params(probability=True)
+    return calibrated(estimator, calibration, cv_folds)
+
+
+def check_calibration(calibration):
+    """
+    Validate a calibration setting.
+    
+    Args:
+        calibration (str): 'sigmoid', 'isotonic' or None
+        
+    Returns:
+        str: The validated setting
+    """
+    if calibration not in CALIBRATION_METHODS:
+        raise ValueError(f"calibration must be one of {CALIBRATION_METHODS}, got {calibration!r}")
+    return calibration
+
+
+def _fit_task(shared, model_name, fold, estimator, train_idx, test_idx):
+    """
+    Fit one (model, fold) task on an executor worker.
+    
+    A fold of None means a fit on the full training set, which produces the
+    final model. Otherwise the fitted fold model is scored on its held-out rows.
+    """
+    X, y = shared['X'], shared['y']
+    if fold is None:
+        return model_name, fold, estimator.fit(X, y)
+    estimator.fit(_take_rows(X, train_idx), _take_rows(y, train_idx))
+    y_pred = estimator.predict(_take_rows(X, test_idx))
+    return model_name, fold, accuracy_score(_take_rows(y, test_idx), y_pred)
+
+
+def _fit_candidate(shared, estimator, train_idx, test_idx, scoring):
+    """Fit one grid candidate on one fold and return its held-out score."""
+    X, y = shared['X'], shared['y']
+    estimator.fit(_take_rows(X, train_idx), _take_rows(y, train_idx))
+    return get_scorer(scoring)(estimator, _take_rows(X, test_idx), _take_rows(y, test_idx))
+
+
+def _grow_forest_scores(shared, params, n_estimators_list, train_idx, test_idx, random_state):
+    """
+    Grow one forest on a fold with warm start and score it at every size.
+    
+    Trees added by a warm-started fit draw the same seeds as the matching
+    trees of an independent fit, so the scores equal fitting each size from scratch.
+    """
+    X, y = shared['X'], shared['y']
+    X_fold_train, y_fold_train = _take_rows(X, train_idx), _take_rows(y, train_idx)
+    X_fold_test, y_fold_test = _take_rows(X, test_idx), _take_rows(y, test_idx)
+    
+    forest = RandomForestClassifier(random_state=random_state, warm_start=True, **params)
+    scores = []
+    for n_estimators in n_estimators_list:
+        forest.set_params(n_estimators=n_estimators)
+        forest.fit(X_fold_train, y_fold_train)
+        scores.append(accuracy_score(y_fold_test, forest.predict(X_fold_test)))
+    return scores
+
+
 class BaselineModels:
     """
     Class to train and evaluate baseline classification models.
     """
     
-    def __init__(self, random_state=42):
+    def __init__(self, random_state=42, backend='process', backend_options=None,
+                 calibration='sigmoid'):
         """
         Initialize baseline models.
         
         Args:
             random_state (int): Random seed for reproducibility
+            backend (str): Executor for parallel training ('process', 'dask' or 'sequential')
+            backend_options (dict): Options for the executor, e.g. {'address': 'tcp://...'}
+            calibration (str): How the final SVM gets probabilities: 'sigmoid' or
+                'isotonic' calibration, or None for SVC(probability=True)
         """
         self.random_state = random_state
+        self.calibration = check_calibration(calibration)
+        self.backend = backend
+        self.backend_options = backend_options or {}
         self.models = {}
         self.results = []
         self.cv_results = {}
+        self.training_times = {}
+        self.task_timings = []
+    
+    def _build_baseline_estimators(self, kernel='rbf'):
+        """
+        Create unfitted baseline estimators with the same settings as the train_* methods.
+        
+        Args:
+            kernel (str): SVM kernel type
+            
+        Returns:
+            dict: {model_name: estimator}
+        """
+        return {
+            'Decision Tree': DecisionTreeClassifier(random_state=self.random_state),
+            'Random Forest': RandomForestClassifier(n_estimators=100, random_state=self.random_state),
+            'Logistic Regression': LogisticRegression(max_iter=1000, random_state=self.random_state),
+            'SVM': SVC(kernel=kernel, random_state=self.random_state)
+        }
         
     def train_decision_tree(self, X_train, y_train, cv_folds=5):
         """
@@ -153,8 +296,8 @@ class BaselineModels:
         print(f"Support Vector Machine (kernel={kernel})")
         print("="*60)
         
-        model = SVC(kernel=kernel, probability=True, random_state=self.random_state)
-        model.fit(X_train, y_train)
+        # Accuracy only needs the decision function, so CV skips probability estimation
+        model = SVC(kernel=kernel, random_state=self.random_state)
         
         # Cross-validation scores
         cv_scores = cross_val_score(model, X_train, y_train, cv=cv_folds, 
@@ -162,6 +305,9 @@ class BaselineModels:
         print(f"Cross-validation scores: {cv_scores}")
         print(f"Mean CV Accuracy: {cv_scores.mean():.4f} (+/- {cv_scores.std():.4f})")
         
+        model = with_probabilities(model, self.calibration, cv_folds)
+        model.fit(X_train, y_train)
+        
         self.models['SVM'] = model
         self.cv_results['SVM'] = {
             'cv_scores': cv_scores,
@@ -171,7 +317,7 @@ class BaselineModels:
         
         return {'model': model, 'cv_scores': cv_scores}
     
-    def train_all_baseline_models(self, X_train, y_train, cv_folds=5):
+    def train_all_baseline_models(self, X_train, y_train, cv_folds=5, parallel=False, cpu_budget=None):
         """
         Train all baseline models.
         
@@ -179,19 +325,150 @@ class BaselineModels:
             X_train (pd.DataFrame): Training features
             y_train (pd.Series): Training target
             cv_folds (int): Number of cross-validation folds
+            parallel (bool): Run every (model, fold) fit as a task on a process pool
+            cpu_budget (int): Maximum number of CPU cores to use in parallel mode
         """
+        if parallel:
+            self.train_all_parallel(X_train, y_train, cv_folds, cpu_budget=cpu_budget)
+            return
+        
+        start = time.perf_counter()
         self.train_decision_tree(X_train, y_train, cv_folds)
         self.train_random_forest(X_train, y_train, cv_folds)
         self.train_logistic_regression(X_train, y_train, cv_folds)
         self.train_svm(X_train, y_train, cv_folds, kernel='rbf')
+        self.training_times['sequential_wall_time'] = time.perf_counter() - start
+    
+    def train_all_parallel(self, X_train, y_train, cv_folds=5, cpu_budget=None, cv_rows=None):
+        """
+        Train all baseline models with shared cross-validation folds on the executor backend.
+        
+        One set of StratifiedKFold splits (the same folds cross_val_score uses)
+        is computed up front. Every (model, fold) fit and every final full-data
+        fit runs as an independent task, so the final model comes from the same
+        run instead of a separate sequential fit. The training data is shipped
+        to each worker once rather than with every task.
+        
+        Args:
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            cv_folds (int): Number of cross-validation folds
+            cpu_budget (int): Maximum number of CPU cores to use
+                (default: PREDICTIQ_CPU_BUDGET, else all cores)
+            cv_rows (np.ndarray): Row positions to cross-validate on, e.g. a
+                learning-curve subsample; final models still use all rows
+            
+        Returns:
+            dict: Wall-clock time, summed task time and estimated speedup
+        """
+        print("\n" + "="*60)
+        print("Parallel Baseline Training")
+        print("="*60)
+        
+        budget = ResourceBudget(cpu_budget) if cpu_budget else ResourceBudget.from_env(n_workers=1)
+        cpu_budget = budget.cpu_budget
+        if cv_rows is None:
+            splits = list(StratifiedKFold(n_splits=cv_folds).split(X_train, y_train))
+        else:
+            # Split the subsample, then map fold positions back to training-set rows
+            cv_rows = np.sort(cv_rows)
+            splits = [(cv_rows[train_idx], cv_rows[test_idx]) for train_idx, test_idx in
+                      StratifiedKFold(n_splits=cv_folds).split(cv_rows, _take_rows(y_train, cv_rows))]
+        estimators = self._build_baseline_estimators()
+        
+        tasks = []
+        for model_name, estimator in estimators.items():
+            # Only the final SVM gets probabilities; fold fits score accuracy on decision values
+            final = estimator
+            if model_name == 'SVM':
+                final = with_probabilities(estimator, self.calibration, cv_folds)
+            tasks.append((model_name, None, clone(final), None, None))
+            for fold, (train_idx, test_idx) in enumerate(splits):
+                tasks.append((model_name, fold, clone(estimator), train_idx, test_idx))
+        
+        # Split the core budget between worker processes and their native thread pools
+        n_workers = max(1, min(cpu_budget, len(tasks)))
+        threads_per_worker = max(1, cpu_budget // n_workers)
+        options = {'n_workers': n_workers, 'threads_per_worker': threads_per_worker}
+        if self.backend == 'sequential':
+            options = {}
+        options.update(self.backend_options)
+        print(f"Backend: {self.backend} | Tasks: {len(tasks)} | Workers: {n_workers} | "
+              f"Threads per worker: {threads_per_worker}")
+        
+        start = time.perf_counter()
+        fold_scores = {name: np.zeros(cv_folds) for name in estimators}
+        with get_executor(self.backend, **options) as executor:
+            outputs = executor.run(_fit_task, tasks, {'X': X_train, 'y': y_train})
+            self.task_timings = executor.timings
+        for model_name, fold, result in outputs:
+            if fold is None:
+                self.models[model_name] = result
+            else:
+                fold_scores[model_name][fold] = result
+        wall_time = time.perf_counter() - start
+        task_time = sum(timing['elapsed'] for timing in self.task_timings)
+        
+        for model_name, cv_scores in fold_scores.items():
+            print(f"\n{model_name}")
+            print(f"Cross-validation scores: {cv_scores}")
+            print(f"Mean CV Accuracy: {cv_scores.mean():.4f} (+/- {cv_scores.std():.4f})")
+            self.cv_results[model_name] = {
+                'cv_scores': cv_scores,
+                'mean_cv_score': cv_scores.mean(),
+                'std_cv_score': cv_scores.std()
+            }
+        
+        self.training_times.update({
+            'parallel_wall_time': wall_time,
+            'total_task_time': task_time,
+            'estimated_speedup': task_time / wall_time
+        })
+        print(f"\nWall-clock time: {wall_time:.2f}s | Summed fit time: {task_time:.2f}s | "
+              f"Speedup: {task_time / wall_time:.2f}x")
+        
+        return self.training_times
+    
+    def compare_training_speed(self, X_train, y_train, cv_folds=5, cpu_budget=None):
+        """
+        Time the sequential and parallel training paths on the same data.
+        
+        Args:
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            cv_folds (int): Number of cross-validation folds
+            cpu_budget (int): Maximum number of CPU cores for the parallel path
+            
+        Returns:
+            dict: Sequential and parallel wall-clock times and the speedup
+        """
+        self.train_all_baseline_models(X_train, y_train, cv_folds)
+        self.train_all_baseline_models(X_train, y_train, cv_folds, parallel=True,
+                                       cpu_budget=cpu_budget)
+        
+        sequential = self.training_times['sequential_wall_time']
+        parallel = self.training_times['parallel_wall_time']
+        print("\n" + "="*60)
+        print(f"Sequential: {sequential:.2f}s | Parallel: {parallel:.2f}s | "
+              f"Speedup: {sequential / parallel:.2f}x")
+        print("="*60)
+        
+        return {'sequential': sequential, 'parallel': parallel, 'speedup': sequential / parallel}
     
-    def evaluate_models(self, X_test, y_test):
+    def evaluate_models(self, X_test, y_test, keep_predictions=True, max_curve_points=200):
         """
         Evaluate all trained models on test set.
         
+        Metrics, confusion matrix and ROC / PR curves come from one sort of
+        each model's scores. Pass keep_predictions=False to store only the
+        compact summaries and down-sampled curves.
+        
         Args:
             X_test (pd.DataFrame): Test features
             y_test (pd.Series): Test target
+            keep_predictions (bool): Also store the raw y_pred and y_score (class-1
+                score) arrays, and y_pred_proba for models with predict_proba
+            max_curve_points (int): Maximum points kept per ROC / PR curve
             
         Returns:
             pd.DataFrame: Evaluation metrics for all models
@@ -206,44 +483,38 @@ class BaselineModels:
             print(f"\n{model_name}:")
             print("-" * 60)
             
-            # Predictions
+            # Predictions and class-1 scores (probability or decision function), computed once
             y_pred = model.predict(X_test)
+            y_pred_proba = model.predict_proba(X_test) if hasattr(model, 'predict_proba') else None
+            scores = y_pred_proba[:, 1] if y_pred_proba is not None else model.decision_function(X_test)
             
-            # Get probability predictions (for AUC)
-            if hasattr(model, 'predict_proba'):
-                y_pred_proba = model.predict_proba(X_test)
-            else:
-                y_pred_proba = model.decision_function(X_test)
-                y_pred_proba = np.column_stack([1 - y_pred_proba, y_pred_proba])
-            
-            # Calculate metrics
-            accuracy = accuracy_score(y_test, y_pred)
-            precision = precision_score(y_test, y_pred, zero_division=0)
-            recall = recall_score(y_test, y_pred, zero_division=0)
-            f1 = f1_score(y_test, y_pred, zero_division=0)
+            summary = evaluate_scores(y_test, scores, y_pred=y_pred,
+                                      max_curve_points=max_curve_points)
             
-            # ROC-AUC
-            try:
-                roc_auc = roc_auc_score(y_test, y_pred_proba[:, 1])
-            except:
-                roc_auc = roc_auc_score(y_test, y_pred)
+            print(f"Accuracy:  {summary['accuracy']:.4f}")
+            print(f"Precision: {summary['precision']:.4f}")
+            print(f"Recall:    {summary['recall']:.4f}")
+            print(f"F1-Score:  {summary['f1_score']:.4f}")
+            print(f"ROC-AUC:   {summary['roc_auc']:.4f}")
             
-            print(f"Accuracy:  {accuracy:.4f}")
-            print(f"Precision: {precision:.4f}")
-            print(f"Recall:    {recall:.4f}")
-            print(f"F1-Score:  {f1:.4f}")
-            print(f"ROC-AUC:   {roc_auc:.4f}")
-            
-            results.append({
+            result = {
                 'Model': model_name,
-                'Accuracy': accuracy,
-                'Precision': precision,
-                'Recall': recall,
-                'F1-Score': f1,
-                'ROC-AUC': roc_auc,
-                'y_pred': y_pred,
-                'y_pred_proba': y_pred_proba
-            })
+                'Accuracy': summary['accuracy'],
+                'Precision': summary['precision'],
+                'Recall': summary['recall'],
+                'F1-Score': summary['f1_score'],
+                'ROC-AUC': summary['roc_auc'],
+                'Average Precision': summary['average_precision'],
+                'Confusion Matrix': summary['confusion_matrix'],
+                'ROC Curve': summary['roc_curve'],
+                'PR Curve': summary['pr_curve']
+            }
+            if keep_predictions:
+                result['y_pred'] = y_pred
+                result['y_score'] = scores
+                # Decision-function margins are not probabilities, so they are not stored as such
+                result['y_pred_proba'] = y_pred_proba
+            results.append(result)
         
         self.results = pd.DataFrame(results)
         return self.results
@@ -297,26 +568,184 @@ class HyperparameterTuning:
     Class for hyperparameter tuning using GridSearchCV.
     """
     
-    def __init__(self, random_state=42, cv_folds=5):
+    # Default grids searched by the tune_* methods
+    PARAM_GRIDS = {
+        'Decision Tree': {
+            'max_depth': [5, 10, 15, 20],
+            'min_samples_split': [2, 5, 10],
+            'min_samples_leaf': [1, 2, 4]
+        },
+        'Random Forest': {
+            'n_estimators': [50, 100, 200],
+            'max_depth': [10, 20, 30],
+            'min_samples_split': [2, 5, 10],
+            'min_samples_leaf': [1, 2, 4]
+        },
+        'Logistic Regression': {
+            'C': [0.001, 0.01, 0.1, 1, 10],
+            'penalty': ['l2'],
+            'solver': ['lbfgs']
+        },
+        'SVM': {
+            'C': [0.1, 1, 10],
+            'kernel': ['rbf', 'poly'],
+            'gamma': ['scale', 'auto']
+        }
+    }
+    
+    # Search spaces and halving resources for the budgeted tuning engine
+    BUDGETED_SEARCH_SPACES = {
+        'Decision Tree': {
+            'param_space': {
+                'max_depth': [3, 5, 7, 10, 15, 20, None],
+                'min_samples_split': [2, 5, 10, 20],
+                'min_samples_leaf': [1, 2, 4, 8]
+            },
+            'resource': 'n_samples'
+        },
+        'Random Forest': {
+            'param_space': {
+                'max_depth': [10, 20, 30, None],
+                'min_samples_split': [2, 5, 10],
+                'min_samples_leaf': [1, 2, 4]
+            },
+            'resource': 'n_estimators',
+            'min_resource': 25,
+            'max_resource': 200
+        },
+        'Logistic Regression': {
+            'param_space': {'C': LogUniform(1e-3, 1e2)},
+            'resource': 'n_samples'
+        },
+        'SVM': {
+            'param_space': {
+                'C': LogUniform(1e-2, 1e2),
+                'kernel': ['rbf', 'poly'],
+                'gamma': ['scale', 'auto']
+            },
+            'resource': 'n_samples'
+        }
+    }
+    
+    def __init__(self, random_state=42, cv_folds=5, backend=None, backend_options=None,
+                 budget=None, calibration='sigmoid'):
         """
         Initialize hyperparameter tuning.
         
         Args:
             random_state (int): Random seed
             cv_folds (int): Number of cross-validation folds
+            backend (str): Executor for fit tasks ('process', 'dask' or 'sequential');
+                None runs GridSearchCV within the CPU budget
+            backend_options (dict): Options for the executor, e.g. {'address': 'tcp://...'}
+            budget (ResourceBudget): CPU budget for joblib workers and their
+                native thread pools (default: read from the environment)
+            calibration (str): How the tuned SVM gets probabilities: 'sigmoid' or
+                'isotonic' calibration, or None for SVC(probability=True)
         """
         self.random_state = random_state
+        self.calibration = check_calibration(calibration)
+        self._defer_probabilities = False
         self.cv_folds = cv_folds
+        self.budget = budget or ResourceBudget.from_env(n_workers=1)
+        self.backend = backend
+        self.backend_options = backend_options or {}
         self.best_models = {}
         self.grid_results = {}
+        self.task_timings = {}
+        self.subsample_results = {}
+        self._executor = None
+    
+    def _get_executor(self):
+        """Create the executor on first use and keep it for later searches."""
+        if self._executor is None:
+            # Sized to the CPU budget; explicit backend_options override it
+            options = budget_options(self.backend, self.budget)
+            options.update(self.backend_options)
+            self._executor = get_executor(self.backend, **options)
+        return self._executor
+    
+    def close(self):
+        """Shut down the executor backend, if one was started."""
+        if self._executor is not None:
+            self._executor.close()
+            self._executor = None
     
-    def tune_decision_tree(self, X_train, y_train):
+    def _build_cv_results(self, candidates, fold_scores):
+        """
+        Lay out per-fold scores the way GridSearchCV.cv_results_ does.
+        
+        Args:
+            candidates (list): Parameter dicts in ParameterGrid order
+            fold_scores (list): Per-fold score arrays, one per candidate
+            
+        Returns:
+            tuple: (cv_results dict, index of the best candidate)
+        """
+        cv_results = {'params': list(candidates)}
+        fold_scores = np.asarray(fold_scores)
+        cv_results['mean_test_score'] = fold_scores.mean(axis=1)
+        cv_results['std_test_score'] = fold_scores.std(axis=1)
+        for k in range(fold_scores.shape[1]):
+            cv_results[f'split{k}_test_score'] = fold_scores[:, k]
+        return cv_results, int(np.argmax(cv_results['mean_test_score']))
+    
+    def _run_grid_search(self, model_name, estimator, param_grid, X_train, y_train):
+        """
+        Run an exhaustive grid search with GridSearchCV or on the executor backend.
+        
+        With a backend, every (candidate, fold) fit is a task and the fold
+        data is shipped to each worker once. Candidate order, scores and
+        best-candidate selection match GridSearchCV.
+        
+        Args:
+            model_name (str): Name of the model
+            estimator: Unfitted sklearn estimator
+            param_grid (dict): Grid to search
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            
+        Returns:
+            GridSearchCV or SearchResult: Fitted search
+        """
+        if self.backend is None:
+            grid_search = GridSearchCV(estimator, param_grid, cv=self.cv_folds, 
+                                      scoring='accuracy', n_jobs=self.budget.n_jobs, verbose=1)
+            with self.budget.joblib_config():
+                grid_search.fit(X_train, y_train)
+            return grid_search
+        
+        start = time.perf_counter()
+        candidates = list(ParameterGrid(param_grid))
+        folds = list(StratifiedKFold(n_splits=self.cv_folds).split(X_train, y_train))
+        tasks = [(clone(estimator).set_params(**params), train_idx, test_idx, 'accuracy')
+                 for params in candidates
+                 for train_idx, test_idx in folds]
+        print(f"Fitting {len(folds)} folds for each of {len(candidates)} candidates, "
+              f"totalling {len(tasks)} fits on the '{self.backend}' backend")
+        
+        executor = self._get_executor()
+        scores = executor.run(_fit_candidate, tasks, {'X': X_train, 'y': y_train})
+        self.task_timings[model_name] = executor.timings
+        
+        fold_scores = np.asarray(scores).reshape(len(candidates), len(folds))
+        cv_results, best_index = self._build_cv_results(candidates, fold_scores)
+        time_to_best = time.perf_counter() - start
+        best_params = candidates[best_index]
+        best_estimator = clone(estimator).set_params(**best_params).fit(X_train, y_train)
+        
+        return SearchResult(best_params, cv_results['mean_test_score'][best_index],
+                            best_estimator, cv_results, len(tasks) + 1,
+                            time.perf_counter() - start, time_to_best)
+    
+    def tune_decision_tree(self, X_train, y_train, param_grid=None):
         """
         Tune Decision Tree hyperparameters.
         
         Args:
             X_train (pd.DataFrame): Training features
             y_train (pd.Series): Training target
+            param_grid (dict): Grid to search (default: PARAM_GRIDS entry)
             
         Returns:
             GridSearchCV: Best model
@@ -325,16 +754,10 @@ class HyperparameterTuning:
         print("Tuning Decision Tree Classifier")
         print("="*60)
         
-        param_grid = {
-            'max_depth': [5, 10, 15, 20],
-            'min_samples_split': [2, 5, 10],
-            'min_samples_leaf': [1, 2, 4]
-        }
+        param_grid = param_grid or self.PARAM_GRIDS['Decision Tree']
         
         dt = DecisionTreeClassifier(random_state=self.random_state)
-        grid_search = GridSearchCV(dt, param_grid, cv=self.cv_folds, 
-                                  scoring='accuracy', n_jobs=-1, verbose=1)
-        grid_search.fit(X_train, y_train)
+        grid_search = self._run_grid_search('Decision Tree', dt, param_grid, X_train, y_train)
         
         print(f"Best parameters: {grid_search.best_params_}")
         print(f"Best CV score: {grid_search.best_score_:.4f}")
@@ -344,32 +767,35 @@ class HyperparameterTuning:
         
         return grid_search
     
-    def tune_random_forest(self, X_train, y_train):
+    def tune_random_forest(self, X_train, y_train, param_grid=None, warm_start=False):
         """
         Tune Random Forest hyperparameters.
         
         Args:
             X_train (pd.DataFrame): Training features
             y_train (pd.Series): Training target
+            param_grid (dict): Grid to search (default: PARAM_GRIDS entry)
+            warm_start (bool): Grow forests incrementally per fold instead of
+                fitting every n_estimators value from scratch; the candidates,
+                scores and best parameters are identical to the default search
             
         Returns:
-            GridSearchCV: Best model
+            GridSearchCV or SearchResult: The fitted GridSearchCV, or with
+                warm_start a SearchResult exposing the same best_params_,
+                best_score_, best_estimator_ and cv_results_ plus n_fits_,
+                elapsed_time_ and time_to_best_
         """
         print("\n" + "="*60)
         print("Tuning Random Forest Classifier")
         print("="*60)
         
-        param_grid = {
-            'n_estimators': [50, 100, 200],
-            'max_depth': [10, 20, 30],
-            'min_samples_split': [2, 5, 10],
-            'min_samples_leaf': [1, 2, 4]
-        }
+        param_grid = param_grid or self.PARAM_GRIDS['Random Forest']
+        
+        if warm_start:
+            return self._tune_random_forest_warm_start(X_train, y_train, param_grid)
         
         rf = RandomForestClassifier(random_state=self.random_state)
-        grid_search = GridSearchCV(rf, param_grid, cv=self.cv_folds, 
-                                  scoring='accuracy', n_jobs=-1, verbose=1)
-        grid_search.fit(X_train, y_train)
+        grid_search = self._run_grid_search('Random Forest', rf, param_grid, X_train, y_train)
         
         print(f"Best parameters: {grid_search.best_params_}")
         print(f"Best CV score: {grid_search.best_score_:.4f}")
@@ -379,13 +805,90 @@ class HyperparameterTuning:
         
         return grid_search
     
-    def tune_logistic_regression(self, X_train, y_train):
+    def _tune_random_forest_warm_start(self, X_train, y_train, param_grid):
+        """
+        Grid search over a Random Forest grid, growing forests with warm start.
+        
+        For every (other parameters, fold) pair one forest is grown through
+        the sorted n_estimators values and scored at each size. Results,
+        candidate order and best-candidate selection match GridSearchCV.
+        
+        Args:
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            param_grid (dict): Grid including an 'n_estimators' list
+            
+        Returns:
+            SearchResult: Best model with GridSearchCV-style cv_results_;
+                time_to_best_ is the time until every candidate was scored,
+                since a grid only knows its best candidate at the end
+        """
+        start = time.perf_counter()
+        n_estimators_list = sorted(param_grid['n_estimators'])
+        base_grid = {k: v for k, v in param_grid.items() if k != 'n_estimators'}
+        base_candidates = list(ParameterGrid(base_grid))
+        folds = list(StratifiedKFold(n_splits=self.cv_folds).split(X_train, y_train))
+        
+        print(f"Growing {len(base_candidates) * len(folds)} forests to "
+              f"{n_estimators_list} trees with warm start")
+        
+        tasks = [(params, n_estimators_list, train_idx, test_idx, self.random_state)
+                 for params in base_candidates
+                 for train_idx, test_idx in folds]
+        shared = {'X': X_train, 'y': y_train}
+        if self.backend is None:
+            with self.budget.joblib_config():
+                fold_scores = Parallel(n_jobs=self.budget.n_jobs)(
+                    delayed(_grow_forest_scores)(shared, *task) for task in tasks)
+        else:
+            executor = self._get_executor()
+            fold_scores = executor.run(_grow_forest_scores, tasks, shared)
+            self.task_timings['Random Forest'] = executor.timings
+        
+        # scores[(candidate, n_estimators)] -> per-fold accuracy
+        scores = {}
+        for task, task_scores in enumerate(fold_scores):
+            base_idx, fold = divmod(task, len(folds))
+            for n_estimators, score in zip(n_estimators_list, task_scores):
+                scores.setdefault((base_idx, n_estimators), np.zeros(len(folds)))[fold] = score
+        
+        # Lay out candidates in the same order GridSearchCV would
+        candidates = list(ParameterGrid(param_grid))
+        candidate_scores = []
+        for params in candidates:
+            base_params = {k: v for k, v in params.items() if k != 'n_estimators'}
+            candidate_scores.append(scores[(base_candidates.index(base_params), params['n_estimators'])])
+        cv_results, best_index = self._build_cv_results(candidates, candidate_scores)
+        time_to_best = time.perf_counter() - start
+        best_params = cv_results['params'][best_index]
+        best_estimator = RandomForestClassifier(random_state=self.random_state, **best_params)
+        best_estimator.fit(X_train, y_train)
+        
+        n_fits = len(base_candidates) * len(folds) + 1
+        result = SearchResult(best_params, cv_results['mean_test_score'][best_index],
+                              best_estimator, cv_results, n_fits,
+                              time.perf_counter() - start, time_to_best)
+        
+        trees_independent = sum(n_estimators_list) * len(base_candidates) * len(folds)
+        trees_grown = max(n_estimators_list) * len(base_candidates) * len(folds)
+        print(f"Best parameters: {result.best_params_}")
+        print(f"Best CV score: {result.best_score_:.4f}")
+        print(f"Trees grown: {trees_grown} instead of {trees_independent} "
+              f"({trees_independent / trees_grown:.2f}x fewer) in {result.elapsed_time_:.2f}s")
+        
+        self.best_models['Random Forest'] = result.best_estimator_
+        self.grid_results['Random Forest'] = result
+        
+        return result
+    
+    def tune_logistic_regression(self, X_train, y_train, param_grid=None):
         """
         Tune Logistic Regression hyperparameters.
         
         Args:
             X_train (pd.DataFrame): Training features
             y_train (pd.Series): Training target
+            param_grid (dict): Grid to search (default: PARAM_GRIDS entry)
             
         Returns:
             GridSearchCV: Best model
@@ -394,16 +897,10 @@ class HyperparameterTuning:
         print("Tuning Logistic Regression")
         print("="*60)
         
-        param_grid = {
-            'C': [0.001, 0.01, 0.1, 1, 10],
-            'penalty': ['l2'],
-            'solver': ['lbfgs']
-        }
+        param_grid = param_grid or self.PARAM_GRIDS['Logistic Regression']
         
         lr = LogisticRegression(max_iter=1000, random_state=self.random_state)
-        grid_search = GridSearchCV(lr, param_grid, cv=self.cv_folds, 
-                                  scoring='accuracy', n_jobs=-1, verbose=1)
-        grid_search.fit(X_train, y_train)
+        grid_search = self._run_grid_search('Logistic Regression', lr, param_grid, X_train, y_train)
         
         print(f"Best parameters: {grid_search.best_params_}")
         print(f"Best CV score: {grid_search.best_score_:.4f}")
@@ -413,36 +910,377 @@ class HyperparameterTuning:
         
         return grid_search
     
-    def tune_svm(self, X_train, y_train):
+    def tune_svm(self, X_train, y_train, param_grid=None):
         """
         Tune SVM hyperparameters.
         
         Args:
             X_train (pd.DataFrame): Training features
             y_train (pd.Series): Training target
+            param_grid (dict): Grid to search (default: PARAM_GRIDS entry)
             
+        The search scores the decision function only (no per-fit Platt
+        scaling); the winning configuration is calibrated once afterwards.
+        
         Returns:
-            GridSearchCV: Best model
+            GridSearchCV: Search over the uncalibrated SVC; the calibrated
+                model is stored in best_models['SVM']
         """
         print("\n" + "="*60)
         print("Tuning Support Vector Machine")
         print("="*60)
         
-        param_grid = {
-            'C': [0.1, 1, 10],
-            'kernel': ['rbf', 'poly'],
-            'gamma': ['scale', 'auto']
-        }
+        param_grid = param_grid or self.PARAM_GRIDS['SVM']
         
-        svm = SVC(probability=True, random_state=self.random_state)
-        grid_search = GridSearchCV(svm, param_grid, cv=self.cv_folds, 
-                                  scoring='accuracy', n_jobs=-1, verbose=1)
-        grid_search.fit(X_train, y_train)
+        svm = SVC(random_state=self.random_state)
+        grid_search = self._run_grid_search('SVM', svm, param_grid, X_train, y_train)
         
         print(f"Best parameters: {grid_search.best_params_}")
         print(f"Best CV score: {grid_search.best_score_:.4f}")
         
-        self.best_models['SVM'] = grid_search.best_estimator_
+        self.best_models['SVM'] = self._calibrate(grid_search.best_estimator_, X_train, y_train)
         self.grid_results['SVM'] = grid_search
         
         return grid_search
+    
+    def _calibrate(self, estimator, X_train, y_train):
+        """
+        Refit a tuned SVC so it serves predict_proba.
+        
+        Args:
+            estimator: Fitted best estimator of the search
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            
+        Returns:
+            estimator: Fitted CalibratedClassifierCV or SVC(probability=True);
+                the estimator itself while tune_on_subsample defers the final fit
+        """
+        if self._defer_probabilities:
+            return estimator
+        
+        start = time.perf_counter()
+        model = with_probabilities(estimator, self.calibration, self.cv_folds).fit(X_train, y_train)
+        print(f"Calibrated best model ({self.calibration or 'probability=True'}) "
+              f"in {time.perf_counter() - start:.2f}s")
+        return model
+    
+    def _base_estimator(self, model_name):
+        """
+        Create the unfitted estimator each tune_* method starts from.
+        
+        Args:
+            model_name (str): Name of the model
+            
+        Returns:
+            estimator: Unfitted sklearn estimator
+        """
+        estimators = {
+            'Decision Tree': DecisionTreeClassifier(random_state=self.random_state),
+            'Random Forest': RandomForestClassifier(random_state=self.random_state),
+            'Logistic Regression': LogisticRegression(max_iter=1000, random_state=self.random_state),
+            'SVM': SVC(random_state=self.random_state)
+        }
+        return estimators[model_name]
+    
+    def tune_with_budget(self, model_name, X_train, y_train, max_fits=None, max_time=None):
+        """
+        Tune a model with budgeted successive halving instead of an exhaustive grid.
+        
+        Args:
+            model_name (str): 'Decision Tree', 'Random Forest', 'Logistic Regression' or 'SVM'
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            max_fits (int): Budget on the number of model fits
+            max_time (float): Budget on wall-clock seconds
+            
+        Returns:
+            SearchResult: Best model with time-to-best and fit counts
+        """
+        print("\n" + "="*60)
+        print(f"Budgeted Tuning - {model_name}")
+        print("="*60)
+        
+        search = SuccessiveHalvingSearch(
+            self._base_estimator(model_name),
+            cv=self.cv_folds,
+            max_fits=max_fits,
+            max_time=max_time,
+            random_state=self.random_state,
+            **self.BUDGETED_SEARCH_SPACES[model_name]
+        )
+        result = search.fit(X_train, y_train)
+        
+        print(f"Best parameters: {result.best_params_}")
+        print(f"Best CV score: {result.best_score_:.4f}")
+        print(f"Fits: {result.n_fits_} | Time: {result.elapsed_time_:.2f}s | "
+              f"Time to best: {result.time_to_best_:.2f}s")
+        
+        best_model = result.best_estimator_
+        if model_name == 'SVM':
+            best_model = self._calibrate(best_model, X_train, y_train)
+        self.best_models[model_name] = best_model
+        self.grid_results[model_name] = result
+        
+        return result
+    
+    def compare_search_cost(self, model_name, X_train, y_train, max_fits=None, max_time=None):
+        """
+        Compare exhaustive GridSearchCV against the budgeted engine for one model.
+        
+        Args:
+            model_name (str): Name of the model
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            max_fits (int): Fit budget for the budgeted search
+            max_time (float): Time budget for the budgeted search
+            
+        Returns:
+            dict: Score, fit count and time for both engines
+        """
+        tune_methods = {
+            'Decision Tree': self.tune_decision_tree,
+            'Random Forest': self.tune_random_forest,
+            'Logistic Regression': self.tune_logistic_regression,
+            'SVM': self.tune_svm
+        }
+        
+        start = time.perf_counter()
+        grid_search = tune_methods[model_name](X_train, y_train)
+        grid_time = time.perf_counter() - start
+        grid_fits = len(grid_search.cv_results_['params']) * self.cv_folds + 1
+        
+        result = self.tune_with_budget(model_name, X_train, y_train, max_fits, max_time)
+        
+        comparison = {
+            'grid_score': grid_search.best_score_,
+            'grid_fits': grid_fits,
+            'grid_time': grid_time,
+            'budgeted_score': result.best_score_,
+            'budgeted_fits': result.n_fits_,
+            'budgeted_time': result.elapsed_time_,
+            'budgeted_time_to_best': result.time_to_best_
+        }
+        
+        print("\n" + "="*60)
+        print(f"Search Cost Comparison - {model_name}")
+        print("="*60)
+        print(f"GridSearchCV: score={grid_search.best_score_:.4f} fits={grid_fits} time={grid_time:.2f}s")
+        print(f"Budgeted:     score={result.best_score_:.4f} fits={result.n_fits_} "
+              f"time={result.elapsed_time_:.2f}s (best found after {result.time_to_best_:.2f}s)")
+        
+        return comparison
+    
+    def _tune_methods(self):
+        """Tune method per model name, each called as method(X, y, param_grid=...)."""
+        return {
+            'Decision Tree': self.tune_decision_tree,
+            'Random Forest': lambda X, y, param_grid: self.tune_random_forest(
+                X, y, param_grid, warm_start=True),
+            'Logistic Regression': self.tune_logistic_regression,
+            'SVM': self.tune_svm
+        }
+    
+    def _final_row_fits(self, model_name, n_rows):
+        """Training rows used by the final fit, including the SVM's calibration folds."""
+        if model_name == 'SVM':
+            # SVC(probability=True) runs libsvm's internal 5-fold Platt scaling
+            return n_rows * (self.cv_folds if self.calibration else 5)
+        return n_rows
+    
+    def tune_on_subsample(self, model_name, X_train, y_train, param_grid=None, tolerance=0.005,
+                          min_size=200, max_fraction=0.5, patience=2):
+        """
+        Tune a model on the smallest training subsample where its learning curve plateaus.
+        
+        The default estimator is cross-validated on nested stratified subsamples
+        of geometrically growing size until the mean score stops improving by
+        more than `tolerance`. The grid is searched on that subsample and only
+        the winning configuration is refit (and, for the SVM, calibrated) on
+        the full training set.
+        
+        Args:
+            model_name (str): 'Decision Tree', 'Random Forest', 'Logistic Regression' or 'SVM'
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            param_grid (dict): Grid to search (default: PARAM_GRIDS entry)
+            tolerance (float): Score improvement that still counts as a plateau
+            min_size (int): Smallest subsample probed
+            max_fraction (float): Largest subsample probed, as a fraction of the rows
+            patience (int): Larger sizes that must confirm the plateau
+            
+        Returns:
+            GridSearchCV or SearchResult: Search run on the subsample; the
+                full-data model is stored in best_models[model_name]
+        """
+        n_rows = len(y_train)
+        
+        print("\n" + "="*60)
+        print(f"Learning Curve - {model_name}")
+        print("="*60)
+        start = time.perf_counter()
+        order = nested_stratified_order(y_train, self.random_state)
+        curve = build_learning_curve(self._base_estimator(model_name), X_train, y_train, order,
+                                     geometric_sizes(n_rows, min_size, max_fraction=max_fraction),
+                                     self.cv_folds, tolerance=tolerance, patience=patience)
+        size = curve['plateau_size'] or n_rows
+        rows = np.sort(order[:size])
+        
+        # Calibration only matters for the final model, which is fit on all rows
+        self._defer_probabilities = True
+        try:
+            search = self._tune_methods()[model_name](
+                _take_rows(X_train, rows), _take_rows(y_train, rows),
+                param_grid=param_grid or self.PARAM_GRIDS[model_name])
+        finally:
+            self._defer_probabilities = False
+        
+        final_start = time.perf_counter()
+        if model_name == 'SVM':
+            best_model = self._calibrate(search.best_estimator_, X_train, y_train)
+        else:
+            best_model = clone(search.best_estimator_).fit(X_train, y_train)
+        final_time = time.perf_counter() - final_start
+        self.best_models[model_name] = best_model
+        self.grid_results[model_name] = search
+        
+        n_candidates = len(search.cv_results_['params'])
+        self.subsample_results[model_name] = {
+            'subsample_size': size,
+            'n_rows': n_rows,
+            'learning_curve': curve,
+            'cv_score': search.best_score_,
+            'row_fits': (curve['row_fits'] + n_candidates * (self.cv_folds - 1) * size + size
+                         + self._final_row_fits(model_name, n_rows)),
+            'final_fit_time': final_time,
+            'elapsed': time.perf_counter() - start
+        }
+        print(f"Tuned on {size} of {n_rows} rows ({size / n_rows:.1%}); final fit on all rows "
+              f"in {final_time:.2f}s | total {self.subsample_results[model_name]['elapsed']:.2f}s")
+        
+        return search
+    
+    def compare_subsample_tuning(self, model_name, X_train, y_train, X_test, y_test,
+                                 param_grid=None, **subsample_options):
+        """
+        Compare full-data tuning against learning-curve subsample tuning for one model.
+        
+        Compute is reported as wall time and as training rows summed over
+        every fit (row-fits), which does not depend on the machine.
+        
+        Args:
+            model_name (str): Name of the model
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            X_test (pd.DataFrame): Test features
+            y_test (pd.Series): Test target
+            param_grid (dict): Grid to search (default: PARAM_GRIDS entry)
+            **subsample_options: Passed to tune_on_subsample
+            
+        Returns:
+            dict: Time, row-fits, CV score and test metrics for both approaches
+        """
+        param_grid = param_grid or self.PARAM_GRIDS[model_name]
+        n_rows = len(y_train)
+        
+        start = time.perf_counter()
+        full = self._tune_methods()[model_name](X_train, y_train, param_grid=param_grid)
+        full_time = time.perf_counter() - start
+        full_model = self.best_models[model_name]
+        full_rows = (len(full.cv_results_['params']) * (self.cv_folds - 1) * n_rows
+                     + self._final_row_fits(model_name, n_rows))
+        
+        self.tune_on_subsample(model_name, X_train, y_train, param_grid, **subsample_options)
+        subsample = self.subsample_results[model_name]
+        
+        def test_scores(model):
+            scores = model_scores(model, X_test)
+            return (accuracy_score(y_test, model.predict(X_test)), roc_auc_score(y_test, scores))
+        
+        full_accuracy, full_auc = test_scores(full_model)
+        sub_accuracy, sub_auc = test_scores(self.best_models[model_name])
+        comparison = {
+            'subsample_size': subsample['subsample_size'],
+            'full_time': full_time,
+            'subsample_time': subsample['elapsed'],
+            'full_row_fits': full_rows,
+            'subsample_row_fits': subsample['row_fits'],
+            'full_cv_score': full.best_score_,
+            'subsample_cv_score': subsample['cv_score'],
+            'full_test_accuracy': full_accuracy,
+            'subsample_test_accuracy': sub_accuracy,
+            'full_test_roc_auc': full_auc,
+            'subsample_test_roc_auc': sub_auc
+        }
+        
+        print("\n" + "="*60)
+        print(f"Subsample Tuning Comparison - {model_name}")
+        print("="*60)
+        print(f"Full data:  {full_time:8.2f}s  {full_rows:>14,} row-fits  "
+              f"test accuracy {full_accuracy:.4f}  ROC-AUC {full_auc:.4f}")
+        print(f"Subsample:  {subsample['elapsed']:8.2f}s  {subsample['row_fits']:>14,} row-fits  "
+              f"test accuracy {sub_accuracy:.4f}  ROC-AUC {sub_auc:.4f}")
+        print(f"Compute saved: {full_time / subsample['elapsed']:.1f}x wall time, "
+              f"{full_rows / subsample['row_fits']:.1f}x row-fits | "
+              f"accuracy difference {sub_accuracy - full_accuracy:+.4f}, "
+              f"ROC-AUC difference {sub_auc - full_auc:+.4f}")
+        
+        return comparison
+    
+    def compare_svm_calibration(self, X_train, y_train, X_test, y_test, param_grid=None,
+                                methods=('sigmoid', 'isotonic')):
+        """
+        Compare SVC(probability=True) tuning against search-then-calibrate.
+        
+        Both paths run the same grid. The legacy path pays for internal Platt
+        scaling in every fit; the decoupled path searches on the decision
+        function and calibrates the winner once per method.
+        
+        Args:
+            X_train (pd.DataFrame): Training features
+            y_train (pd.Series): Training target
+            X_test (pd.DataFrame): Test features
+            y_test (pd.Series): Test target
+            param_grid (dict): Grid to search (default: PARAM_GRIDS entry)
+            methods (tuple): Calibration methods for the decoupled path
+            
+        Returns:
+            pd.DataFrame: Wall time, Brier score, log loss and ROC-AUC per approach
+        """
+        param_grid = param_grid or self.PARAM_GRIDS['SVM']
+        
+        def quality(model):
+            proba = model.predict_proba(X_test)[:, 1]
+            return {'Brier Score': brier_score_loss(y_test, proba),
+                    'Log Loss': log_loss(y_test, proba),
+                    'ROC-AUC': roc_auc_score(y_test, proba)}
+        
+        rows = []
+        start = time.perf_counter()
+        legacy = self._run_grid_search('SVM', SVC(probability=True, random_state=self.random_state),
+                                       param_grid, X_train, y_train)
+        legacy_time = time.perf_counter() - start
+        rows.append({'Approach': 'SVC(probability=True)', 'Wall Time (s)': legacy_time,
+                     'Best Params': legacy.best_params_, **quality(legacy.best_estimator_)})
+        
+        start = time.perf_counter()
+        search = self._run_grid_search('SVM', SVC(random_state=self.random_state),
+                                       param_grid, X_train, y_train)
+        search_time = time.perf_counter() - start
+        for method in methods:
+            start = time.perf_counter()
+            model = calibrated(search.best_estimator_, method, self.cv_folds).fit(X_train, y_train)
+            rows.append({'Approach': f'Search + {method} calibration',
+                         'Wall Time (s)': search_time + time.perf_counter() - start,
+                         'Best Params': search.best_params_, **quality(model)})
+        
+        report = pd.DataFrame(rows)
+        print("\n" + "="*60)
+        print("SVM Calibration Comparison")
+        print("="*60)
+        print(report.drop(columns=['Best Params']).to_string(index=False, float_format='%.4f'))
+        for _, row in report.iloc[1:].iterrows():
+            print(f"{row['Approach']}: {legacy_time / row['Wall Time (s)']:.1f}x faster than "
+                  f"SVC(probability=True)")
+        
+        return report
@@ -0,0 +1,467 @@
+"""
+Online Learning Module for Disease PredictionIQ
+Folds newly labeled patients into the served model without a full retrain
+Author: Jay Prakash
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import StandardScaler
+
+from evaluation import evaluate_scores, model_scores
+
+CLASSES = np.array([0, 1])
+
+
+def create_sgd_model(random_state=42):
+    """
+    Create a linear model that supports incremental updates and probabilities.
+
+    Args:
+        random_state (int): Random seed
+
+    Returns:
+        SGDClassifier: Unfitted logistic-loss SGD classifier
+    """
+    return SGDClassifier(loss='log_loss', alpha=1e-4, random_state=random_state)
+
+
+def _write_pickle(obj, path):
+    """Pickle an object, replacing the destination atomically."""
+    with open(path + '.tmp', 'wb') as f:
+        pickle.dump(obj, f)
+    os.replace(path + '.tmp', path)
+
+
+def _write_json(obj, path):
+    """Write JSON, replacing the destination atomically."""
+    with open(path + '.tmp', 'w') as f:
+        json.dump(obj, f, indent=4)
+    os.replace(path + '.tmp', path)
+
+
+def _scaler_params(scaler, n_features):
+    """Mean and scale a fitted StandardScaler applies (identity where disabled)."""
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+    scale = scaler.scale_ if scaler.with_std else np.ones(n_features)
+    return np.array(mean, dtype=np.float64), np.array(scale, dtype=np.float64)
+
+
+def _first_layer(model):
+    """
+    The weights and bias applied to the scaled inputs, or None if the model has none.
+
+    Returns:
+        tuple: (weights of shape (n_features, n_out), bias of shape (n_out,)) as views
+            that can be updated in place
+    """
+    if hasattr(model, 'coefs_'):
+        return model.coefs_[0], model.intercepts_[0]
+    if hasattr(model, 'coef_') and hasattr(model, 'intercept_'):
+        return model.coef_.T, model.intercept_
+    return None
+
+
+def supports_restandardize(model):
+    """
+    Check whether a model's inputs can be re-standardized without changing its predictions.
+
+    True for unfitted models and for models whose first operation on the
+    scaled inputs is affine (MLPs and linear models such as SGDClassifier).
+
+    Args:
+        model: Estimator supporting partial_fit
+
+    Returns:
+        bool: True if OnlineLearner can update the scaler for this model
+    """
+    fitted = hasattr(model, 'coefs_') or hasattr(model, 'coef_') or hasattr(model, 'classes_')
+    return not fitted or _first_layer(model) is not None
+
+
+def restandardize(model, old_mean, old_scale, new_mean, new_scale):
+    """
+    Re-express a model's first layer for new scaler statistics, in place.
+
+    With z = (x - mean) / scale, the first layer computes W'z' + b on the new
+    scaling exactly as it computed Wz + b on the old one when
+    W'_j = W_j * new_scale_j / old_scale_j and
+    b' = b + sum_j W_j * (new_mean_j - old_mean_j) / old_scale_j,
+    so predictions on raw inputs do not change when the statistics move.
+
+    Args:
+        model: Fitted MLP or linear model
+        old_mean, old_scale (np.ndarray): Statistics the weights were learned with
+        new_mean, new_scale (np.ndarray): Updated statistics
+    """
+    weights, bias = _first_layer(model)
+    bias += ((new_mean - old_mean) / old_scale) @ weights
+    weights *= (new_scale / old_scale)[:, None]
+
+
+class OnlineLearner:
+    """
+    Incrementally update a model and its scaler with new labeled rows.
+
+    Supports any estimator with `partial_fit` (the MLP and SGD models). The
+    scaler statistics are updated with StandardScaler.partial_fit, which
+    merges running mean and variance. Moving the statistics would shift the
+    inputs under weights learned with the old ones, so the model's first
+    layer is re-standardized (see `restandardize`) before the rows are scaled
+    and passed to the model: only the gradient step changes predictions.
+    Models whose inputs cannot be re-standardized need update_scaler=False.
+    Versioned checkpoints are written every `checkpoint_every` rows under
+    `<models_dir>/versions/`.
+    """
+
+    def __init__(self, model, scaler, feature_names, models_dir='models',
+                 checkpoint_every=1000, update_scaler=True):
+        """
+        Initialize the learner.
+
+        Args:
+            model: Estimator supporting partial_fit (fitted or not)
+            scaler (StandardScaler): Fitted or unfitted scaler
+            feature_names (list): Feature names in model input order
+            models_dir (str): Directory holding model artifacts
+            checkpoint_every (int): Rows between automatic checkpoints (None to disable)
+            update_scaler (bool): Update scaler statistics with the new rows
+                (re-standardizing the model) instead of freezing them
+        """
+        if not hasattr(model, 'partial_fit'):
+            raise ValueError(f"{type(model).__name__} does not support incremental updates")
+        if update_scaler and not supports_restandardize(model):
+            raise ValueError(f"Cannot re-standardize {type(model).__name__} inputs; "
+                             f"use update_scaler=False to freeze the scaler")
+
+        self.model = model
+        self.scaler = scaler
+        self.feature_names = list(feature_names)
+        self.models_dir = models_dir
+        self.versions_dir = os.path.join(models_dir, 'versions')
+        self.checkpoint_every = checkpoint_every
+        self.update_scaler = update_scaler
+        self.rows_seen = 0
+        self.rows_since_checkpoint = 0
+        self.n_updates = 0
+        self.last_version = None
+
+    @classmethod
+    def from_artifacts(cls, models_dir='models', **kwargs):
+        """
+        Create a learner from the deployed model artifacts.
+
+        Args:
+            models_dir (str): Directory holding model artifacts
+            **kwargs: Passed to OnlineLearner
+
+        Returns:
+            OnlineLearner: Learner wrapping the served model and scaler
+        """
+        artifacts = {}
+        for name in ('best_heart_disease_model', 'scaler', 'feature_names'):
+            with open(os.path.join(models_dir, f'{name}.pkl'), 'rb') as f:
+                artifacts[name] = pickle.load(f)
+        return cls(artifacts['best_heart_disease_model'], artifacts['scaler'],
+                   artifacts['feature_names'], models_dir=models_dir, **kwargs)
+
+    def update(self, X_new, y_new):
+        """
+        Fold a batch of labeled rows into the scaler and the model.
+
+        Args:
+            X_new (pd.DataFrame or np.ndarray): New feature rows (unscaled)
+            y_new (array-like): Confirmed labels
+
+        Returns:
+            str: Path of the checkpoint written by this update, if any
+        """
+        if isinstance(X_new, pd.DataFrame):
+            X_new = X_new[self.feature_names]
+        X_new = np.asarray(X_new, dtype=np.float64)
+        y_new = np.asarray(y_new)
+
+        if self.update_scaler:
+            self._update_scaler(X_new)
+        self.model.partial_fit(self.scaler.transform(X_new), y_new, classes=CLASSES)
+
+        self.rows_seen += len(X_new)
+        self.rows_since_checkpoint += len(X_new)
+        self.n_updates += 1
+
+        if self.checkpoint_every and self.rows_since_checkpoint >= self.checkpoint_every:
+            return self.checkpoint()
+        return None
+
+    def _update_scaler(self, X_new):
+        """Merge the rows into the scaler statistics and re-standardize the model."""
+        if not hasattr(self.scaler, 'n_samples_seen_'):
+            self.scaler.partial_fit(X_new)
+            return
+        old_mean, old_scale = _scaler_params(self.scaler, X_new.shape[1])
+        self.scaler.partial_fit(X_new)
+        if _first_layer(self.model) is not None:
+            restandardize(self.model, old_mean, old_scale,
+                          *_scaler_params(self.scaler, X_new.shape[1]))
+
+    def _next_version(self):
+        if not os.path.isdir(self.versions_dir):
+            return 1
+        versions = [int(name[1:]) for name in os.listdir(self.versions_dir)
+                    if name.startswith('v') and name[1:].isdigit()]
+        return max(versions, default=0) + 1
+
+    def checkpoint(self):
+        """
+        Write the current model and scaler as a new versioned artifact.
+
+        Returns:
+            str: Directory of the new version
+        """
+        version = self._next_version()
+        version_dir = os.path.join(self.versions_dir, f'v{version:04d}')
+
+        # Written under a temporary name and renamed, so a version directory is never partial
+        staging_dir = version_dir + '.tmp'
+        os.makedirs(staging_dir, exist_ok=True)
+        _write_pickle(self.model, os.path.join(staging_dir, 'model.pkl'))
+        _write_pickle(self.scaler, os.path.join(staging_dir, 'scaler.pkl'))
+        _write_json({
+            'version': version,
+            'model_type': type(self.model).__name__,
+            'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'rows_seen': self.rows_seen,
+            'n_updates': self.n_updates,
+            'scaler_samples_seen': int(np.max(self.scaler.n_samples_seen_))
+        }, os.path.join(staging_dir, 'version.json'))
+        os.replace(staging_dir, version_dir)
+
+        self.last_version = version
+        self.rows_since_checkpoint = 0
+        print(f"✓ Checkpoint saved: {version_dir} ({self.rows_seen} new rows folded in)")
+        return version_dir
+
+    def promote(self, X_eval=None, y_eval=None):
+        """
+        Replace the served model and scaler with the current state.
+
+        The current state is checkpointed first if it has unsaved rows, so
+        the served model always matches a version that can be rolled back to.
+
+        Args:
+            X_eval (pd.DataFrame or np.ndarray): Held-out rows (unscaled) to refresh
+                the metadata's performance metrics, which are also stored with the
+                version; without them the served version has no metrics
+            y_eval (array-like): Labels of X_eval
+        """
+        if self.rows_since_checkpoint or self.last_version is None:
+            self.checkpoint()
+
+        metrics = None
+        if X_eval is not None:
+            if isinstance(X_eval, pd.DataFrame):
+                X_eval = X_eval[self.feature_names]
+            metrics = evaluate_served(self.model, self.scaler, X_eval, y_eval)
+        serve_version(self.models_dir, self.model, self.scaler, self.last_version, metrics)
+
+
+def evaluate_served(model, scaler, X_eval, y_eval):
+    """
+    Test metrics in the model_metadata.json format.
+
+    Args:
+        model: Fitted classifier
+        scaler (StandardScaler): Fitted scaler
+        X_eval (array-like): Held-out rows (unscaled)
+        y_eval (array-like): Labels
+
+    Returns:
+        dict: test_accuracy, test_precision, test_recall, test_f1_score and test_roc_auc
+    """
+    X_scaled = scaler.transform(np.asarray(X_eval, dtype=np.float64))
+    summary = evaluate_scores(y_eval, model_scores(model, X_scaled), y_pred=model.predict(X_scaled))
+    return {f'test_{name}': float(summary[name])
+            for name in ('accuracy', 'precision', 'recall', 'f1_score', 'roc_auc')}
+
+
+def serve_version(models_dir, model, scaler, version, metrics=None):
+    """
+    Install a model and scaler as the served artifacts and record it in the metadata.
+
+    Args:
+        models_dir (str): Directory holding model artifacts
+        model: Fitted classifier
+        scaler (StandardScaler): Fitted scaler
+        version (int): Checkpoint version being served
+        metrics (dict): Performance metrics of this version, stored with it; None
+            restores the ones stored earlier, if any
+
+    Metrics of the model being replaced are never carried over. A version
+    without known metrics is served without performance_metrics; those of
+    the trained base model stay under online_learning.base_performance_metrics.
+    """
+    _write_pickle(model, os.path.join(models_dir, 'best_heart_disease_model.pkl'))
+    _write_pickle(scaler, os.path.join(models_dir, 'scaler.pkl'))
+
+    metadata_path = os.path.join(models_dir, 'model_metadata.json')
+    metadata = {}
+    if os.path.exists(metadata_path):
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+    version_path = os.path.join(models_dir, 'versions', f'v{version:04d}', 'version.json')
+    with open(version_path, 'r') as f:
+        version_info = json.load(f)
+    if metrics is not None:
+        version_info['performance_metrics'] = metrics
+        _write_json(version_info, version_path)
+    metrics = version_info.get('performance_metrics')
+
+    online = metadata.get('online_learning', {})
+    base_creation_date = online.get('base_creation_date', metadata.get('creation_date'))
+    base_metrics = online.get('base_performance_metrics') if online \
+        else metadata.get('performance_metrics')
+    metadata['model_type'] = type(model).__name__
+    metadata['creation_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    metadata['online_learning'] = {
+        'version': version,
+        'base_creation_date': base_creation_date,
+        'base_performance_metrics': base_metrics,
+        'rows_seen': version_info['rows_seen'],
+        'n_updates': version_info['n_updates'],
+        'metrics_refreshed': metrics is not None
+    }
+    if metrics is not None:
+        metadata['performance_metrics'] = metrics
+    else:
+        metadata.pop('performance_metrics', None)
+    _write_json(metadata, metadata_path)
+    print(f"✓ Serving version v{version:04d} from {models_dir}")
+
+
+def rollback(models_dir, version, metrics=None):
+    """
+    Serve an earlier checkpoint again.
+
+    Args:
+        models_dir (str): Directory holding model artifacts
+        version (int): Checkpoint version to restore
+        metrics (dict): Performance metrics of that version; default: the ones
+            stored when it was promoted with held-out rows
+
+    Returns:
+        tuple: (model, scaler) of the restored version
+    """
+    version_dir = os.path.join(models_dir, 'versions', f'v{version:04d}')
+    if not os.path.isdir(version_dir):
+        raise ValueError(f"No checkpoint {version_dir}")
+    with open(os.path.join(version_dir, 'model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+    with open(os.path.join(version_dir, 'scaler.pkl'), 'rb') as f:
+        scaler = pickle.load(f)
+    serve_version(models_dir, model, scaler, version, metrics)
+    return model, scaler
+
+
+def benchmark_update_cost(df, model, target_column='heart_disease',
+                          sizes=(1000, 10000, 50000), batch_size=100, random_state=42):
+    """
+    Compare incremental update cost against a full retrain as the dataset grows.
+
+    Larger datasets are built by resampling rows of `df` with replacement.
+
+    Args:
+        df (pd.DataFrame): Labeled dataset
+        model: Estimator supporting partial_fit
+        target_column (str): Name of target column
+        sizes (tuple): Dataset sizes to benchmark
+        batch_size (int): Rows per incremental update
+        random_state (int): Random seed
+
+    Returns:
+        list: One dict per size with retrain and update times in seconds
+    """
+    rng = np.random.default_rng(random_state)
+    feature_names = [c for c in df.columns if c != target_column]
+
+    print("\n" + "="*60)
+    print(f"Incremental Update Benchmark - {type(model).__name__}")
+    print("="*60)
+    print(f"{'Rows':>10} {'Full retrain (s)':>18} {'Update (s)':>12} {'Ratio':>10}")
+
+    results = []
+    for size in sizes:
+        sample = df.iloc[rng.integers(0, len(df), size)]
+        X = sample[feature_names].to_numpy(dtype=np.float64)
+        y = sample[target_column].to_numpy()
+
+        start = time.perf_counter()
+        scaler = StandardScaler().fit(X)
+        retrained = clone(model).fit(scaler.transform(X), y)
+        retrain_time = time.perf_counter() - start
+
+        batch = df.iloc[rng.integers(0, len(df), batch_size)]
+        learner = OnlineLearner(retrained, scaler, feature_names, checkpoint_every=None)
+        start = time.perf_counter()
+        learner.update(batch[feature_names], batch[target_column])
+        update_time = time.perf_counter() - start
+
+        print(f"{size:>10} {retrain_time:>18.3f} {update_time:>12.4f} {retrain_time / update_time:>9.0f}x")
+        results.append({'rows': size, 'retrain_time': retrain_time,
+                        'update_time': update_time, 'ratio': retrain_time / update_time})
+
+    return results
+
+
+def main(argv=None):
+    """Command-line entry point: fold a CSV of newly labeled rows into the served model."""
+    parser = argparse.ArgumentParser(description='Incrementally update the served model')
+    parser.add_argument('labels', nargs='?', help='CSV with feature columns and the target column')
+    parser.add_argument('--models-dir', default='models')
+    parser.add_argument('--target-column', default='heart_disease')
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--checkpoint-every', type=int, default=1000)
+    parser.add_argument('--freeze-scaler', action='store_true',
+                        help='Keep scaler statistics fixed')
+    parser.add_argument('--promote', action='store_true',
+                        help='Replace the served model with the updated one')
+    parser.add_argument('--evaluate', metavar='CSV',
+                        help='Held-out labeled rows used to refresh the served metrics on promote')
+    parser.add_argument('--rollback', type=int, metavar='VERSION',
+                        help='Serve an earlier checkpoint instead of updating')
+    args = parser.parse_args(argv)
+
+    if args.rollback is not None:
+        rollback(args.models_dir, args.rollback)
+        return 0
+    if args.labels is None:
+        parser.error('labels CSV is required unless --rollback is given')
+
+    learner = OnlineLearner.from_artifacts(args.models_dir,
+                                           checkpoint_every=args.checkpoint_every,
+                                           update_scaler=not args.freeze_scaler)
+    for chunk in pd.read_csv(args.labels, chunksize=args.batch_size):
+        learner.update(chunk[learner.feature_names], chunk[args.target_column])
+
+    if learner.rows_since_checkpoint:
+        learner.checkpoint()
+    if args.promote:
+        if args.evaluate:
+            held_out = pd.read_csv(args.evaluate)
+            learner.promote(held_out[learner.feature_names], held_out[args.target_column])
+        else:
+            learner.promote()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""
+Report Builder Module for Disease PredictionIQ
+Renders the full report figure set headlessly across a process pool
+Author: Jay Prakash
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import matplotlib
+matplotlib.use('Agg')  # non-GUI backend, selected before pyplot is imported
+
+import numpy as np
+import pandas as pd
+
+import visualization
+from executors import budget_options, get_executor
+from source_hashing import source_digest
+
+# Continuous features drawn against the target as box plots
+TARGET_VS_FEATURES = ['age', 'resting_blood_pressure', 'cholesterol', 'max_heart_rate',
+                      'st_depression']
+
+COMPARISON_METRICS = ['Accuracy', 'Precision', 'Recall', 'F1-Score', 'ROC-AUC']
+
+MANIFEST_FILENAME = 'manifest.json'
+
+# What a plot actually draws from its input, for functions that summarise it;
+# keys built from these stay the same when the raw data changes in ways the
+# figure cannot show (e.g. row order)
+KEY_REDUCERS = {
+    ('plot_target_distribution', 'y'): lambda y: y.value_counts().sort_index(),
+    ('plot_correlation_heatmap', 'df'): lambda df: df.corr()
+}
+
+
+def _slug(name):
+    return name.lower().replace(' ', '_').replace('-', '_')
+
+
+def _update_digest(digest, value):
+    """Feed a plot input (frame, series, array, dict or scalar) into a hash."""
+    if isinstance(value, pd.DataFrame):
+        digest.update(json.dumps([list(map(str, value.columns)),
+                                  list(map(str, value.dtypes))]).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(json.dumps([str(value.name), str(value.dtype)]).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f'{value.dtype}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value, key=str):
+            digest.update(repr(key).encode())
+            _update_digest(digest, value[key])
+    else:
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode())
+
+
+def rendering_code_digest():
+    """Hash of visualization.py and every src/ module it imports, transitively."""
+    return source_digest(['visualization.py'])
+
+
+def figure_key(job, shared, input_digests=None, code_digest=None):
+    """
+    Cache key of one figure.
+
+    Covers the plotting function and its parameters, the content of every
+    input it reads (reduced to what the figure draws where KEY_REDUCERS says
+    so), and the rendering code (visualization.py and the src/ modules it
+    imports) and matplotlib version that render it.
+
+    Args:
+        job (FigureJob): Figure to key
+        shared (dict): Shared data from build_report_jobs
+        input_digests (dict): Memo of input hashes shared across jobs
+        code_digest (str): Precomputed rendering_code_digest(); hashed here if None
+
+    Returns:
+        str: Hex digest
+    """
+    input_digests = {} if input_digests is None else input_digests
+    code_digest = code_digest or rendering_code_digest()
+    inputs = {}
+    for name, key in sorted(job.inputs.items()):
+        memo_key = (job.function, name, key) if (job.function, name) in KEY_REDUCERS else key
+        if memo_key not in input_digests:
+            value = shared[key]
+            if (job.function, name) in KEY_REDUCERS:
+                value = KEY_REDUCERS[(job.function, name)](value)
+            digest = hashlib.sha256()
+            _update_digest(digest, value)
+            input_digests[memo_key] = digest.hexdigest()
+        inputs[name] = input_digests[memo_key]
+
+    payload = json.dumps({
+        'filename': job.filename,
+        'function': job.function,
+        'params': job.params,
+        'inputs': inputs,
+        'code': code_digest,
+        'matplotlib': matplotlib.__version__
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_manifest(output_dir):
+    """Read the report manifest, or an empty one if there is none yet."""
+    path = os.path.join(output_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return {'figures': {}}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_manifest(output_dir, manifest):
+    """Write the report manifest atomically."""
+    path = os.path.join(output_dir, MANIFEST_FILENAME)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+class FigureJob:
+    """
+    One figure to render: a visualization function, the shared inputs it
+    reads and its literal parameters.
+
+    Shared inputs are referenced by key so the data is sent to each worker
+    once rather than pickled with every job.
+    """
+
+    def __init__(self, filename, function, inputs=None, params=None):
+        """
+        Initialize the job.
+
+        Args:
+            filename (str): Output file name inside the report directory
+            function (str): Name of a plot_* function in visualization
+            inputs (dict): {argument name: key in the shared data}
+            params (dict): Literal keyword arguments
+        """
+        self.filename = filename
+        self.function = function
+        self.inputs = inputs or {}
+        self.params = params or {}
+
+    def __repr__(self):
+        return f"FigureJob({self.filename!r}, {self.function!r})"
+
+
+def build_report_jobs(df, target_column='heart_disease', evaluation=None):
+    """
+    List the figures of the report and the data they need.
+
+    Args:
+        df (pd.DataFrame): Dataset including the target column
+        target_column (str): Name of the target column
+        evaluation (dict): Optional model results with keys 'results'
+            (evaluate_models output with predictions), 'y_test' and
+            'feature_importance' ({feature: importance})
+
+    Returns:
+        tuple: (list of FigureJob, shared data dict)
+    """
+    features = df.drop(columns=[target_column])
+    shared = {'df': df, 'features': features, 'target': df[target_column]}
+    jobs = [
+        FigureJob('01_target_distribution.png', 'plot_target_distribution', {'y': 'target'}),
+        FigureJob('02_feature_distributions.png', 'plot_feature_distributions', {'df': 'features'}),
+        FigureJob('03_correlation_heatmap.png', 'plot_correlation_heatmap', {'df': 'df'})
+    ]
+    for feature in TARGET_VS_FEATURES:
+        if feature in df.columns:
+            jobs.append(FigureJob(f'04_feature_vs_target_{feature}.png', 'plot_target_vs_feature',
+                                  {'df': 'df'}, {'feature': feature, 'target': target_column}))
+
+    if evaluation is None:
+        return jobs, shared
+
+    results = evaluation['results']
+    shared['y_test'] = evaluation['y_test']
+    shared['roc_inputs'] = {row['Model']: {'y_test': evaluation['y_test'],
+                                           'y_score': row['y_score']}
+                            for _, row in results.iterrows()}
+    shared['metrics'] = results[['Model'] + COMPARISON_METRICS]
+    jobs.append(FigureJob('05_roc_curves.png', 'plot_roc_curves', {'results_dict': 'roc_inputs'}))
+    for _, row in results.iterrows():
+        key = f"y_pred:{row['Model']}"
+        shared[key] = row['y_pred']
+        jobs.append(FigureJob(f"06_confusion_matrix_{_slug(row['Model'])}.png",
+                              'plot_confusion_matrix', {'y_true': 'y_test', 'y_pred': key},
+                              {'model_name': row['Model']}))
+    for metric in COMPARISON_METRICS:
+        jobs.append(FigureJob(f'07_model_comparison_{_slug(metric)}.png', 'plot_model_comparison',
+                              {'results_df': 'metrics'}, {'metric': metric}))
+    if evaluation.get('feature_importance'):
+        shared['importance'] = evaluation['feature_importance']
+        jobs.append(FigureJob('08_feature_importance.png', 'plot_feature_importance',
+                              {'feature_importance_dict': 'importance'}))
+    return jobs, shared
+
+
+def _render_job(shared, job, output_dir):
+    """Render one figure on a worker without showing it."""
+    start = time.perf_counter()
+    visualization.setup_plot_style()
+    kwargs = {name: shared[key] for name, key in job.inputs.items()}
+    kwargs.update(job.params)
+    filepath = os.path.join(output_dir, job.filename)
+    getattr(visualization, job.function)(filepath=filepath, show=False, **kwargs)
+    return job.filename, time.perf_counter() - start
+
+
+def render_reports(jobs, shared, output_dir='reports', backend='process', n_workers=None,
+                   incremental=True):
+    """
+    Render figure jobs to output_dir, skipping figures whose inputs are unchanged.
+
+    A figure is skipped when the manifest records the same key for it and
+    the image still exists; its file is left untouched. The manifest is
+    updated with the key that produced every rendered image.
+
+    Args:
+        jobs (list): FigureJob list from build_report_jobs
+        shared (dict): Shared data from build_report_jobs
+        output_dir (str): Report directory
+        backend (str): Executor backend ('process', 'dask' or 'sequential')
+        n_workers (int): Worker processes (default: one per core of the CPU budget)
+        incremental (bool): Skip figures whose key matches the manifest;
+            False re-renders everything
+
+    Returns:
+        dict: {'wall_time', 'rendered', 'skipped', 'figure_times': {filename: seconds}}
+    """
+    visualization.ensure_reports_directory(output_dir)
+
+    start = time.perf_counter()
+    manifest = load_manifest(output_dir)
+    input_digests = {}
+    code_digest = rendering_code_digest()  # source files are hashed once per call
+    keys = {job.filename: figure_key(job, shared, input_digests, code_digest) for job in jobs}
+    pending = [job for job in jobs
+               if not incremental
+               or manifest['figures'].get(job.filename, {}).get('key') != keys[job.filename]
+               or not os.path.exists(os.path.join(output_dir, job.filename))]
+
+    rendered = []
+    if pending:
+        with get_executor(backend, **budget_options(backend, n_workers=n_workers)) as executor:
+            rendered = executor.run(_render_job, [(job, output_dir) for job in pending], shared)
+
+    functions = {job.filename: job.function for job in pending}
+    for filename, render_time in rendered:
+        manifest['figures'][filename] = {'key': keys[filename], 'function': functions[filename],
+                                         'render_time': round(render_time, 3),
+                                         'rendered_at': datetime.now().isoformat()}
+    save_manifest(output_dir, manifest)
+    wall_time = time.perf_counter() - start
+
+    figure_times = dict(rendered)
+    print(f"Rendered {len(pending)} of {len(jobs)} figures to {output_dir}/ in {wall_time:.2f}s "
+          f"on the '{backend}' backend ({len(jobs) - len(pending)} unchanged, "
+          f"summed render time {sum(figure_times.values()):.2f}s)")
+    return {'wall_time': wall_time, 'rendered': [job.filename for job in pending],
+            'skipped': [job.filename for job in jobs if job not in pending],
+            'figure_times': figure_times}
+
+
+def compare_rendering(jobs, shared, output_dir='reports', n_workers=None):
+    """
+    Time sequential rendering against the process pool on the same figure set.
+
+    Args:
+        jobs (list): FigureJob list from build_report_jobs
+        shared (dict): Shared data from build_report_jobs
+        output_dir (str): Report directory
+        n_workers (int): Worker processes for the parallel run
+
+    Returns:
+        dict: Sequential and parallel wall times and the speedup
+    """
+    print("\n" + "="*60)
+    print("Report Rendering Comparison")
+    print("="*60)
+    sequential = render_reports(jobs, shared, output_dir, backend='sequential',
+                                incremental=False)['wall_time']
+    parallel = render_reports(jobs, shared, output_dir, backend='process', n_workers=n_workers,
+                              incremental=False)['wall_time']
+    print(f"Sequential: {sequential:.2f}s | Parallel: {parallel:.2f}s | "
+          f"Speedup: {sequential / parallel:.2f}x")
+    return {'sequential': sequential, 'parallel': parallel, 'speedup': sequential / parallel}
+
+
+def evaluate_baselines(df, target_column='heart_disease', random_state=42):
+    """
+    Train the baseline models and collect the inputs of the model figures.
+
+    Args:
+        df (pd.DataFrame): Dataset including the target column
+        target_column (str): Name of the target column
+        random_state (int): Random seed
+
+    Returns:
+        dict: Evaluation inputs for build_report_jobs
+    """
+    from data_preprocessing import preprocess_data
+    from model_training import BaselineModels
+
+    X_train, X_test, y_train, y_test, feature_names, _ = preprocess_data(
+        df, target_column, random_state=random_state)
+    baseline = BaselineModels(random_state=random_state)
+    baseline.train_all_baseline_models(X_train, y_train)
+    results = baseline.evaluate_models(X_test, y_test, keep_predictions=True)
+    importance = baseline.get_feature_importance('Random Forest')
+    return {'results': results, 'y_test': np.asarray(y_test),
+            'feature_importance': dict(zip(feature_names, importance))}
+
+
+def main(argv=None):
+    """Command-line entry point for the report builder."""
+    parser = argparse.ArgumentParser(description='Render the report figures headlessly')
+    parser.add_argument('--data', default='heart_disease_dataset.csv')
+    parser.add_argument('--output', default='reports')
+    parser.add_argument('--target', default='heart_disease')
+    parser.add_argument('--backend', choices=['sequential', 'process', 'dask'], default='process')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--with-models', action='store_true',
+                        help='Train the baseline models and add ROC, confusion matrix, '
+                             'comparison and feature importance figures')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-render every figure even if its inputs are unchanged')
+    parser.add_argument('--compare', action='store_true',
+                        help='Time sequential against parallel rendering')
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.data)
+    evaluation = evaluate_baselines(df, args.target) if args.with_models else None
+    jobs, shared = build_report_jobs(df, args.target, evaluation)
+
+    if args.compare:
+        compare_rendering(jobs, shared, args.output, args.workers)
+    else:
+        render_reports(jobs, shared, args.output, args.backend, args.workers,
+                       incremental=not args.force)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""
+Resource Budget Module for Disease PredictionIQ
+One CPU budget shared by joblib workers and native BLAS/OpenMP thread pools
+Author: Jay Prakash
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from threadpoolctl import threadpool_limits
+
+# Native thread pools read these when the library is first loaded
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                   'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS')
+
+BUDGET_ENV_VAR = 'PREDICTIQ_CPU_BUDGET'
+WORKERS_ENV_VAR = 'PREDICTIQ_WORKERS'
+
+
+def available_cpus():
+    """Number of cores this process may run on (respects CPU affinity)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class ResourceBudget:
+    """
+    Split a CPU budget between the processes or threads that share it.
+
+    Every caller (a training job, a FastAPI process, a gunicorn worker)
+    gets `cpu_budget // n_workers` cores. That share sizes both its native
+    BLAS/OpenMP pools and the number of joblib workers it may start, and the
+    joblib workers themselves run single-threaded, so nested parallelism
+    never exceeds the budget.
+    """
+
+    def __init__(self, cpu_budget=None, n_workers=1):
+        """
+        Initialize the budget.
+
+        Args:
+            cpu_budget (int): Cores available to the whole deployment or job
+                (default: all cores this process may use)
+            n_workers (int): Concurrent workers sharing the budget
+        """
+        self.cpu_budget = max(1, min(cpu_budget or available_cpus(), available_cpus()))
+        self.n_workers = max(1, n_workers)
+
+    @classmethod
+    def from_env(cls, n_workers=None):
+        """
+        Read the budget from the environment.
+
+        PREDICTIQ_CPU_BUDGET sets the cores; PREDICTIQ_WORKERS (falling back to
+        WEB_CONCURRENCY, which gunicorn and uvicorn also read) sets the workers.
+
+        Args:
+            n_workers (int): Override for the number of workers
+
+        Returns:
+            ResourceBudget: Budget for this process
+        """
+        cpu_budget = int(os.environ.get(BUDGET_ENV_VAR, 0)) or None
+        if n_workers is None:
+            n_workers = int(os.environ.get(WORKERS_ENV_VAR) or
+                            os.environ.get('WEB_CONCURRENCY') or 1)
+        return cls(cpu_budget, n_workers)
+
+    @property
+    def threads_per_worker(self):
+        """Cores each worker may use."""
+        return max(1, self.cpu_budget // self.n_workers)
+
+    @property
+    def n_jobs(self):
+        """joblib workers this process may start, each running single-threaded."""
+        return self.threads_per_worker
+
+    def apply_env(self):
+        """
+        Export the thread limits so native libraries loaded later, and any
+        child processes, size their pools to the budget.
+        """
+        for name in THREAD_ENV_VARS:
+            os.environ[name] = str(self.threads_per_worker)
+        # joblib/loky use this as the machine's core count for n_jobs=-1
+        os.environ['LOKY_MAX_CPU_COUNT'] = str(self.threads_per_worker)
+
+    def limit_threads(self):
+        """Resize the thread pools of native libraries that are already loaded."""
+        return threadpool_limits(limits=self.threads_per_worker)
+
+    def apply(self):
+        """
+        Apply the budget to this process.
+
+        Call before numpy is imported where possible; pools that are already
+        loaded are resized with threadpoolctl.
+
+        Returns:
+            ResourceBudget: self
+        """
+        self.apply_env()
+        self.limit_threads()
+        return self
+
+    @contextmanager
+    def joblib_config(self):
+        """Run joblib code with `n_jobs` workers, each limited to one native thread."""
+        from joblib import parallel_config
+
+        with parallel_config(backend='loky', n_jobs=self.n_jobs, inner_max_num_threads=1):
+            yield
+
+    def __repr__(self):
+        return (f"ResourceBudget(cpu_budget={self.cpu_budget}, n_workers={self.n_workers}, "
+                f"threads_per_worker={self.threads_per_worker})")
+
+
+def _throughput_worker(duration, size, start_event, results):
+    """Run dense batch products until `duration` elapses and report the count."""
+    import numpy as np
+
+    rng = np.random.default_rng(os.getpid())
+    X = rng.standard_normal((size, size))
+    W = rng.standard_normal((size, size))
+    start_event.wait()
+
+    n_ops = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        np.tanh(X @ W)
+        n_ops += 1
+    results.put(n_ops)
+
+
+def _run_workers(n_workers, duration, size, env):
+    """Start `n_workers` processes with the given thread environment and sum their work."""
+    ctx = multiprocessing.get_context('spawn')
+    start_event = ctx.Event()
+    results = ctx.Queue()
+
+    saved = {name: os.environ.get(name) for name in env}
+    try:
+        for name, value in env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        workers = [ctx.Process(target=_throughput_worker,
+                               args=(duration, size, start_event, results))
+                   for _ in range(n_workers)]
+        for worker in workers:
+            worker.start()
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    # Let every worker import numpy and build its inputs before timing starts
+    time.sleep(2.0)
+    start_event.set()
+    total_ops = sum(results.get() for _ in workers)
+    for worker in workers:
+        worker.join()
+    return total_ops
+
+
+def benchmark_worker_throughput(n_workers=4, cpu_budget=None, duration=5.0, size=512):
+    """
+    Compare throughput of concurrent workers with and without the budget.
+
+    Simulates several server workers running BLAS-heavy batches at once.
+    Unbounded workers each size their BLAS pool to every core; budgeted
+    workers share the cores.
+
+    Args:
+        n_workers (int): Concurrent worker processes
+        cpu_budget (int): Cores to share (default: all)
+        duration (float): Seconds each worker runs
+        size (int): Matrix size of one batch product
+
+    Returns:
+        dict: Operations per second for 'unbounded' and 'budgeted' runs
+    """
+    budget = ResourceBudget(cpu_budget, n_workers)
+
+    print("\n" + "="*60)
+    print("Worker Throughput Benchmark")
+    print("="*60)
+    print(f"{budget} | batch size {size}x{size} | {duration:.0f}s per run")
+
+    unbounded_env = {name: None for name in THREAD_ENV_VARS}
+    budgeted_env = {name: str(budget.threads_per_worker) for name in THREAD_ENV_VARS}
+
+    results = {}
+    for label, env in (('unbounded', unbounded_env), ('budgeted', budgeted_env)):
+        ops = _run_workers(n_workers, duration, size, env)
+        results[label] = ops / duration
+        print(f"{label:>10}: {results[label]:8.1f} batches/s")
+
+    print(f"Speedup with budget: {results['budgeted'] / results['unbounded']:.2f}x")
+    return results
+
+
+def main(argv=None):
+    """Command-line entry point for the throughput benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark CPU budgeting for concurrent workers')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--cpu-budget', type=int, default=None)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--size', type=int, default=512)
+    args = parser.parse_args(argv)
+
+    benchmark_worker_throughput(args.workers, args.cpu_budget, args.duration, args.size)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Source Hashing Module for Disease PredictionIQ
+Content hashes of project modules and their transitive src/ imports, used in cache keys
+Author: Jay Prakash
+"""
+
+import ast
+import hashlib
+import os
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def hash_file(filepath, chunk_size=1 << 20):
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Args:
+        filepath (str): Path to the file
+        chunk_size (int): Bytes read per iteration
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _imported_modules(filepath):
+    """Top-level names of every absolute import in a file, including function-level imports."""
+    with open(filepath, 'rb') as f:
+        tree = ast.parse(f.read(), filename=filepath)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split('.')[0])
+    return names
+
+
+def module_closure(filenames, src_dir=SRC_DIR):
+    """
+    Source files of the given modules and every src/ module they import, transitively.
+
+    Args:
+        filenames (list): Entry module filenames in src_dir, e.g. ['model_training.py']
+        src_dir (str): Directory of the project modules
+
+    Returns:
+        list: Sorted filenames of the closure
+    """
+    seen = set()
+    pending = list(filenames)
+    while pending:
+        filename = pending.pop()
+        if filename in seen:
+            continue
+        seen.add(filename)
+        for name in _imported_modules(os.path.join(src_dir, filename)):
+            if os.path.exists(os.path.join(src_dir, name + '.py')):
+                pending.append(name + '.py')
+    return sorted(seen)
+
+
+def source_digest(filenames, src_dir=SRC_DIR):
+    """
+    Hash of the given modules and their transitive src/ imports.
+
+    Args:
+        filenames (list): Entry module filenames in src_dir
+        src_dir (str): Directory of the project modules
+
+    Returns:
+        str: Hex digest that changes when any file of the closure changes
+    """
+    digest = hashlib.sha256()
+    for filename in module_closure(filenames, src_dir):
+        digest.update(filename.encode())
+        digest.update(hash_file(os.path.join(src_dir, filename)).encode())
+    return digest.hexdigest()
@@ -0,0 +1,128 @@
+"""
+Static Assets Module for Disease PredictionIQ
+Serves static files under content-fingerprinted URLs with long-lived caching and precompressed variants
+Author: Jay Prakash
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ASSET_URL_PREFIX = '/assets'
+
+# A fingerprinted URL never changes content, so clients may keep it for a year
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+# Below this size the compressed variant saves less than the header overhead
+MIN_COMPRESS_BYTES = 1024
+
+FINGERPRINT_LENGTH = 12
+
+_FINGERPRINTED = re.compile(r'^(?P<stem>.+)\.(?P<digest>[0-9a-f]{%d})(?P<ext>\.[^./]+)$'
+                            % FINGERPRINT_LENGTH)
+
+
+class StaticAsset:
+    """One static file held in memory with its precompressed variants."""
+
+    def __init__(self, filename, content):
+        """
+        Fingerprint and precompress a file.
+
+        Args:
+            filename (str): Path relative to the static directory, with '/' separators
+            content (bytes): File contents
+        """
+        self.filename = filename
+        self.digest = hashlib.sha256(content).hexdigest()[:FINGERPRINT_LENGTH]
+        self.mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+        stem, ext = os.path.splitext(filename)
+        self.fingerprinted = f"{stem}.{self.digest}{ext}"
+
+        # Variants in server preference order; identity is always last
+        self.variants = {}
+        if len(content) >= MIN_COMPRESS_BYTES and self.mimetype.startswith(COMPRESSIBLE_TYPES):
+            if brotli is not None:
+                self.variants['br'] = brotli.compress(content, quality=11)
+            self.variants['gzip'] = gzip.compress(content, compresslevel=9, mtime=0)
+        self.variants['identity'] = content
+
+
+class AssetManifest:
+    """
+    Fingerprinted URLs for every file under a static directory.
+
+    Files are read, hashed and compressed once when the manifest is built,
+    so serving an asset is a dictionary lookup.
+    """
+
+    def __init__(self, static_dir):
+        """
+        Build the manifest.
+
+        Args:
+            static_dir (str): Directory holding the static files
+        """
+        self.static_dir = static_dir
+        self.assets = {}
+        for dirpath, _, filenames in os.walk(static_dir):
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                filename = os.path.relpath(path, static_dir).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    self.assets[filename] = StaticAsset(filename, f.read())
+
+    def url(self, filename):
+        """
+        Fingerprinted URL of a static file.
+
+        Args:
+            filename (str): Path relative to the static directory
+
+        Returns:
+            str: '/assets/<stem>.<digest><ext>', or the plain /static URL for unknown files
+        """
+        asset = self.assets.get(filename)
+        if asset is None:
+            return f"/static/{filename}"
+        return f"{ASSET_URL_PREFIX}/{asset.fingerprinted}"
+
+    def lookup(self, fingerprinted):
+        """
+        Resolve a fingerprinted path.
+
+        Args:
+            fingerprinted (str): Path after the /assets/ prefix
+
+        Returns:
+            tuple: (StaticAsset, current) where current is False when the
+                digest is stale (a page rendered before a deploy), or
+                (None, False) for unknown files
+        """
+        match = _FINGERPRINTED.match(fingerprinted)
+        if not match:
+            return None, False
+        asset = self.assets.get(match.group('stem') + match.group('ext'))
+        if asset is None:
+            return None, False
+        return asset, asset.digest == match.group('digest')
+
+    def summary(self):
+        """
+        Sizes of every asset and variant.
+
+        Returns:
+            dict: {filename: {encoding: bytes}}
+        """
+        return {filename: {encoding: len(body) for encoding, body in asset.variants.items()}
+                for filename, asset in self.assets.items()}
@@ -0,0 +1,332 @@
+"""
+Synthetic Data Module for Disease PredictionIQ
+Generates large schema-faithful synthetic patient datasets for load and scaling tests
+Author: Jay Prakash
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+from scipy.stats import rankdata
+
+from data_preprocessing import DATASET_SCHEMA
+from executors import budget_options, get_executor
+
+OUTPUT_FORMATS = ('csv', 'parquet', 'npy')
+
+# Columns with at most this many distinct values are sampled as categories;
+# wider columns are interpolated between observed values
+MAX_DISCRETE_LEVELS = 10
+
+
+def _decimals(values, max_decimals=6):
+    """Number of decimal places needed to write every value exactly."""
+    for decimals in range(max_decimals + 1):
+        scaled = values * 10 ** decimals
+        if np.allclose(scaled, np.round(scaled)):
+            return decimals
+    return max_decimals
+
+
+def _normal_scores(values):
+    """Map values to standard normal scores through their mid-ranks."""
+    return ndtri(rankdata(values) / (len(values) + 1))
+
+
+def _nearest_correlation(corr, eps=1e-6):
+    """Clip negative eigenvalues so the correlation matrix has a Cholesky factor."""
+    eigenvalues, eigenvectors = np.linalg.eigh(corr)
+    fixed = eigenvectors @ np.diag(np.maximum(eigenvalues, eps)) @ eigenvectors.T
+    scale = np.sqrt(np.diag(fixed))
+    return fixed / np.outer(scale, scale)
+
+
+class SyntheticDataGenerator:
+    """
+    Per-class Gaussian copula fitted to the patient dataset.
+
+    Each class keeps the empirical marginal of every feature and the
+    correlation of their normal scores. Sampling draws correlated normals,
+    maps them to uniforms and back through the marginals, so synthetic rows
+    keep the value ranges, category levels, resolution and pairwise
+    dependence of the source, and the class balance is reproduced exactly.
+    """
+
+    def __init__(self, target_column='heart_disease', schema=None):
+        """
+        Initialize the generator.
+
+        Args:
+            target_column (str): Name of the class column
+            schema (dict): Output dtypes per column (default: DATASET_SCHEMA)
+        """
+        self.target_column = target_column
+        self.schema = dict(DATASET_SCHEMA if schema is None else schema)
+        self.columns = None
+        self.feature_columns = None
+        self.classes = None
+
+    def fit(self, df):
+        """
+        Learn class priors, marginals and normal-score correlations.
+
+        Args:
+            df (pd.DataFrame): Source dataset
+
+        Returns:
+            SyntheticDataGenerator: self
+        """
+        df = df.dropna()
+        self.columns = list(df.columns)
+        self.feature_columns = [c for c in self.columns if c != self.target_column]
+
+        self.resolution = {}
+        for column in self.feature_columns:
+            values = df[column].to_numpy(dtype=np.float64)
+            self.resolution[column] = _decimals(values)
+            self.schema.setdefault(column, 'float64' if self.resolution[column] else 'int64')
+        self.schema.setdefault(self.target_column, 'int64')
+
+        labels = df[self.target_column].to_numpy()
+        self.classes = {}
+        for label in np.unique(labels):
+            subset = df.loc[labels == label, self.feature_columns].to_numpy(dtype=np.float64)
+            marginals = []
+            for j in range(subset.shape[1]):
+                levels, counts = np.unique(subset[:, j], return_counts=True)
+                marginals.append({'values': np.sort(subset[:, j]), 'levels': levels,
+                                  'cdf': np.cumsum(counts) / counts.sum()})
+
+            scores = np.column_stack([_normal_scores(subset[:, j]) for j in range(subset.shape[1])])
+            corr = np.nan_to_num(np.corrcoef(scores, rowvar=False))
+            np.fill_diagonal(corr, 1.0)
+            self.classes[label] = {
+                'prior': len(subset) / len(df),
+                'marginals': marginals,
+                'cholesky': np.linalg.cholesky(_nearest_correlation(corr))
+            }
+
+        print(f"Fitted Gaussian copula on {len(df)} rows, {len(self.feature_columns)} features, "
+              f"{len(self.classes)} classes")
+        return self
+
+    def _class_counts(self, n_rows):
+        """Split n_rows across classes in proportion to the priors (largest remainder)."""
+        labels = list(self.classes)
+        expected = np.array([self.classes[label]['prior'] for label in labels]) * n_rows
+        counts = np.floor(expected).astype(np.int64)
+        remainder = n_rows - counts.sum()
+        counts[np.argsort(counts - expected)[:remainder]] += 1
+        return dict(zip(labels, counts))
+
+    def _inverse_marginal(self, column, marginal, u):
+        """Map uniforms to values of one column through its empirical marginal."""
+        levels = marginal['levels']
+        if len(levels) <= MAX_DISCRETE_LEVELS:
+            index = np.minimum(np.searchsorted(marginal['cdf'], u), len(levels) - 1)
+            return levels[index]
+
+        values = marginal['values']
+        positions = u * (len(values) - 1)
+        return np.round(np.interp(positions, np.arange(len(values)), values),
+                        self.resolution[column])
+
+    def sample(self, n_rows, random_state=None):
+        """
+        Draw synthetic rows.
+
+        Args:
+            n_rows (int): Number of rows
+            random_state (int, np.random.SeedSequence or np.random.Generator): Seed
+
+        Returns:
+            pd.DataFrame: Rows with the source columns and schema dtypes
+        """
+        if self.classes is None:
+            raise ValueError("Generator is not fitted. Call fit() first.")
+        rng = np.random.default_rng(random_state)
+
+        blocks, labels = [], []
+        for label, count in self._class_counts(n_rows).items():
+            params = self.classes[label]
+            z = rng.standard_normal((count, len(self.feature_columns))) @ params['cholesky'].T
+            u = ndtr(z)
+            blocks.append(np.column_stack([
+                self._inverse_marginal(column, params['marginals'][j], u[:, j])
+                for j, column in enumerate(self.feature_columns)
+            ]) if count else np.empty((0, len(self.feature_columns))))
+            labels.append(np.full(count, label))
+
+        order = rng.permutation(n_rows)
+        features = np.concatenate(blocks)[order]
+        target = np.concatenate(labels)[order]
+
+        data = {column: features[:, j].astype(self.schema[column])
+                for j, column in enumerate(self.feature_columns)}
+        data[self.target_column] = target.astype(self.schema[self.target_column])
+        return pd.DataFrame({column: data[column] for column in self.columns})
+
+    def float_format(self):
+        """printf format that writes the finest column resolution exactly."""
+        return f'%.{max(self.resolution.values())}f' if any(self.resolution.values()) else None
+
+
+def _part_path(output_dir, index, fmt):
+    name = f'part-{index:05d}'
+    return os.path.join(output_dir, name if fmt == 'npy' else f'{name}.{fmt}')
+
+
+def _write_chunk(shared, index, n_rows, seed):
+    """Generate one chunk on a worker and write it as its own part."""
+    generator = shared['generator']
+    chunk = generator.sample(n_rows, np.random.default_rng(seed))
+    path = _part_path(shared['output_dir'], index, shared['fmt'])
+
+    if shared['fmt'] == 'csv':
+        # Headerless parts, so they can be concatenated into one file
+        chunk.to_csv(path, index=False, header=False, float_format=generator.float_format())
+    elif shared['fmt'] == 'parquet':
+        chunk.to_parquet(path, index=False)
+    else:
+        # One .npy per column, in the layout of the memmap and column caches
+        os.makedirs(path, exist_ok=True)
+        for column in chunk.columns:
+            np.save(os.path.join(path, f'{column}.npy'), chunk[column].to_numpy())
+    return path, n_rows, int(chunk[generator.target_column].sum())
+
+
+def generate_dataset(generator, n_rows, output, fmt='csv', chunk_rows=1_000_000, seed=42,
+                     backend='process', n_workers=None):
+    """
+    Generate synthetic rows in parallel chunks and write them to disk.
+
+    Every chunk gets its own child of one SeedSequence, so the output is
+    identical whatever the backend, worker count or completion order.
+    Parts are written independently; an output path ending in .csv is
+    assembled into a single CSV with one header.
+
+    Args:
+        generator (SyntheticDataGenerator): Fitted generator
+        n_rows (int): Total number of rows
+        output (str): Output directory, or a .csv file path for one CSV
+        fmt (str): 'csv', 'parquet' or 'npy' (one .npy per column per part)
+        chunk_rows (int): Rows per chunk
+        seed (int): Root seed
+        backend (str): Executor backend ('process', 'dask' or 'sequential')
+        n_workers (int): Worker processes (default: one per core of the CPU budget)
+
+    Returns:
+        dict: Output path, part paths, rows, positive rate and throughput
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}'. Choose from: {', '.join(OUTPUT_FORMATS)}")
+    if fmt == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Parquet output requires pyarrow: pip install pyarrow") from e
+
+    single_csv = fmt == 'csv' and output.endswith('.csv')
+    output_dir = output + '.parts' if single_csv else output
+    os.makedirs(output_dir, exist_ok=True)
+
+    n_chunks = -(-n_rows // chunk_rows)
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    tasks = [(index, min(chunk_rows, n_rows - index * chunk_rows), seeds[index])
+             for index in range(n_chunks)]
+
+    print("\n" + "="*60)
+    print("Generating Synthetic Data")
+    print("="*60)
+    print(f"{n_rows:,} rows in {n_chunks} chunks of up to {chunk_rows:,} | "
+          f"format {fmt} | backend {backend} | seed {seed}")
+
+    start = time.perf_counter()
+    shared = {'generator': generator, 'output_dir': output_dir, 'fmt': fmt}
+    with get_executor(backend, **budget_options(backend, n_workers=n_workers)) as executor:
+        results = executor.run(_write_chunk, tasks, shared)
+
+    parts = [path for path, _, _ in results]
+    if single_csv:
+        with open(output, 'w', newline='') as f:
+            f.write(','.join(generator.columns) + '\n')
+        with open(output, 'ab') as out:
+            for path in parts:
+                with open(path, 'rb') as part:
+                    shutil.copyfileobj(part, out, 1 << 24)
+        shutil.rmtree(output_dir)
+        parts = [output]
+    elapsed = time.perf_counter() - start
+
+    positives = sum(count for _, _, count in results)
+    print(f"Wrote {n_rows:,} rows to {output} in {elapsed:.1f}s "
+          f"({n_rows / elapsed:,.0f} rows/s) | positive rate {positives / n_rows:.4f}")
+    return {'output': output, 'parts': parts, 'n_rows': n_rows,
+            'positive_rate': positives / n_rows, 'elapsed': elapsed}
+
+
+def fidelity_report(real, synthetic, target_column='heart_disease'):
+    """
+    Compare a synthetic sample with the source data.
+
+    Args:
+        real (pd.DataFrame): Source dataset
+        synthetic (pd.DataFrame): Synthetic rows
+        target_column (str): Name of the class column
+
+    Returns:
+        tuple: (per-column pd.DataFrame of ranges, means and stds,
+                largest absolute difference between Spearman correlations)
+    """
+    rows = []
+    for column in real.columns:
+        r, s = real[column].astype(float), synthetic[column].astype(float)
+        rows.append({'column': column, 'real_min': r.min(), 'synth_min': s.min(),
+                     'real_max': r.max(), 'synth_max': s.max(),
+                     'real_mean': r.mean(), 'synth_mean': s.mean(),
+                     'real_std': r.std(), 'synth_std': s.std(),
+                     'new_levels': len(set(s.unique()) - set(r.unique()))
+                     if r.nunique() <= MAX_DISCRETE_LEVELS else 0})
+    report = pd.DataFrame(rows).set_index('column')
+
+    corr_gap = (real.corr(method='spearman') - synthetic.corr(method='spearman')).abs().to_numpy()
+    return report, float(np.nanmax(corr_gap))
+
+
+def main(argv=None):
+    """Command-line entry point for the synthetic data generator."""
+    parser = argparse.ArgumentParser(description='Generate synthetic patient data for load tests')
+    parser.add_argument('--source', default='heart_disease_dataset.csv')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--output', default='data/synthetic',
+                        help='Output directory, or a .csv path for a single CSV')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv')
+    parser.add_argument('--chunk-rows', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--backend', choices=['sequential', 'process', 'dask'], default='process')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--target', default='heart_disease')
+    args = parser.parse_args(argv)
+
+    source = pd.read_csv(args.source)
+    generator = SyntheticDataGenerator(target_column=args.target).fit(source)
+
+    report, corr_gap = fidelity_report(source, generator.sample(min(args.rows, 100_000), args.seed),
+                                       args.target)
+    print(report[['real_min', 'synth_min', 'real_max', 'synth_max',
+                  'real_mean', 'synth_mean']].round(3).to_string())
+    print(f"Largest Spearman correlation difference: {corr_gap:.3f}")
+
+    generate_dataset(generator, args.rows, args.output, args.format, args.chunk_rows,
+                     args.seed, args.backend, args.workers)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,459 @@
+"""
+Training Pipeline Module for Disease PredictionIQ
+Staged training pipeline with a content-addressed on-disk cache
+Author: Jay Prakash
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from datetime import datetime
+
+from chart_data import build_chart_data, write_chart_data
+from data_preprocessing import load_data, preprocess_data
+from model_training import BaselineModels, HyperparameterTuning
+from model_benchmarking import (SELECTION_METRICS, benchmark_batch_sizes, benchmark_models,
+                                build_models_comparison, select_best_model)
+from resource_budget import BUDGET_ENV_VAR, ResourceBudget
+from source_hashing import hash_file, source_digest
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SRC_DIR)
+
+# Entry modules of each stage; they and every src/ module they import, transitively,
+# are part of the stage's cache key
+STAGE_CODE = {
+    'load': ['data_preprocessing.py'],
+    'preprocess': ['data_preprocessing.py'],
+    'baseline': ['model_training.py'],
+    'tuning': ['model_training.py', 'adaptive_search.py', 'learning_curves.py'],
+    'evaluation': ['model_training.py', 'evaluation.py'],
+    'benchmark': ['model_benchmarking.py']
+}
+
+
+def code_version(stage):
+    """Hash of the source files a stage depends on, including transitive src/ imports."""
+    return source_digest(STAGE_CODE.get(stage, []), SRC_DIR)
+
+
+class PipelineCache:
+    """
+    Content-addressed cache of stage outputs.
+
+    Each entry lives under a key derived from the stage name, the keys of its
+    upstream stages, its parameters and the version of the code it runs, so a
+    change anywhere upstream produces a new key and a recompute.
+    """
+
+    def __init__(self, cache_dir='.pipeline_cache', enabled=True):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory holding cached stage outputs
+            enabled (bool): When False every stage is recomputed and nothing is stored
+        """
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        if enabled:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(stage, inputs, params):
+        """
+        Build a cache key for a stage.
+
+        Args:
+            stage (str): Stage name
+            inputs (list): Keys or content hashes of the stage inputs
+            params (dict): JSON-serializable stage parameters
+
+        Returns:
+            str: Hex digest identifying this exact computation
+        """
+        payload = json.dumps({
+            'stage': stage,
+            'inputs': inputs,
+            'params': params,
+            'code': code_version(stage.split(':')[0])
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _paths(self, key):
+        return (os.path.join(self.cache_dir, f'{key}.pkl'),
+                os.path.join(self.cache_dir, f'{key}.json'))
+
+    def get(self, key):
+        """Return (value, original compute time) for a key, or None on a miss."""
+        if not self.enabled:
+            return None
+        data_path, meta_path = self._paths(key)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return None
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        with open(data_path, 'rb') as f:
+            return pickle.load(f), meta['compute_time']
+
+    def put(self, key, stage, value, compute_time):
+        """Store a stage output, writing atomically so interrupted runs leave no partial entries."""
+        if not self.enabled:
+            return
+        data_path, meta_path = self._paths(key)
+        with open(data_path + '.tmp', 'wb') as f:
+            pickle.dump(value, f)
+        os.replace(data_path + '.tmp', data_path)
+        with open(meta_path + '.tmp', 'w') as f:
+            json.dump({'stage': stage, 'compute_time': compute_time,
+                       'created': datetime.now().isoformat()}, f)
+        os.replace(meta_path + '.tmp', meta_path)
+
+
+class TrainingPipeline:
+    """
+    Scripted training pipeline: load, preprocess, baseline training, tuning,
+    evaluation and export, with every stage but export cached on disk.
+    """
+
+    def __init__(self, data_path, models_dir='models', cache_dir='.pipeline_cache',
+                 use_cache=True, target_column='heart_disease', test_size=0.2,
+                 random_state=42, cv_folds=5, param_grids=None, backend=None,
+                 backend_options=None, max_latency_ms=None, latency_batch_size=1,
+                 max_size_bytes=None, subsample_tolerance=None, selection_metric='roc_auc'):
+        """
+        Initialize the pipeline.
+
+        Args:
+            data_path (str): Path to the dataset CSV
+            models_dir (str): Directory the exported artifacts are written to
+            cache_dir (str): Directory for cached stage outputs
+            use_cache (bool): Reuse cached stage outputs when keys match
+            target_column (str): Name of target column
+            test_size (float): Proportion of data for testing
+            random_state (int): Random seed for reproducibility
+            cv_folds (int): Number of cross-validation folds
+            param_grids (dict): Per-model grid overrides for the tuning stage
+            backend (str): Executor for fit tasks ('process', 'dask' or 'sequential');
+                None keeps the sequential baseline and GridSearchCV tuning
+            backend_options (dict): Options for the executor, e.g. {'address': 'tcp://...'}
+            max_latency_ms (float): Only select models at most this slow at `latency_batch_size`
+            latency_batch_size (int): Batch size the latency limit applies to; it is
+                benchmarked alongside BATCH_SIZES
+            max_size_bytes (int): Only select models whose pickle is at most this large
+            subsample_tolerance (float): Tune each model on the training subsample
+                where its learning curve plateaus within this tolerance; None
+                tunes on all rows
+            selection_metric (str): Test metric the best model is chosen by, one of
+                SELECTION_METRICS
+        """
+        self.data_path = data_path
+        self.models_dir = models_dir
+        self.cache = PipelineCache(cache_dir, enabled=use_cache)
+        self.target_column = target_column
+        self.test_size = test_size
+        self.random_state = random_state
+        self.cv_folds = cv_folds
+        self.param_grids = dict(HyperparameterTuning.PARAM_GRIDS)
+        self.param_grids.update(param_grids or {})
+        self.backend = backend
+        self.backend_options = backend_options or {}
+        self.batch_sizes = benchmark_batch_sizes(latency_batch_size)
+        if selection_metric not in SELECTION_METRICS:
+            raise ValueError(f"selection_metric must be one of {SELECTION_METRICS}, "
+                             f"got {selection_metric!r}")
+        self.constraints = {'metric': selection_metric,
+                            'max_latency_ms': max_latency_ms,
+                            'latency_batch_size': latency_batch_size,
+                            'max_size_bytes': max_size_bytes}
+        self.subsample_tolerance = subsample_tolerance
+        self.stage_log = []
+
+    def _run_stage(self, stage, inputs, params, compute):
+        """Return a cached stage output or compute and cache it."""
+        key = self.cache.make_key(stage, inputs, params)
+        start = time.perf_counter()
+        cached = self.cache.get(key)
+
+        if cached is not None:
+            value, compute_time = cached
+            elapsed = time.perf_counter() - start
+            self.stage_log.append({'stage': stage, 'cache_hit': True, 'time': elapsed,
+                                   'saved': max(0.0, compute_time - elapsed)})
+            print(f"\n[cache hit] {stage} (saved {compute_time - elapsed:.2f}s)")
+            return key, value
+
+        print(f"\n[running] {stage}")
+        value = compute()
+        elapsed = time.perf_counter() - start
+        self.cache.put(key, stage, value, elapsed)
+        self.stage_log.append({'stage': stage, 'cache_hit': False, 'time': elapsed, 'saved': 0.0})
+        return key, value
+
+    def run(self, export=True):
+        """
+        Run every stage in order.
+
+        Args:
+            export (bool): Write model artifacts to models_dir at the end
+
+        Returns:
+            dict: Best model name, evaluation results and the stage log
+        """
+        self.stage_log = []
+
+        load_key, df = self._run_stage(
+            'load', [hash_file(self.data_path)], {},
+            lambda: load_data(self.data_path))
+
+        preprocess_params = {'target_column': self.target_column, 'test_size': self.test_size,
+                             'random_state': self.random_state}
+        preprocess_key, split = self._run_stage(
+            'preprocess', [load_key], preprocess_params,
+            lambda: preprocess_data(df, **preprocess_params))
+        X_train, X_test, y_train, y_test, feature_names, scaler = split
+
+        def train_baselines():
+            if self.backend is None:
+                baseline = BaselineModels(random_state=self.random_state)
+                baseline.train_all_baseline_models(X_train, y_train, self.cv_folds)
+            else:
+                baseline = BaselineModels(random_state=self.random_state, backend=self.backend,
+                                          backend_options=self.backend_options)
+                baseline.train_all_baseline_models(X_train, y_train, self.cv_folds, parallel=True)
+            return {'models': baseline.models, 'cv_results': baseline.cv_results}
+
+        baseline_key, baseline = self._run_stage(
+            'baseline', [preprocess_key],
+            {'cv_folds': self.cv_folds, 'random_state': self.random_state},
+            train_baselines)
+
+        # One tuning stage per model so a grid change only recomputes that model
+        tune_methods = {
+            'Decision Tree': 'tune_decision_tree',
+            'Random Forest': 'tune_random_forest',
+            'Logistic Regression': 'tune_logistic_regression',
+            'SVM': 'tune_svm'
+        }
+        tuned_models = {}
+        tuning_keys = []
+        for model_name, method in tune_methods.items():
+            def tune(model_name=model_name, method=method):
+                tuner = HyperparameterTuning(random_state=self.random_state, cv_folds=self.cv_folds,
+                                             backend=self.backend,
+                                             backend_options=self.backend_options)
+                kwargs = {'warm_start': True} if model_name == 'Random Forest' else {}
+                try:
+                    if self.subsample_tolerance is not None:
+                        search = tuner.tune_on_subsample(model_name, X_train, y_train,
+                                                         param_grid=self.param_grids[model_name],
+                                                         tolerance=self.subsample_tolerance)
+                    else:
+                        search = getattr(tuner, method)(X_train, y_train,
+                                                        param_grid=self.param_grids[model_name],
+                                                        **kwargs)
+                finally:
+                    tuner.close()
+                return {'model': tuner.best_models[model_name], 'best_params': search.best_params_,
+                        'best_score': search.best_score_}
+
+            key, tuned = self._run_stage(
+                f'tuning:{model_name}', [preprocess_key],
+                {'param_grid': self.param_grids[model_name], 'cv_folds': self.cv_folds,
+                 'random_state': self.random_state,
+                 'subsample_tolerance': self.subsample_tolerance},
+                tune)
+            tuned_models[model_name] = tuned
+            tuning_keys.append(key)
+
+        def evaluate():
+            evaluator = BaselineModels(random_state=self.random_state)
+            evaluator.models = {f'{name} (Optimized)': tuned['model']
+                                for name, tuned in tuned_models.items()}
+            evaluator.models.update(baseline['models'])
+            return evaluator.evaluate_models(X_test, y_test, keep_predictions=False)
+
+        evaluation_key, results = self._run_stage('evaluation', [baseline_key] + tuning_keys,
+                                                  {}, evaluate)
+
+        all_models = {f'{name} (Optimized)': tuned['model'] for name, tuned in tuned_models.items()}
+        all_models.update(baseline['models'])
+
+        def benchmark():
+            costs = benchmark_models(all_models, X_train, y_train, X_test,
+                                     batch_sizes=self.batch_sizes)
+            return build_models_comparison(results, all_models, costs)
+
+        _, comparison = self._run_stage('benchmark', [evaluation_key],
+                                        {'batch_sizes': list(self.batch_sizes)}, benchmark)
+
+        # Pick the model with the best selection metric (ROC-AUC unless overridden)
+        # among those that meet the serving constraints
+        best_entry = select_best_model(comparison, **self.constraints)
+        best_model_name = best_entry['name']
+        best_row = results.loc[results['Model'] == best_model_name].iloc[0]
+
+        if export:
+            start = time.perf_counter()
+            self.export(all_models[best_model_name], best_model_name, best_row, results,
+                        scaler, feature_names, df, X_train, X_test, comparison)
+            self.stage_log.append({'stage': 'export', 'cache_hit': False,
+                                   'time': time.perf_counter() - start, 'saved': 0.0})
+
+        self.print_stage_summary()
+        return {'best_model_name': best_model_name, 'results': results,
+                'models_comparison': comparison, 'stage_log': self.stage_log}
+
+    def export(self, best_model, best_model_name, best_row, results, scaler,
+               feature_names, df, X_train, X_test, comparison):
+        """
+        Write the deployment artifacts the web apps load.
+
+        Args:
+            best_model: Fitted best model
+            best_model_name (str): Display name of the best model
+            best_row (pd.Series): Evaluation metrics of the best model
+            results (pd.DataFrame): Evaluation metrics of all models
+            scaler (StandardScaler): Fitted scaler
+            feature_names (list): Feature names in model input order
+            df (pd.DataFrame): Full dataset
+            X_train (pd.DataFrame): Training features
+            X_test (pd.DataFrame): Test features
+            comparison (list): Metrics and serving costs of every candidate
+        """
+        os.makedirs(self.models_dir, exist_ok=True)
+
+        artifacts = {
+            'best_heart_disease_model.pkl': best_model,
+            'scaler.pkl': scaler,
+            'feature_names.pkl': feature_names
+        }
+        for filename, obj in artifacts.items():
+            path = os.path.join(self.models_dir, filename)
+            with open(path + '.tmp', 'wb') as f:
+                pickle.dump(obj, f)
+            os.replace(path + '.tmp', path)
+            print(f"✓ Saved: {path}")
+
+        y = df[self.target_column]
+        metadata = {
+            'model_name': best_model_name,
+            'model_type': type(best_model).__name__,
+            'creation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'total_models_evaluated': len(results),
+            'feature_names': feature_names,
+            'n_features': len(feature_names),
+            'performance_metrics': {
+                'test_accuracy': float(best_row['Accuracy']),
+                'test_precision': float(best_row['Precision']),
+                'test_recall': float(best_row['Recall']),
+                'test_f1_score': float(best_row['F1-Score']),
+                'test_roc_auc': float(best_row['ROC-AUC'])
+            },
+            'training_set_size': len(X_train),
+            'test_set_size': len(X_test),
+            'class_distribution': {
+                'class_0': int((y == 0).sum()),
+                'class_1': int((y == 1).sum())
+            },
+            'selection_constraints': self.constraints,
+            'models_comparison': sorted(comparison, key=lambda m: m[self.constraints['metric']],
+                                       reverse=True)
+        }
+        metadata_path = os.path.join(self.models_dir, 'model_metadata.json')
+        with open(metadata_path + '.tmp', 'w') as f:
+            json.dump(metadata, f, indent=4)
+        os.replace(metadata_path + '.tmp', metadata_path)
+        print(f"✓ Saved: {metadata_path}")
+
+        # Chart data the web UI renders client-side instead of the report PNGs
+        write_chart_data(build_chart_data(comparison, results, df, self.target_column),
+                         self.models_dir)
+
+    def print_stage_summary(self):
+        """Print which stages hit the cache and how much time that saved."""
+        print("\n" + "="*60)
+        print("PIPELINE STAGE SUMMARY")
+        print("="*60)
+        for entry in self.stage_log:
+            status = 'HIT ' if entry['cache_hit'] else 'RUN '
+            print(f"{status} {entry['stage']:30s} {entry['time']:8.2f}s"
+                  + (f"  (saved {entry['saved']:.2f}s)" if entry['cache_hit'] else ''))
+        total_time = sum(entry['time'] for entry in self.stage_log)
+        total_saved = sum(entry['saved'] for entry in self.stage_log)
+        hits = sum(entry['cache_hit'] for entry in self.stage_log)
+        print("-"*60)
+        print(f"Cache hits: {hits}/{len(self.stage_log)} | Run time: {total_time:.2f}s | "
+              f"Time saved by cache: {total_saved:.2f}s")
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Disease PredictionIQ training pipeline')
+    parser.add_argument('--data', default=os.path.join(PROJECT_ROOT, 'heart_disease_dataset.csv'),
+                        help='Path to the dataset CSV')
+    parser.add_argument('--models-dir', default=os.path.join(PROJECT_ROOT, 'models'),
+                        help='Directory for exported model artifacts')
+    parser.add_argument('--cache-dir', default=os.path.join(PROJECT_ROOT, '.pipeline_cache'),
+                        help='Directory for cached stage outputs')
+    parser.add_argument('--config', help='JSON file with per-model "param_grids" overrides')
+    parser.add_argument('--cv-folds', type=int, default=5)
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--random-state', type=int, default=42)
+    parser.add_argument('--no-cache', action='store_true', help='Recompute every stage')
+    parser.add_argument('--no-export', action='store_true', help='Skip writing model artifacts')
+    parser.add_argument('--backend', choices=['sequential', 'process', 'dask'],
+                        help='Run fit tasks on an executor backend instead of GridSearchCV')
+    parser.add_argument('--scheduler', help='Dask scheduler address, e.g. tcp://10.0.0.5:8786')
+    parser.add_argument('--max-latency-ms', type=float,
+                        help='Only select models at most this slow per prediction call')
+    parser.add_argument('--latency-batch-size', type=int, default=1,
+                        help='Batch size the latency limit applies to')
+    parser.add_argument('--max-model-bytes', type=int,
+                        help='Only select models whose pickled size is at most this many bytes')
+    parser.add_argument('--selection-metric', choices=SELECTION_METRICS, default='roc_auc',
+                        help='Test metric the best model is selected by')
+    parser.add_argument('--subsample-tolerance', type=float,
+                        help='Tune on the training subsample where learning curves plateau '
+                             'within this score tolerance (final fits use all rows)')
+    parser.add_argument('--cpu-budget', type=int,
+                        help=f'Cores for joblib workers and BLAS threads (default: ${BUDGET_ENV_VAR} or all)')
+    args = parser.parse_args(argv)
+
+    if args.cpu_budget:
+        os.environ[BUDGET_ENV_VAR] = str(args.cpu_budget)
+    print(f"CPU budget: {ResourceBudget.from_env(n_workers=1).apply()}")
+
+    param_grids = None
+    if args.config:
+        with open(args.config, 'r') as f:
+            param_grids = json.load(f).get('param_grids')
+
+    pipeline = TrainingPipeline(
+        args.data,
+        models_dir=args.models_dir,
+        cache_dir=args.cache_dir,
+        use_cache=not args.no_cache,
+        test_size=args.test_size,
+        random_state=args.random_state,
+        cv_folds=args.cv_folds,
+        param_grids=param_grids,
+        backend=args.backend,
+        backend_options={'address': args.scheduler} if args.scheduler else None,
+        max_latency_ms=args.max_latency_ms,
+        latency_batch_size=args.latency_batch_size,
+        max_size_bytes=args.max_model_bytes,
+        subsample_tolerance=args.subsample_tolerance,
+        selection_metric=args.selection_metric
+    )
+    result = pipeline.run(export=not args.no_export)
+    print(f"\n🏆 Best model: {result['best_model_name']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
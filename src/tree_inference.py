@@ -0,0 +1,299 @@
+"""
+Tree Ensemble Inference Module for Disease PredictionIQ
+Compiles fitted tree ensembles into flat NumPy node arrays for fast batch inference
+Author: Jay Prakash
+"""
+
+import time
+import numpy as np
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.ensemble import (RandomForestClassifier, ExtraTreesClassifier,
+                              GradientBoostingClassifier, AdaBoostClassifier)
+
+
+class CompiledTreeEnsemble:
+    """
+    Tree ensemble flattened into contiguous node arrays.
+
+    All trees are stored back to back in the same arrays (feature, threshold,
+    left, right, value). Leaves point to themselves with an infinite threshold,
+    so a batch is evaluated by stepping every (tree, sample) pair one level per
+    iteration until the deepest tree is exhausted.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots,
+                 max_depth, kind, classes, tree_weights=None,
+                 learning_rate=1.0, init_raw=0.0):
+        """
+        Initialize a compiled ensemble. Use `compile_ensemble` to build one.
+
+        Args:
+            feature (np.ndarray): Split feature per node (0 for leaves)
+            threshold (np.ndarray): Split threshold per node (+inf for leaves)
+            left (np.ndarray): Global index of the left child per node
+            right (np.ndarray): Global index of the right child per node
+            value (np.ndarray): Leaf output per node, shape (n_nodes, n_outputs)
+            roots (np.ndarray): Global index of the root of each tree
+            max_depth (int): Depth of the deepest tree
+            kind (str): Aggregation rule ('average', 'boosting' or 'samme')
+            classes (np.ndarray): Class labels of the source model
+            tree_weights (np.ndarray): Per-tree weights for AdaBoost
+            learning_rate (float): Shrinkage for gradient boosting
+            init_raw (float): Initial raw score for gradient boosting
+        """
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        # Interleaved (left, right) pairs so one gather picks the next node
+        self.children = np.column_stack([left, right]).ravel()
+        self.roots = roots
+        self.max_depth = max_depth
+        self.kind = kind
+        self.classes_ = classes
+        self.tree_weights = tree_weights
+        self.learning_rate = learning_rate
+        self.init_raw = init_raw
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    def apply(self, X):
+        """
+        Find the leaf reached by every sample in every tree.
+
+        Args:
+            X (array-like): Input features, shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Global leaf indices, shape (n_trees, n_samples)
+        """
+        # sklearn evaluates splits on float32 features against float64 thresholds
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_samples, n_features = X.shape
+        X_flat = X.ravel()
+        row_offsets = np.arange(n_samples) * n_features
+
+        nodes = np.repeat(self.roots[:, np.newaxis], n_samples, axis=1)
+        for _ in range(self.max_depth):
+            go_right = X_flat[row_offsets + self.feature[nodes]] > self.threshold[nodes]
+            nodes = self.children[2 * nodes + go_right]
+        return nodes
+
+    def predict_proba(self, X):
+        """
+        Predict class probabilities for X.
+
+        Args:
+            X (array-like): Input features, shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Class probabilities, shape (n_samples, n_classes)
+        """
+        leaf_values = self.value[self.apply(X)]  # (n_trees, n_samples, n_outputs)
+
+        if self.kind == 'average':
+            return leaf_values.mean(axis=0)
+
+        if self.kind == 'boosting':
+            raw = self.init_raw + self.learning_rate * leaf_values[:, :, 0].sum(axis=0)
+            proba_1 = 1.0 / (1.0 + np.exp(-raw))
+            return np.column_stack([1 - proba_1, proba_1])
+
+        # SAMME: each vote adds +/-w to both class scores, so the binary decision
+        # is 2 * sum(w * sign) / sum(w); softmax of (-d/2, d/2) is a sigmoid of d
+        votes = leaf_values.argmax(axis=2)
+        sign = np.where(votes == 1, 1.0, -1.0)
+        decision = (self.tree_weights[:, np.newaxis] * sign).sum(axis=0)
+        decision *= 2.0 / self.tree_weights.sum()
+        proba_1 = 1.0 / (1.0 + np.exp(-decision))
+        return np.column_stack([1 - proba_1, proba_1])
+
+    def predict(self, X):
+        """
+        Predict class labels for X.
+
+        Args:
+            X (array-like): Input features, shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Predicted class labels
+        """
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+def _tree_arrays(tree, normalize):
+    """Extract node arrays from a fitted sklearn `Tree` object."""
+    n_nodes = tree.node_count
+    is_leaf = tree.children_left == -1
+    node_ids = np.arange(n_nodes)
+
+    feature = np.where(is_leaf, 0, tree.feature).astype(np.intp)
+    threshold = np.where(is_leaf, np.inf, tree.threshold)
+    left = np.where(is_leaf, node_ids, tree.children_left).astype(np.intp)
+    right = np.where(is_leaf, node_ids, tree.children_right).astype(np.intp)
+
+    value = tree.value[:, 0, :].astype(np.float64)
+    if normalize:
+        totals = value.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1.0
+        value = value / totals
+
+    return feature, threshold, left, right, value, tree.max_depth
+
+
+def _estimator_trees(model):
+    """Return the list of sklearn `Tree` objects making up a model."""
+    if isinstance(model, DecisionTreeClassifier):
+        return [model.tree_]
+    if isinstance(model, GradientBoostingClassifier):
+        return [est.tree_ for est in model.estimators_[:, 0]]
+    return [est.tree_ for est in model.estimators_]
+
+
+def is_supported(model):
+    """
+    Check whether a model can be compiled by `compile_ensemble`.
+
+    Args:
+        model: Fitted sklearn estimator
+
+    Returns:
+        bool: True for binary tree ensembles with supported aggregation
+    """
+    supported = (DecisionTreeClassifier, RandomForestClassifier,
+                 ExtraTreesClassifier, GradientBoostingClassifier, AdaBoostClassifier)
+    if not isinstance(model, supported) or not hasattr(model, 'classes_'):
+        return False
+    if len(model.classes_) != 2:
+        return False
+    if isinstance(model, GradientBoostingClassifier):
+        return model.loss in ('log_loss', 'deviance')
+    if isinstance(model, AdaBoostClassifier):
+        return getattr(model, 'algorithm', 'SAMME') == 'SAMME' and all(
+            isinstance(est, DecisionTreeClassifier) for est in model.estimators_)
+    return True
+
+
+def compile_ensemble(model):
+    """
+    Compile a fitted tree model into a `CompiledTreeEnsemble`.
+
+    Supports DecisionTree, RandomForest, ExtraTrees, GradientBoosting
+    (binary log-loss) and AdaBoost (SAMME with tree base estimators).
+
+    Args:
+        model: Fitted sklearn classifier
+
+    Returns:
+        CompiledTreeEnsemble: Flattened ensemble with the same predictions
+    """
+    if not is_supported(model):
+        raise ValueError(f"Cannot compile model of type {type(model).__name__}")
+
+    if isinstance(model, GradientBoostingClassifier):
+        kind = 'boosting'
+    elif isinstance(model, AdaBoostClassifier):
+        kind = 'samme'
+    else:
+        kind = 'average'
+
+    trees = _estimator_trees(model)
+    if kind == 'samme':
+        # Zero-weight estimators are dropped by sklearn before voting
+        weights = np.asarray(model.estimator_weights_[:len(trees)], dtype=np.float64)
+        keep = weights > 0
+        trees = [tree for tree, k in zip(trees, keep) if k]
+        weights = weights[keep]
+    else:
+        weights = None
+
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for tree in trees:
+        feature, threshold, left, right, value, depth = _tree_arrays(
+            tree, normalize=(kind == 'average'))
+        features.append(feature)
+        thresholds.append(threshold)
+        lefts.append(left + offset)
+        rights.append(right + offset)
+        values.append(value)
+        roots.append(offset)
+        offset += len(feature)
+        max_depth = max(max_depth, depth)
+
+    init_raw = 0.0
+    learning_rate = 1.0
+    if kind == 'boosting':
+        learning_rate = model.learning_rate
+        # Raw prediction of the init estimator is constant for every sample
+        init_raw = float(model._raw_predict_init(np.zeros((1, model.n_features_in_)))[0, 0])
+
+    return CompiledTreeEnsemble(
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds),
+        left=np.concatenate(lefts),
+        right=np.concatenate(rights),
+        value=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.intp),
+        max_depth=max_depth,
+        kind=kind,
+        classes=model.classes_,
+        tree_weights=weights,
+        learning_rate=learning_rate,
+        init_raw=init_raw
+    )
+
+
+def benchmark_against_sklearn(model, X, batch_sizes=(1, 10, 100, 1000), n_repeats=20):
+    """
+    Compare predict_proba latency of a compiled ensemble against sklearn.
+
+    Args:
+        model: Fitted sklearn tree ensemble
+        X (array-like): Input rows to sample batches from
+        batch_sizes (tuple): Batch sizes to benchmark
+        n_repeats (int): Number of timed calls per batch size
+
+    Returns:
+        list: One dict per batch size with median latencies in milliseconds
+    """
+    compiled = compile_ensemble(model)
+    X = np.asarray(X, dtype=np.float64)
+
+    print("\n" + "="*60)
+    print(f"Inference Benchmark - {type(model).__name__} ({compiled.n_trees} trees)")
+    print("="*60)
+    print(f"{'Batch':>8} {'sklearn (ms)':>14} {'compiled (ms)':>14} {'speedup':>9}")
+
+    results = []
+    for batch_size in batch_sizes:
+        batch = X[np.arange(batch_size) % len(X)]
+
+        timings = {}
+        for name, predictor in (('sklearn', model), ('compiled', compiled)):
+            predictor.predict_proba(batch)  # warm up
+            runs = []
+            for _ in range(n_repeats):
+                start = time.perf_counter()
+                predictor.predict_proba(batch)
+                runs.append(time.perf_counter() - start)
+            timings[name] = float(np.median(runs)) * 1000
+
+        speedup = timings['sklearn'] / timings['compiled']
+        print(f"{batch_size:>8} {timings['sklearn']:>14.3f} {timings['compiled']:>14.3f} {speedup:>8.1f}x")
+        results.append({
+            'batch_size': batch_size,
+            'sklearn_ms': timings['sklearn'],
+            'compiled_ms': timings['compiled'],
+            'speedup': speedup
+        })
+
+    return results
@@ -7,9 +7,201 @@ Author: Jay Prakash
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
+import pandas as pd
 from sklearn.metrics import confusion_matrix, roc_curve, auc
 import os
 
+from data_profiling import QuantileSketch
+from evaluation import decimate_curve
+
+# Rows aggregated per pass, so memory stays flat as the data grows
+PLOT_CHUNK_SIZE = 1_000_000
+
+# Points drawn per ROC curve; finer than a 300 dpi figure can resolve
+MAX_ROC_POINTS = 1000
+
+# Score bins used for ROC curves of more predictions than one chunk
+ROC_SCORE_BINS = 1 << 16
+
+# Outliers drawn per box; they share one x position, so duplicates are invisible
+MAX_FLIERS = 1000
+
+
+def _iter_chunks(values, chunk_size=PLOT_CHUNK_SIZE):
+    """Yield consecutive slices (views) of an array, dropping NaNs."""
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        if chunk.dtype.kind == 'f':
+            chunk = chunk[~np.isnan(chunk)]
+        yield chunk
+
+
+def histogram_counts(values, bins=30, chunk_size=PLOT_CHUNK_SIZE):
+    """
+    Histogram of a column computed in chunks.
+    
+    The first pass finds the range, the second adds up np.histogram counts
+    per chunk over shared edges, giving exactly the counts `hist` would draw
+    from the raw column.
+    
+    Args:
+        values (array-like): Column values
+        bins (int): Number of equal-width bins
+        chunk_size (int): Rows per chunk
+        
+    Returns:
+        tuple: (counts, bin edges)
+    """
+    values = np.asarray(values)
+    low, high = np.inf, -np.inf
+    for chunk in _iter_chunks(values, chunk_size):
+        if len(chunk):
+            low, high = min(low, chunk.min()), max(high, chunk.max())
+    if low > high:
+        return np.zeros(bins, dtype=np.int64), np.linspace(0, 1, bins + 1)
+    
+    counts = np.zeros(bins, dtype=np.int64)
+    for chunk in _iter_chunks(values, chunk_size):
+        # A fixed range keeps numpy on its uniform-bin path (no sort of the chunk)
+        chunk_counts, edges = np.histogram(chunk, bins=bins, range=(low, high))
+        counts += chunk_counts
+    return counts, edges
+
+
+def box_summaries(values, groups=None, chunk_size=PLOT_CHUNK_SIZE, whis=1.5,
+                  max_fliers=MAX_FLIERS):
+    """
+    Box plot statistics per group, computed in chunks.
+    
+    Quartiles come from a mergeable quantile sketch (exact up to its
+    capacity, bounded rank error beyond), whiskers and outliers from a
+    second pass with the 1.5 IQR rule that matplotlib uses. Only distinct
+    outliers are kept, thinned to max_fliers while keeping the extremes.
+    
+    Args:
+        values (array-like): Column values
+        groups (array-like): Group label per row (default: one group)
+        chunk_size (int): Rows per chunk
+        whis (float): Whisker reach in IQRs
+        max_fliers (int): Maximum outliers kept per group
+        
+    Returns:
+        list: One stats dict per group in sorted label order, ready for Axes.bxp
+    """
+    values = np.asarray(values)
+    groups = np.zeros(len(values), dtype=np.int8) if groups is None else np.asarray(groups)
+    
+    def grouped_chunks():
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start + chunk_size].astype(np.float64)
+            labels = groups[start:start + chunk_size]
+            for label in pd.unique(labels):
+                group_values = chunk[labels == label]
+                yield label, group_values[~np.isnan(group_values)]
+    
+    sketches = {}
+    for label, chunk in grouped_chunks():
+        sketches.setdefault(label, QuantileSketch()).update(chunk)
+    
+    stats = {}
+    for label, sketch in sketches.items():
+        q1, med, q3 = sketch.quantiles([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        stats[label] = {'label': label, 'q1': q1, 'med': med, 'q3': q3,
+                        'fences': (q1 - whis * iqr, q3 + whis * iqr),
+                        'whislo': np.inf, 'whishi': -np.inf, 'fliers': []}
+    
+    for label, chunk in grouped_chunks():
+        entry = stats[label]
+        low_fence, high_fence = entry['fences']
+        inside = chunk[(chunk >= low_fence) & (chunk <= high_fence)]
+        if len(inside):
+            entry['whislo'] = min(entry['whislo'], inside.min())
+            entry['whishi'] = max(entry['whishi'], inside.max())
+        entry['fliers'].append(np.unique(chunk[(chunk < low_fence) | (chunk > high_fence)]))
+    
+    summaries = []
+    for label in sorted(stats):
+        entry = stats.pop(label)
+        low_fence, high_fence = entry.pop('fences')
+        # matplotlib falls back to the quartiles when no point lies within the fences
+        entry['whislo'] = entry['q1'] if entry['whislo'] > entry['q1'] else entry['whislo']
+        entry['whishi'] = entry['q3'] if entry['whishi'] < entry['q3'] else entry['whishi']
+        fliers = np.unique(np.concatenate(entry['fliers'])) if entry['fliers'] else np.empty(0)
+        if len(fliers) > max_fliers:
+            fliers = fliers[np.linspace(0, len(fliers) - 1, max_fliers).round().astype(int)]
+        entry['fliers'] = fliers
+        summaries.append(entry)
+    return summaries
+
+
+def binned_roc_curve(y_true, scores, n_bins=ROC_SCORE_BINS, chunk_size=PLOT_CHUNK_SIZE):
+    """
+    ROC curve from per-class score histograms computed in chunks.
+    
+    Every point is the exact (FPR, TPR) at one bin edge threshold; only
+    scores that share a bin are treated as ties. Memory depends on n_bins,
+    not on the number of predictions.
+    
+    Args:
+        y_true (array-like): Binary labels (0/1)
+        scores (array-like): Class-1 scores
+        n_bins (int): Score bins
+        chunk_size (int): Rows per chunk
+        
+    Returns:
+        tuple: (fpr, tpr) starting at (0, 0)
+    """
+    y_true, scores = np.asarray(y_true), np.asarray(scores)
+    low, high = np.inf, -np.inf
+    for chunk in _iter_chunks(scores, chunk_size):
+        if len(chunk):
+            low, high = min(low, chunk.min()), max(high, chunk.max())
+    
+    positives = np.zeros(n_bins, dtype=np.int64)
+    negatives = np.zeros(n_bins, dtype=np.int64)
+    for start in range(0, len(scores), chunk_size):
+        chunk = scores[start:start + chunk_size]
+        is_positive = y_true[start:start + chunk_size] == 1
+        positives += np.histogram(chunk[is_positive], bins=n_bins, range=(low, high))[0]
+        negatives += np.histogram(chunk[~is_positive], bins=n_bins, range=(low, high))[0]
+    
+    # Lower the threshold one bin at a time, from the highest scores down
+    tps = np.concatenate([[0], np.cumsum(positives[::-1])])
+    fps = np.concatenate([[0], np.cumsum(negatives[::-1])])
+    return fps / max(fps[-1], 1), tps / max(tps[-1], 1)
+
+
+def roc_points(results, max_points=MAX_ROC_POINTS, chunk_size=PLOT_CHUNK_SIZE):
+    """
+    ROC curve of one model, decimated to at most max_points.
+    
+    Up to chunk_size predictions the exact curve is computed; beyond that
+    it comes from binned_roc_curve so memory stays bounded.
+    
+    Args:
+        results (dict): {'y_test', 'y_score'} with class-1 scores (probabilities
+            or decision values), {'y_test', 'y_pred_proba'}, or a precomputed
+            curve {'fpr', 'tpr'} (e.g. the 'ROC Curve' of evaluate_models)
+        max_points (int): Maximum points drawn
+        chunk_size (int): Prediction count above which scores are binned
+        
+    Returns:
+        tuple: (fpr, tpr, AUC of the full-resolution curve)
+    """
+    if 'fpr' in results:
+        fpr, tpr = np.asarray(results['fpr']), np.asarray(results['tpr'])
+    else:
+        scores = np.asarray(results['y_score']) if 'y_score' in results \
+            else np.asarray(results['y_pred_proba'])[:, 1]
+        if len(scores) <= chunk_size:
+            fpr, tpr, _ = roc_curve(results['y_test'], scores)
+        else:
+            fpr, tpr = binned_roc_curve(results['y_test'], scores, chunk_size=chunk_size)
+    roc_auc = results.get('roc_auc', auc(fpr, tpr))
+    keep = decimate_curve(fpr, tpr, max_points)
+    return fpr[keep], tpr[keep], roc_auc
+
 
 def setup_plot_style():
     """Configure matplotlib and seaborn for consistent styling."""
@@ -18,13 +210,50 @@ def setup_plot_style():
     plt.rcParams['font.size'] = 10
 
 
-def plot_target_distribution(y, filepath=None):
+def _save_figure(fig, filepath, dpi=300):
+    """
+    Write a figure atomically.
+    
+    The image is rendered to a temporary file next to the target and
+    renamed into place, so readers never see a partially written file.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to save
+        filepath (str): Destination path; the extension selects the format
+        dpi (int): Resolution in dots per inch
+    """
+    image_format = os.path.splitext(filepath)[1].lstrip('.') or None
+    with open(filepath + '.tmp', 'wb') as f:
+        fig.savefig(f, dpi=dpi, bbox_inches='tight', format=image_format)
+    os.replace(filepath + '.tmp', filepath)
+
+
+def _finish_figure(fig, filepath=None, show=True):
+    """
+    Lay out a figure, save it if a path is given, then show or close it.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to finish
+        filepath (str): Optional path to save the figure
+        show (bool): Display the figure; when False it is closed to free memory
+    """
+    fig.tight_layout()
+    if filepath:
+        _save_figure(fig, filepath)
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+def plot_target_distribution(y, filepath=None, show=True):
     """
     Visualize the distribution of the target variable.
     
     Args:
         y (pd.Series): Target variable
         filepath (str): Optional path to save the figure
+        show (bool): Display the figure; False closes it after saving
     """
     fig, axes = plt.subplots(1, 2, figsize=(12, 4))
     
@@ -42,13 +271,10 @@ def plot_target_distribution(y, filepath=None):
                 colors=colors, startangle=90)
     axes[1].set_title('Target Variable Distribution (%)', fontsize=12, fontweight='bold')
     
-    plt.tight_layout()
-    if filepath:
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _finish_figure(fig, filepath, show)
 
 
-def plot_feature_distributions(df, features_to_plot=None, filepath=None):
+def plot_feature_distributions(df, features_to_plot=None, filepath=None, show=True):
     """
     Plot distributions of continuous features.
     
@@ -56,6 +282,7 @@ def plot_feature_distributions(df, features_to_plot=None, filepath=None):
         df (pd.DataFrame): Input dataset
         features_to_plot (list): List of features to plot (default: all numerical)
         filepath (str): Optional path to save the figure
+        show (bool): Display the figure; False closes it after saving
     """
     if features_to_plot is None:
         features_to_plot = df.columns.tolist()
@@ -71,7 +298,10 @@ def plot_feature_distributions(df, features_to_plot=None, filepath=None):
     axes = axes.flatten()
     
     for idx, feature in enumerate(features_to_plot):
-        axes[idx].hist(df[feature], bins=30, color='#3498db', edgecolor='black', alpha=0.7)
+        # Draw pre-aggregated counts: one weighted point per bin instead of every row
+        counts, edges = histogram_counts(df[feature].to_numpy(), bins=30)
+        axes[idx].hist(edges[:-1], bins=edges, weights=counts,
+                       color='#3498db', edgecolor='black', alpha=0.7)
         axes[idx].set_title(f'Distribution of {feature}', fontweight='bold')
         axes[idx].set_xlabel(feature)
         axes[idx].set_ylabel('Frequency')
@@ -80,19 +310,17 @@ def plot_feature_distributions(df, features_to_plot=None, filepath=None):
     for idx in range(n_features, len(axes)):
         axes[idx].set_visible(False)
     
-    plt.tight_layout()
-    if filepath:
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _finish_figure(fig, filepath, show)
 
 
-def plot_correlation_heatmap(df, filepath=None):
+def plot_correlation_heatmap(df, filepath=None, show=True):
     """
     Create a correlation heatmap for all features.
     
     Args:
         df (pd.DataFrame): Input dataset
         filepath (str): Optional path to save the figure
+        show (bool): Display the figure; False closes it after saving
     """
     fig, ax = plt.subplots(figsize=(14, 10))
     
@@ -101,14 +329,10 @@ def plot_correlation_heatmap(df, filepath=None):
                 square=True, linewidths=0.5, cbar_kws={"shrink": 0.8}, ax=ax)
     
     ax.set_title('Feature Correlation Matrix', fontsize=14, fontweight='bold', pad=20)
-    plt.tight_layout()
-    
-    if filepath:
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _finish_figure(fig, filepath, show)
 
 
-def plot_target_vs_feature(df, feature, target='heart_disease', filepath=None):
+def plot_target_vs_feature(df, feature, target='heart_disease', filepath=None, show=True):
     """
     Plot relationship between a feature and target variable.
     
@@ -117,23 +341,21 @@ def plot_target_vs_feature(df, feature, target='heart_disease', filepath=None):
         feature (str): Feature name to plot
         target (str): Target column name
         filepath (str): Optional path to save the figure
+        show (bool): Display the figure; False closes it after saving
     """
     fig, ax = plt.subplots(figsize=(10, 5))
     
-    # Create box plot
-    df.boxplot(column=feature, by=target, ax=ax)
+    # Box plot drawn from chunked quantile summaries rather than raw rows
+    summaries = box_summaries(df[feature].to_numpy(), df[target].to_numpy())
+    ax.bxp(summaries, showfliers=True)
     ax.set_title(f'{feature} by {target}', fontsize=12, fontweight='bold')
     ax.set_xlabel(target)
     ax.set_ylabel(feature)
-    plt.suptitle('')  # Remove automatic title
     
-    plt.tight_layout()
-    if filepath:
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _finish_figure(fig, filepath, show)
 
 
-def plot_confusion_matrix(y_true, y_pred, model_name='Model', filepath=None):
+def plot_confusion_matrix(y_true, y_pred, model_name='Model', filepath=None, show=True):
     """
     Plot confusion matrix for a classification model.
     
@@ -142,6 +364,7 @@ def plot_confusion_matrix(y_true, y_pred, model_name='Model', filepath=None):
         y_pred (array-like): Predicted labels
         model_name (str): Name of the model
         filepath (str): Optional path to save the figure
+        show (bool): Display the figure; False closes it after saving
     """
     cm = confusion_matrix(y_true, y_pred)
     
@@ -154,33 +377,28 @@ def plot_confusion_matrix(y_true, y_pred, model_name='Model', filepath=None):
     ax.set_ylabel('True Label')
     ax.set_xlabel('Predicted Label')
     
-    plt.tight_layout()
-    if filepath:
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _finish_figure(fig, filepath, show)
     
     return cm
 
 
-def plot_roc_curves(results_dict, filepath=None):
+def plot_roc_curves(results_dict, filepath=None, show=True):
     """
     Plot ROC curves for multiple models.
     
     Args:
         results_dict (dict): Dictionary with model results
                             {model_name: {'y_test': y_test, 'y_pred_proba': y_pred_proba}}
+                            or precomputed curves {model_name: {'fpr': ..., 'tpr': ...}}
         filepath (str): Optional path to save the figure
+        show (bool): Display the figure; False closes it after saving
     """
     fig, ax = plt.subplots(figsize=(10, 8))
     
     colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12']
     
     for idx, (model_name, results) in enumerate(results_dict.items()):
-        y_test = results['y_test']
-        y_pred_proba = results['y_pred_proba']
-        
-        fpr, tpr, _ = roc_curve(y_test, y_pred_proba[:, 1])
-        roc_auc = auc(fpr, tpr)
+        fpr, tpr, roc_auc = roc_points(results)
         
         ax.plot(fpr, tpr, label=f'{model_name} (AUC = {roc_auc:.3f})',
                 linewidth=2, color=colors[idx % len(colors)])
@@ -194,13 +412,10 @@ def plot_roc_curves(results_dict, filepath=None):
     ax.legend(loc='lower right', fontsize=10)
     ax.grid(alpha=0.3)
     
-    plt.tight_layout()
-    if filepath:
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _finish_figure(fig, filepath, show)
 
 
-def plot_model_comparison(results_df, metric='Accuracy', filepath=None):
+def plot_model_comparison(results_df, metric='Accuracy', filepath=None, show=True):
     """
     Plot comparison of models across a specific metric.
     
@@ -208,6 +423,7 @@ def plot_model_comparison(results_df, metric='Accuracy', filepath=None):
         results_df (pd.DataFrame): DataFrame with model results
         metric (str): Metric to compare
         filepath (str): Optional path to save the figure
+        show (bool): Display the figure; False closes it after saving
     """
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -223,13 +439,10 @@ def plot_model_comparison(results_df, metric='Accuracy', filepath=None):
     for i, v in enumerate(results_sorted[metric]):
         ax.text(v - 0.02, i, f'{v:.3f}', va='center', ha='right', fontweight='bold')
     
-    plt.tight_layout()
-    if filepath:
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _finish_figure(fig, filepath, show)
 
 
-def plot_feature_importance(feature_importance_dict, top_n=10, filepath=None):
+def plot_feature_importance(feature_importance_dict, top_n=10, filepath=None, show=True):
     """
     Plot feature importance from tree-based models.
     
@@ -237,6 +450,7 @@ def plot_feature_importance(feature_importance_dict, top_n=10, filepath=None):
         feature_importance_dict (dict): {feature_name: importance_value}
         top_n (int): Number of top features to display
         filepath (str): Optional path to save the figure
+        show (bool): Display the figure; False closes it after saving
     """
     # Sort and select top features
     sorted_features = sorted(feature_importance_dict.items(), key=lambda x: x[1], reverse=True)
@@ -254,10 +468,7 @@ def plot_feature_importance(feature_importance_dict, top_n=10, filepath=None):
     for i, v in enumerate(importance_values):
         ax.text(v - 0.01, i, f'{v:.4f}', va='center', ha='right', fontweight='bold')
     
-    plt.tight_layout()
-    if filepath:
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _finish_figure(fig, filepath, show)
 
 
 def ensure_reports_directory(base_path='reports'):
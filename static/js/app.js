@@ -13,6 +13,24 @@ const resultsCard = document.getElementById('resultsCard');
 const loadingOverlay = document.getElementById('loadingOverlay');
 const navLinks = document.querySelectorAll('.nav-link, .mobile-nav-link');
 
+// ========== BOOTSTRAP DATA ==========
+// The server inlines the startup API responses into the page; fetch only what is missing.
+const bootstrapData = (() => {
+    const element = document.getElementById('bootstrapData');
+    try {
+        return element ? JSON.parse(element.textContent) : {};
+    } catch (error) {
+        console.warn('Invalid bootstrap data, fetching from the API:', error);
+        return {};
+    }
+})();
+
+async function bootstrapOrFetch(key, url) {
+    if (bootstrapData[key]) return bootstrapData[key];
+    const response = await fetch(url);
+    return response.json();
+}
+
 // ========== MOBILE MENU ==========
 mobileMenuToggle.addEventListener('click', () => {
     mobileMenu.classList.add('active');
@@ -94,13 +112,37 @@ if (statsGrid) {
     counterObserver.observe(statsGrid);
 }
 
+// ========== IN-BROWSER MODEL ==========
+// Fetched once in the background; until it arrives (or if the model cannot be
+// exported) predictions go to /api/predict.
+let browserModel = null;
+
+async function loadBrowserModel() {
+    if (typeof PredictionIQInference === 'undefined') return;
+    try {
+        const response = await fetch('/api/model-export');
+        if (!response.ok) return;
+        browserModel = PredictionIQInference.loadModel(await response.json());
+    } catch (error) {
+        console.warn('In-browser inference unavailable, using the server:', error);
+        browserModel = null;
+    }
+}
+
+function predictInBrowser(data) {
+    if (!browserModel) return null;
+    try {
+        return PredictionIQInference.predict(browserModel, data);
+    } catch (error) {
+        console.warn('In-browser prediction failed, using the server:', error);
+        return null;
+    }
+}
+
 // ========== FORM SUBMISSION ==========
 predictionForm.addEventListener('submit', async (e) => {
     e.preventDefault();
     
-    // Show loading overlay
-    loadingOverlay.classList.add('active');
-    
     // Collect form data
     const formData = new FormData(predictionForm);
     const data = {};
@@ -109,6 +151,20 @@ predictionForm.addEventListener('submit', async (e) => {
         data[key] = value;
     });
     
+    // Predict locally when the model has been exported
+    const localResult = predictInBrowser(data);
+    if (localResult) {
+        displayResults(localResult);
+        resultsCard.scrollIntoView({
+            behavior: 'smooth',
+            block: 'center'
+        });
+        return;
+    }
+    
+    // Show loading overlay
+    loadingOverlay.classList.add('active');
+    
     try {
         // Make API request
         const response = await fetch('/api/predict', {
@@ -227,8 +283,7 @@ async function loadModelInfo() {
     const modelInfoContent = document.getElementById('modelInfoContent');
     
     try {
-        const response = await fetch('/api/model-info');
-        const data = await response.json();
+        const data = await bootstrapOrFetch('model_info', '/api/model-info');
         
         if (data.success) {
             const metrics = data.metrics;
@@ -247,7 +302,7 @@ async function loadModelInfo() {
                         </div>
                         <div class="metric-item">
                             <span class="metric-label">Training Date</span>
-                            <span class="metric-value">${data.training_date}</span>
+                            <span class="metric-value">${data.creation_date}</span>
                         </div>
                     </div>
                 </div>
@@ -414,8 +469,7 @@ formActions.insertBefore(sampleBtn, formActions.firstChild);
 // ========== MODEL COMPARISON ==========
 async function loadModelsComparison() {
     try {
-        const response = await fetch('/api/models-comparison');
-        const data = await response.json();
+        const data = await bootstrapOrFetch('models_comparison', '/api/models-comparison');
         
         if (data.success) {
             displayModelsComparison(data);
@@ -628,13 +682,138 @@ function displayModelsComparison(data) {
     `;
 }
 
+// ========== CHART DATA ==========
+// Charts are drawn client-side from /api/chart-data (a few KB of JSON, revalidated
+// by ETag) instead of downloading the rendered PNG reports.
+const CHART_WIDTH = 320;
+const CHART_HEIGHT = 240;
+const CLASS_COLORS = { '0': '#4CAF50', '1': '#F44336' };
+
+async function loadChartData() {
+    const chartDataContent = document.getElementById('chartDataContent');
+    if (!chartDataContent) return;
+    
+    try {
+        const response = await fetch('/api/chart-data');
+        if (!response.ok) throw new Error(`Chart data unavailable (${response.status})`);
+        displayChartData(await response.json());
+    } catch (error) {
+        console.error('Error loading chart data:', error);
+        chartDataContent.innerHTML = '';
+    }
+}
+
+function rocChartSVG(roc) {
+    const points = roc.fpr.map((x, i) =>
+        `${(x * CHART_WIDTH).toFixed(1)},${((1 - roc.tpr[i]) * CHART_HEIGHT).toFixed(1)}`
+    ).join(' ');
+    return `
+        <svg viewBox="0 0 ${CHART_WIDTH} ${CHART_HEIGHT}" width="100%" role="img" aria-label="ROC curve">
+            <rect width="${CHART_WIDTH}" height="${CHART_HEIGHT}" fill="none" stroke="var(--text-secondary)" stroke-width="1"/>
+            <line x1="0" y1="${CHART_HEIGHT}" x2="${CHART_WIDTH}" y2="0" stroke="var(--text-secondary)" stroke-dasharray="4 4"/>
+            <polyline points="${points}" fill="none" stroke="var(--accent-color)" stroke-width="2"/>
+        </svg>
+    `;
+}
+
+function confusionMatrixHTML(matrix) {
+    const labels = [['TN', 'FP'], ['FN', 'TP']];
+    const max = Math.max(...matrix.flat(), 1);
+    return `
+        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 4px;">
+            ${matrix.map((row, i) => row.map((count, j) => `
+                <div style="padding: 1rem; text-align: center; border-radius: 6px;
+                            background: rgba(33, 150, 243, ${(0.15 + 0.85 * count / max).toFixed(2)});">
+                    <div class="radar-metric">${labels[i][j]}</div>
+                    <div class="radar-score">${count}</div>
+                </div>
+            `).join('')).join('')}
+        </div>
+    `;
+}
+
+function distributionSVG(distribution) {
+    const classes = Object.keys(distribution.counts);
+    const nBins = distribution.counts[classes[0]].length;
+    const max = Math.max(...classes.flatMap(c => distribution.counts[c]), 1);
+    const slot = CHART_WIDTH / nBins;
+    const barWidth = slot / classes.length;
+    const bars = classes.map((c, k) => distribution.counts[c].map((count, i) => {
+        const height = count / max * CHART_HEIGHT;
+        return `<rect x="${(i * slot + k * barWidth).toFixed(1)}" y="${(CHART_HEIGHT - height).toFixed(1)}"
+                      width="${Math.max(barWidth - 1, 1).toFixed(1)}" height="${height.toFixed(1)}"
+                      fill="${CLASS_COLORS[c] || 'var(--accent-color)'}" opacity="0.8"/>`;
+    }).join('')).join('');
+    return `<svg viewBox="0 0 ${CHART_WIDTH} ${CHART_HEIGHT}" width="100%" role="img">${bars}</svg>`;
+}
+
+function displayChartData(data) {
+    const chartDataContent = document.getElementById('chartDataContent');
+    const modelCards = Object.entries(data.models).map(([name, chart]) => `
+        <div class="chart-card animate__animated animate__fadeInUp">
+            <div class="chart-title">
+                <i class="fas fa-chart-area"></i>
+                ROC Curve: ${name} (AUC ${(chart.roc.auc * 100).toFixed(2)}%)
+            </div>
+            ${rocChartSVG(chart.roc)}
+        </div>
+        <div class="chart-card animate__animated animate__fadeInUp">
+            <div class="chart-title">
+                <i class="fas fa-th"></i>
+                Confusion Matrix: ${name}
+            </div>
+            ${confusionMatrixHTML(chart.confusion_matrix)}
+        </div>
+    `).join('');
+    
+    const distributionCards = Object.entries(data.feature_distributions).map(([feature, distribution]) => `
+        <div class="chart-card animate__animated animate__fadeInUp">
+            <div class="chart-title">
+                <i class="fas fa-chart-bar"></i>
+                ${feature.replace(/_/g, ' ')}
+            </div>
+            ${distributionSVG(distribution)}
+            <div class="radar-metric" style="display: flex; justify-content: space-between;">
+                <span>${distribution.kind === 'levels' ? distribution.levels[0] : distribution.edges[0]}</span>
+                <span>${distribution.kind === 'levels' ? distribution.levels[distribution.levels.length - 1] : distribution.edges[distribution.edges.length - 1]}</span>
+            </div>
+        </div>
+    `).join('');
+    
+    // Artifacts rebuilt without retraining only carry curves for the deployed model
+    const missing = data.models_without_curves || [];
+    const coverageNote = missing.length ? `
+        <div class="chart-card animate__animated animate__fadeInUp">
+            <div class="chart-title">
+                <i class="fas fa-info-circle"></i>
+                Curves for ${Object.keys(data.models).length} of ${Object.keys(data.models).length + missing.length} models
+            </div>
+            <p class="radar-metric">
+                ROC curves and confusion matrices are only available for the models above.
+                The metrics for ${missing.join(', ')} come from an earlier training run whose
+                predictions were not kept; retrain with src/training_pipeline.py to chart every model.
+            </p>
+        </div>
+    ` : '';
+    
+    chartDataContent.innerHTML = modelCards + coverageNote + distributionCards;
+}
+
 // ========== INITIALIZE ==========
 document.addEventListener('DOMContentLoaded', () => {
-    // Load model info
-    loadModelInfo();
+    // Load model info and models comparison, then record time to interactive
+    Promise.all([loadModelInfo(), loadModelsComparison()]).then(() => {
+        performance.mark('piq:interactive');
+        performance.measure('piq:time-to-interactive', { end: 'piq:interactive' });
+        const [tti] = performance.getEntriesByName('piq:time-to-interactive');
+        if (tti) console.info(`Time to interactive: ${tti.duration.toFixed(0)} ms`);
+    });
+    
+    // Load precomputed chart data
+    loadChartData();
     
-    // Load models comparison
-    loadModelsComparison();
+    // Load the model for in-browser predictions
+    loadBrowserModel();
     
     // Add smooth appearance to elements
     const observeElements = document.querySelectorAll('.stat-card, .feature-card');
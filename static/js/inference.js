@@ -0,0 +1,163 @@
+// ===================================
+// DISEASE PREDICTIONIQ - IN-BROWSER INFERENCE
+// MLP Forward Pass over the Exported Model
+// Author: Jay Prakash
+// ===================================
+//
+// Mirrors the /api/predict response for the artifact served by /api/model-export,
+// so predictions need no server round trip. Loaded as a plain script in the page
+// (window.PredictionIQInference) and with require() by the parity test.
+
+(function (root, factory) {
+    const api = factory();
+    if (typeof module !== 'undefined' && module.exports) {
+        module.exports = api;
+    } else {
+        root.PredictionIQInference = api;
+    }
+})(typeof self !== 'undefined' ? self : this, function () {
+    const SUPPORTED_FORMAT = 'predictioniq-mlp';
+    const SUPPORTED_FORMAT_VERSION = 1;
+
+    const ACTIVATIONS = {
+        identity: x => x,
+        relu: x => (x > 0 ? x : 0),
+        tanh: Math.tanh,
+        logistic: x => 1 / (1 + Math.exp(-x))
+    };
+
+    // ========== ARTIFACT DECODING ==========
+    function decodeFloat64(base64) {
+        const binary = typeof atob === 'function'
+            ? atob(base64)
+            : Buffer.from(base64, 'base64').toString('binary');
+        const view = new DataView(new ArrayBuffer(binary.length));
+        for (let i = 0; i < binary.length; i++) {
+            view.setUint8(i, binary.charCodeAt(i));
+        }
+        const values = new Float64Array(binary.length / 8);
+        for (let i = 0; i < values.length; i++) {
+            values[i] = view.getFloat64(i * 8, true);
+        }
+        return values;
+    }
+
+    function loadModel(artifact) {
+        if (artifact.format !== SUPPORTED_FORMAT || artifact.format_version !== SUPPORTED_FORMAT_VERSION) {
+            throw new Error(`Unsupported model artifact: ${artifact.format} v${artifact.format_version}`);
+        }
+        if (!(artifact.hidden_activation in ACTIVATIONS) || !(artifact.output_activation in ACTIVATIONS)) {
+            throw new Error(`Unsupported activation: ${artifact.hidden_activation}/${artifact.output_activation}`);
+        }
+        return {
+            version: artifact.version,
+            featureNames: artifact.feature_names,
+            mean: decodeFloat64(artifact.scaler.mean),
+            scale: decodeFloat64(artifact.scaler.scale),
+            hiddenActivation: ACTIVATIONS[artifact.hidden_activation],
+            outputActivation: ACTIVATIONS[artifact.output_activation],
+            layers: artifact.layers.map(layer => ({
+                nIn: layer.shape[0],
+                nOut: layer.shape[1],
+                weights: decodeFloat64(layer.weights),
+                bias: decodeFloat64(layer.bias)
+            })),
+            riskLevels: artifact.risk_levels
+        };
+    }
+
+    // ========== FORWARD PASS ==========
+    function predictProbability(model, features) {
+        let activations = Float64Array.from(features, (x, j) => (x - model.mean[j]) / model.scale[j]);
+        model.layers.forEach((layer, index) => {
+            const activation = index === model.layers.length - 1 ? model.outputActivation : model.hiddenActivation;
+            const output = Float64Array.from(layer.bias);
+            // Row-major (nIn x nOut) weights: accumulate one input row at a time
+            for (let i = 0; i < layer.nIn; i++) {
+                const x = activations[i];
+                const row = i * layer.nOut;
+                for (let j = 0; j < layer.nOut; j++) {
+                    output[j] += x * layer.weights[row + j];
+                }
+            }
+            activations = output.map(activation);
+        });
+        return activations[0];
+    }
+
+    function riskLevel(model, probability) {
+        return model.riskLevels.find(entry => entry.below === null || probability < entry.below);
+    }
+
+    // ========== RESPONSE (same fields as /api/predict) ==========
+    function getRecommendations(prediction, probability, patientData) {
+        const recommendations = [];
+        const number = value => Math.trunc(Number(value || 0));
+
+        if (prediction === 1) {
+            recommendations.push("⚠️ Consult a cardiologist immediately for comprehensive evaluation");
+            recommendations.push("📋 Schedule diagnostic tests: ECG, Echocardiogram, Stress Test");
+            recommendations.push("💊 Discuss medication options with your healthcare provider");
+        }
+
+        if (number(patientData.age) > 55) {
+            recommendations.push("🏃 Engage in moderate physical activity (30 mins daily)");
+        }
+
+        if (number(patientData.cholesterol) > 240) {
+            recommendations.push("🥗 Adopt a heart-healthy diet low in saturated fats");
+            recommendations.push("💊 Consider cholesterol-lowering medication (consult doctor)");
+        }
+
+        if (number(patientData.resting_blood_pressure) > 140) {
+            recommendations.push("🩺 Monitor blood pressure regularly");
+            recommendations.push("🧂 Reduce sodium intake (< 2,300 mg/day)");
+        }
+
+        if (prediction === 0) {
+            recommendations.push("✅ Maintain healthy lifestyle habits");
+            recommendations.push("🏋️ Regular exercise (150 mins/week)");
+            recommendations.push("🥦 Balanced diet rich in fruits and vegetables");
+            recommendations.push("📅 Regular health check-ups (annual)");
+        }
+
+        recommendations.push("🚭 Avoid smoking and limit alcohol consumption");
+        recommendations.push("😴 Ensure adequate sleep (7-9 hours/night)");
+        recommendations.push("🧘 Practice stress management techniques");
+
+        return recommendations.slice(0, 6);
+    }
+
+    function formatTimestamp(date) {
+        const pad = n => String(n).padStart(2, '0');
+        return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())} ` +
+               `${pad(date.getHours())}:${pad(date.getMinutes())}:${pad(date.getSeconds())}`;
+    }
+
+    function predict(model, patientData) {
+        const features = model.featureNames.map(name => Number(patientData[name] || 0));
+        if (features.some(Number.isNaN)) {
+            throw new Error('Non-numeric input');
+        }
+        const probabilityOne = predictProbability(model, features);
+        // MLPClassifier labels a sample positive when its probability exceeds 0.5
+        const prediction = probabilityOne > 0.5 ? 1 : 0;
+        const probability = probabilityOne * 100;
+        const risk = riskLevel(model, probability);
+
+        return {
+            success: true,
+            prediction: prediction,
+            probability: Math.round(probability * 100) / 100,
+            risk_level: risk.level,
+            risk_color: risk.color,
+            diagnosis: prediction === 1 ? 'Heart Disease Detected' : 'No Heart Disease Detected',
+            confidence: Math.round(Math.max(probabilityOne, 1 - probabilityOne) * 10000) / 100,
+            timestamp: formatTimestamp(new Date()),
+            recommendations: getRecommendations(prediction, probability, patientData),
+            source: 'browser'
+        };
+    }
+
+    return { loadModel, predictProbability, riskLevel, predict };
+});
@@ -0,0 +1,75 @@
+"""
+Tests for the Budgeted Successive Halving Search
+Checks the halving schedule, fit accounting and that interrupted rungs are discarded
+Author: Jay Prakash
+"""
+
+import os
+import sys
+from collections import Counter
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import adaptive_search
+from adaptive_search import LogUniform, SuccessiveHalvingSearch
+
+
+def make_data():
+    """Small deterministic binary problem"""
+    return make_classification(n_samples=450, n_features=6, random_state=0)
+
+
+def make_search(**kwargs):
+    """Search over C with 9 candidates, eta=3 and three rungs (30, 90, 270 rows)"""
+    options = dict(param_space={'C': LogUniform(1e-3, 1e2)}, n_candidates=9, eta=3,
+                   min_resource=30, max_resource=270, cv=3, random_state=0)
+    options.update(kwargs)
+    return SuccessiveHalvingSearch(LogisticRegression(max_iter=200), **options)
+
+
+def test_halving_schedule_and_fit_accounting():
+    """Test rung sizes, resources and that the fit budget is never exceeded"""
+    X, y = make_data()
+    # A full bracket needs (9 + 3 + 1) * 3 = 39 fits; after two, the 22 left fit a
+    # bracket shrunk to 5 candidates: (5 + 1 + 1) * 3 = 21 fits
+    result = make_search(max_fits=100).fit(X, y)
+
+    cv_results = result.cv_results_
+    assert len(cv_results['params']) == len(cv_results['mean_test_score']) == 33
+    rungs = Counter(zip(cv_results['bracket'], cv_results['rung'], cv_results['resource']))
+    assert rungs == {(0, 0, 30): 9, (0, 1, 90): 3, (0, 2, 270): 1,
+                     (1, 0, 30): 9, (1, 1, 90): 3, (1, 2, 270): 1,
+                     (2, 0, 30): 5, (2, 1, 90): 1, (2, 2, 270): 1}
+    # 99 cross-validation fits plus the final refit on all rows
+    assert result.n_fits_ == 2 * 39 + 21 + 1
+
+    finals = cv_results['mean_test_score'][cv_results['resource'] == 270]
+    assert result.best_score_ == finals.max()
+    assert result.time_to_best_ is not None
+
+
+def test_interrupted_rung_is_discarded(monkeypatch):
+    """Test that rungs cut short by the time budget contribute no results"""
+    X, y = make_data()
+    expected = {0: 9, 1: 3, 2: 1}
+    truncated_brackets = 0
+
+    for max_time in range(30, 90, 4):
+        # Fake clock: every reading advances one second, so the budget ends at a fixed point
+        ticks = iter(range(10 ** 6))
+        monkeypatch.setattr(adaptive_search.time, 'perf_counter', lambda: float(next(ticks)))
+        result = make_search(max_time=max_time).fit(X, y)
+
+        cv_results = result.cv_results_
+        per_rung = Counter(zip(cv_results['bracket'], cv_results['rung']))
+        for (bracket, rung), count in per_rung.items():
+            assert count == expected[rung], f"bracket {bracket} rung {rung} is partial"
+        last_bracket = max(b for b, _ in per_rung)
+        truncated_brackets += (last_bracket, 2) not in per_rung
+        # The best score always comes from the full resource
+        assert result.best_score_ in cv_results['mean_test_score'][cv_results['resource'] == 270]
+
+    # Some budgets ran out mid-bracket and kept only that bracket's complete rungs
+    assert truncated_brackets > 0
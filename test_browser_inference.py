@@ -0,0 +1,113 @@
+"""
+Parity Tests for In-Browser MLP Inference
+Checks that the JavaScript forward pass in static/js/inference.js matches sklearn
+Author: Jay Prakash
+"""
+
+import json
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.neural_network import MLPClassifier
+from sklearn.preprocessing import StandardScaler
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from browser_model import browser_model_payload, risk_level
+
+DATASET_PATH = os.path.join(ROOT_DIR, 'heart_disease_dataset.csv')
+MODELS_DIR = os.path.join(ROOT_DIR, 'models')
+INFERENCE_JS = os.path.join(ROOT_DIR, 'static', 'js', 'inference.js')
+
+# Reads {artifact, rows} on stdin and prints the browser result for every row
+NODE_SCRIPT = """
+const inference = require(process.argv[1]);
+let input = '';
+process.stdin.on('data', chunk => { input += chunk; });
+process.stdin.on('end', () => {
+    const { artifact, rows } = JSON.parse(input);
+    const model = inference.loadModel(artifact);
+    const results = rows.map(row => {
+        const result = inference.predict(model, row);
+        return { probability: inference.predictProbability(model, model.featureNames.map(n => row[n])),
+                 prediction: result.prediction, risk_level: result.risk_level };
+    });
+    process.stdout.write(JSON.stringify(results));
+});
+"""
+
+requires_node = pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+
+
+def load_patients():
+    """Load every patient of the dataset as raw (unscaled) features"""
+    df = pd.read_csv(DATASET_PATH)
+    return df.drop(columns=['heart_disease'])
+
+
+def run_in_node(model, scaler, patients):
+    """Run the browser forward pass on every patient and return its results"""
+    body, _ = browser_model_payload(model, scaler, list(patients.columns))
+    payload = json.dumps({'artifact': json.loads(body), 'rows': patients.to_dict('records')})
+    output = subprocess.run(['node', '-e', NODE_SCRIPT, INFERENCE_JS], input=payload,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def check_parity(model, scaler, patients):
+    """Compare browser probabilities, labels and risk levels with the server path"""
+    expected = model.predict_proba(scaler.transform(patients.values))[:, 1]
+    results = run_in_node(model, scaler, patients)
+
+    actual = np.array([r['probability'] for r in results])
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+    np.testing.assert_array_equal([r['prediction'] for r in results],
+                                  model.predict(scaler.transform(patients.values)))
+    assert [r['risk_level'] for r in results] == [risk_level(p * 100)[0] for p in expected]
+
+
+@requires_node
+def test_exported_model_parity():
+    """Test the deployed MLP in the browser against sklearn on the full dataset"""
+    with open(os.path.join(MODELS_DIR, 'best_heart_disease_model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+    with open(os.path.join(MODELS_DIR, 'scaler.pkl'), 'rb') as f:
+        scaler = pickle.load(f)
+    if not isinstance(model, MLPClassifier):
+        pytest.skip(f'deployed model is {type(model).__name__}, not an MLP')
+    check_parity(model, scaler, load_patients())
+
+
+@requires_node
+def test_activation_parity():
+    """Test every hidden activation against sklearn on the full dataset"""
+    df = pd.read_csv(DATASET_PATH)
+    patients = load_patients()
+    scaler = StandardScaler().fit(patients.values)
+    for activation in ('relu', 'tanh', 'logistic', 'identity'):
+        model = MLPClassifier(hidden_layer_sizes=(16, 8), activation=activation,
+                              max_iter=200, random_state=42)
+        model.fit(scaler.transform(patients.values), df['heart_disease'])
+        check_parity(model, scaler, patients)
+
+
+def test_unsupported_model_not_exported():
+    """Test that non-MLP models fall back to the server"""
+    from sklearn.linear_model import LogisticRegression
+    patients = load_patients()
+    model = LogisticRegression().fit(patients.values, pd.read_csv(DATASET_PATH)['heart_disease'])
+    assert browser_model_payload(model, None, list(patients.columns)) is None
+
+
+def test_risk_levels():
+    """Test the risk level boundaries shared by the server and the browser"""
+    assert risk_level(29.99)[0] == 'Low'
+    assert risk_level(30)[0] == 'Moderate'
+    assert risk_level(59.99)[0] == 'Moderate'
+    assert risk_level(60)[0] == 'High'
@@ -0,0 +1,127 @@
+"""
+Tests for the Chart Data Module and its API
+Checks the chart payloads, their section split and ETag revalidation through the Flask test client
+Author: Jay Prakash
+"""
+
+import hashlib
+import json
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import auc, confusion_matrix, roc_curve
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+import app as web
+from chart_data import (CHART_SECTIONS, MAX_CHART_POINTS, build_chart_data, load_chart_payloads,
+                        write_chart_data)
+
+DATASET_PATH = os.path.join(ROOT_DIR, 'heart_disease_dataset.csv')
+
+
+def make_chart_data(seed=0, n_test=500):
+    """Chart data for three compared models, two of them with predictions"""
+    rng = np.random.default_rng(seed)
+    y_test = rng.integers(0, 2, n_test)
+    comparison, rows = [], []
+    for name, strength in (('Random Forest', 1.5), ('Logistic Regression', 1.0), ('SVM', 0.5)):
+        scores = rng.normal(y_test * strength, 1.0)
+        fpr, tpr, _ = roc_curve(y_test, scores)
+        roc_auc = auc(fpr, tpr)
+        comparison.append({'name': name, 'category': 'Other', 'accuracy': 0.7, 'precision': 0.7,
+                           'recall': 0.7, 'f1_score': 0.7, 'roc_auc': roc_auc,
+                           'is_best': name == 'Random Forest'})
+        if name != 'SVM':
+            rows.append({'Model': name, 'ROC-AUC': roc_auc,
+                         'ROC Curve': {'fpr': fpr, 'tpr': tpr},
+                         'Confusion Matrix': confusion_matrix(y_test, scores > 0.5).tolist()})
+    return build_chart_data(comparison, pd.DataFrame(rows), pd.read_csv(DATASET_PATH))
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client serving chart data written to a temporary models directory"""
+    write_chart_data(make_chart_data(), str(tmp_path))
+    monkeypatch.setattr(web, 'chart_payloads', load_chart_payloads(str(tmp_path)))
+    return web.app.test_client()
+
+
+def test_chart_payloads(tmp_path):
+    """Test the written document, the per-section payloads and their content ETags"""
+    path = write_chart_data(make_chart_data(), str(tmp_path))
+    payloads = load_chart_payloads(str(tmp_path))
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    assert set(payloads) == {'all', *CHART_SECTIONS}
+    assert payloads['all'][0] == raw
+    for name, (body, etag) in payloads.items():
+        assert etag == hashlib.sha256(body).hexdigest()[:32]
+    assert len({etag for _, etag in payloads.values()}) == len(payloads)
+
+    document = json.loads(raw)
+    assert [row[0] for row in document['metrics']['rows']] == \
+        ['Random Forest', 'Logistic Regression', 'SVM']
+    assert sorted(document['models']) == ['Logistic Regression', 'Random Forest']
+    assert document['models_without_curves'] == ['SVM']
+    for chart in document['models'].values():
+        roc = chart['roc']
+        assert len(roc['fpr']) == len(roc['tpr']) <= MAX_CHART_POINTS
+        assert (roc['fpr'][0], roc['tpr'][0], roc['fpr'][-1], roc['tpr'][-1]) == (0, 0, 1, 1)
+        assert sum(map(sum, chart['confusion_matrix'])) == 500
+    age = document['feature_distributions']['age']
+    assert age['kind'] == 'histogram'
+    assert sum(age['counts']['0']) + sum(age['counts']['1']) == 400
+    assert document['feature_distributions']['sex']['kind'] == 'levels'
+
+    for section in CHART_SECTIONS:
+        payload = json.loads(payloads[section][0])
+        expected = {'version', 'generated_at', section}
+        if section == 'models':
+            expected.add('models_without_curves')
+        assert set(payload) == expected
+        assert payload[section] == document[section]
+
+    assert load_chart_payloads(str(tmp_path / 'missing')) == {}
+
+
+def test_chart_data_etag_revalidation(client):
+    """Test strong ETags, no-cache revalidation and 304s for the document and each section"""
+    for url in ['/api/chart-data'] + [f'/api/chart-data/{s}' for s in CHART_SECTIONS]:
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.headers['Cache-Control'] == 'no-cache'
+        etag, weak = response.get_etag()
+        assert etag and not weak
+        assert json.loads(response.data)['version'] == 1
+
+        revalidated = client.get(url, headers={'If-None-Match': f'"{etag}"'})
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+        assert revalidated.get_etag() == (etag, False)
+
+        assert client.get(url, headers={'If-None-Match': '"stale"'}).status_code == 200
+
+
+def test_chart_data_changes_and_errors(client, tmp_path, monkeypatch):
+    """Test that new data gets a new ETag, and unknown or missing data a 404"""
+    etag = client.get('/api/chart-data/models').get_etag()[0]
+
+    write_chart_data(make_chart_data(seed=1), str(tmp_path))
+    monkeypatch.setattr(web, 'chart_payloads', load_chart_payloads(str(tmp_path)))
+    response = client.get('/api/chart-data/models', headers={'If-None-Match': f'"{etag}"'})
+    assert response.status_code == 200
+    assert response.get_etag()[0] != etag
+
+    response = client.get('/api/chart-data/unknown')
+    assert response.status_code == 404
+    assert 'metrics' in response.get_json()['message']
+
+    monkeypatch.setattr(web, 'chart_payloads', {})
+    assert client.get('/api/chart-data').status_code == 404
@@ -0,0 +1,132 @@
+"""
+Tests for the Data Preprocessing Module
+Checks the binary column cache, the chunked schema reader and the out-of-core memmap split
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from data_preprocessing import (DATASET_SCHEMA, _cache_dir, iter_data_chunks, load_data,
+                                preprocess_arrays, preprocess_data, preprocess_to_memmap)
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heart_disease_dataset.csv')
+
+
+def test_rebuild_keeps_mapped_frames_valid(tmp_path):
+    """Test that rebuilding the cache leaves frames mapped from the old one intact"""
+    source = pd.read_csv(DATASET_PATH)
+    csv_path = str(tmp_path / 'data.csv')
+    source.to_csv(csv_path, index=False)
+
+    load_data(csv_path)
+    mapped = load_data(csv_path)  # served from the cache, memory-mapped
+    expected = source.copy()
+
+    # A shorter CSV: overwriting the mapped files in place would truncate them
+    source.iloc[:50].to_csv(csv_path, index=False)
+    os.utime(csv_path, ns=(0, 0))
+    rebuilt = load_data(csv_path)
+    pd.testing.assert_frame_equal(mapped, expected)
+    assert len(rebuilt) == 50
+
+    reloaded = load_data(csv_path)
+    pd.testing.assert_frame_equal(reloaded, source.iloc[:50])
+    generations = [name for name in os.listdir(_cache_dir(csv_path)) if name != 'manifest.json']
+    assert len(generations) == 1
+
+
+def test_unwritable_cache_falls_back_to_csv(tmp_path):
+    """Test that loading still works when the cache directory cannot be created"""
+    source = pd.read_csv(DATASET_PATH)
+    csv_path = str(tmp_path / 'data.csv')
+    source.to_csv(csv_path, index=False)
+    with open(_cache_dir(csv_path), 'w') as f:
+        f.write('not a directory')
+
+    for _ in range(2):
+        df = load_data(csv_path)
+        np.testing.assert_array_equal(df.to_numpy(), source.to_numpy())
+
+
+def test_schema_round_trips_the_dataset():
+    """Test that the compact schema reads every shipped value without loss"""
+    source = pd.read_csv(DATASET_PATH)
+    compact = pd.concat(iter_data_chunks(DATASET_PATH, chunksize=64), ignore_index=True)
+
+    assert list(compact.columns) == list(source.columns)
+    assert {c: str(t) for c, t in compact.dtypes.items()} == DATASET_SCHEMA
+    for column in source.columns:
+        values = compact[column].to_numpy(dtype=np.float64)
+        if column == 'st_depression':
+            # float32 keeps the one-decimal values the CSV stores
+            values = values.round(1)
+        np.testing.assert_array_equal(values, source[column].to_numpy(dtype=np.float64))
+
+
+def test_memmap_split_is_independent_of_chunk_size(tmp_path):
+    """Test that the memmap split and scaling are the same for any chunk size"""
+    outputs = [preprocess_to_memmap(DATASET_PATH, str(tmp_path / f'chunks_{chunksize}'),
+                                    chunksize=chunksize)
+               for chunksize in (400, 64, 37)]
+    for output in outputs[1:]:
+        for array, expected in zip(output[:4], outputs[0][:4]):
+            np.testing.assert_array_equal(array, expected)
+        assert output[4] == outputs[0][4]
+
+
+def test_memmap_outputs_and_scaler(tmp_path):
+    """Test memmap dtypes and shapes, and the partial_fit scaler against one fit"""
+    X_train, X_test, y_train, y_test, feature_names, scaler = preprocess_to_memmap(
+        DATASET_PATH, str(tmp_path), test_size=0.2, random_state=42, chunksize=50)
+    # The same float32-parsed values the memmap passes read
+    source = pd.read_csv(DATASET_PATH, dtype=DATASET_SCHEMA)
+    features = source.drop(columns=['heart_disease']).to_numpy(dtype=np.float64)
+    test_mask = np.random.default_rng(42).random(len(source)) < 0.2
+
+    assert feature_names == [c for c in source.columns if c != 'heart_disease']
+    for array in (X_train, X_test, y_train, y_test):
+        assert isinstance(array, np.memmap)
+    assert X_train.dtype == X_test.dtype == np.float32
+    assert y_train.dtype == y_test.dtype == np.int8
+    assert X_train.shape == ((~test_mask).sum(), len(feature_names))
+    assert X_test.shape == (test_mask.sum(), len(feature_names))
+
+    reference = StandardScaler().fit(features[~test_mask])
+    np.testing.assert_allclose(scaler.mean_, reference.mean_, rtol=1e-12, atol=0)
+    np.testing.assert_allclose(scaler.var_, reference.var_, rtol=1e-12, atol=0)
+    assert scaler.n_samples_seen_ == reference.n_samples_seen_
+
+    # Rows keep file order within each split
+    np.testing.assert_allclose(X_train, reference.transform(features[~test_mask]), atol=1e-5)
+    np.testing.assert_allclose(X_test, reference.transform(features[test_mask]), atol=1e-5)
+    np.testing.assert_array_equal(y_train, source['heart_disease'][~test_mask])
+    np.testing.assert_array_equal(y_test, source['heart_disease'][test_mask])
+
+
+def test_preprocess_arrays_matches_preprocess_data():
+    """Test that the float32 path gives the preprocess_data split and scaling"""
+    df = pd.read_csv(DATASET_PATH)
+    X_train, X_test, y_train, y_test, feature_names, scaler = preprocess_data(df)
+    arrays = preprocess_arrays(df)
+
+    assert arrays['feature_names'] == feature_names
+    np.testing.assert_array_equal(df.index[arrays['train_index']], X_train.index)
+    np.testing.assert_array_equal(df.index[arrays['test_index']], X_test.index)
+
+    for name in ('X_train', 'X_test'):
+        assert arrays[name].dtype == np.float32
+        assert arrays[name].flags['C_CONTIGUOUS']
+    for name in ('y_train', 'y_test'):
+        assert arrays[name].dtype == np.int8
+    np.testing.assert_allclose(arrays['X_train'], X_train.to_numpy(), rtol=0, atol=1e-5)
+    np.testing.assert_allclose(arrays['X_test'], X_test.to_numpy(), rtol=0, atol=1e-5)
+    np.testing.assert_array_equal(arrays['y_train'], y_train.to_numpy())
+    np.testing.assert_array_equal(arrays['y_test'], y_test.to_numpy())
+    np.testing.assert_allclose(arrays['scaler'].mean_, scaler.mean_, rtol=1e-6)
+    np.testing.assert_allclose(arrays['scaler'].scale_, scaler.scale_, rtol=1e-6)
@@ -0,0 +1,141 @@
+"""
+Accuracy Tests for the Data Profiling Module
+Checks the sketches and moment accumulator against pandas and StandardScaler with explicit error bounds
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from data_profiling import DataProfile, DistinctCounter, MomentAccumulator, QuantileSketch
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heart_disease_dataset.csv')
+
+# HyperLogLog standard error is 1.04 / sqrt(2 ** precision): 0.81% at precision 14
+HLL_PRECISION = 14
+HLL_MAX_RELATIVE_ERROR = 4 * 1.04 / np.sqrt(2 ** HLL_PRECISION)
+
+# Worst rank error over 99 quantiles at k=256; about 0.5% is typical
+KLL_K = 256
+KLL_MAX_RANK_ERROR = 0.02
+
+
+def merged(sketches):
+    """Merge partial sketches or profiles the way profile_csv does"""
+    total = sketches[0]
+    for sketch in sketches[1:]:
+        total.merge(sketch)
+    return total
+
+
+def split_rows(df, n_chunks):
+    """Split a frame into consecutive row chunks"""
+    return [df.iloc[rows] for rows in np.array_split(np.arange(len(df)), n_chunks)]
+
+
+def load_with_nans(seed=0, fraction=0.05):
+    """The dataset as float64 with missing values injected"""
+    df = pd.read_csv(DATASET_PATH).astype(np.float64)
+    rng = np.random.default_rng(seed)
+    features = df.columns.drop('heart_disease')
+    df[features] = df[features].mask(rng.random((len(df), len(features))) < fraction)
+    return df
+
+
+@pytest.mark.parametrize('n_distinct', [5000, 50000, 500000])
+def test_hyperloglog_matches_nunique(n_distinct):
+    """Test the merged HyperLogLog estimate against Series.nunique()"""
+    rng = np.random.default_rng(n_distinct)
+    values = pd.Series(rng.integers(0, 3 * n_distinct, 2 * n_distinct))
+    expected = values.nunique()
+
+    # A small exact limit forces the HyperLogLog path
+    counters = [DistinctCounter(exact_limit=100, precision=HLL_PRECISION) for _ in range(4)]
+    for i, chunk in enumerate(np.array_split(values.to_numpy(), 8)):
+        counters[i % 4].add_hashes(pd.util.hash_array(chunk))
+    counter = merged(counters)
+
+    assert not counter.is_exact
+    assert abs(counter.estimate() / expected - 1) <= HLL_MAX_RELATIVE_ERROR
+
+
+def test_exact_distinct_counts_match_nunique():
+    """Test that distinct counts below the exact limit equal nunique() exactly"""
+    df = load_with_nans()
+    profiles = [DataProfile() for _ in range(3)]
+    for i, chunk in enumerate(split_rows(df, 9)):
+        profiles[i % 3].update(chunk)
+    stats = merged(profiles).describe()
+    for column in df.columns:
+        assert stats[column]['distinct'] == df[column].nunique()
+
+
+def test_quantile_sketch_rank_error():
+    """Test merged KLL quantiles against the exact ranks of the data"""
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(0.0, 1.0, 300000)
+    sketches = [QuantileSketch(k=KLL_K, random_state=seed) for seed in range(3)]
+    for i, chunk in enumerate(np.array_split(values, 30)):
+        sketches[i % 3].update(chunk)
+    sketch = merged(sketches)
+
+    qs = np.linspace(0.01, 0.99, 99)
+    estimates = sketch.quantiles(qs)
+    ranks = np.searchsorted(np.sort(values), estimates, side='right') / len(values)
+    assert sketch.n == len(values)
+    assert sum(len(items) for items in sketch.levels) < len(values) / 100
+    assert np.abs(ranks - qs).max() <= KLL_MAX_RANK_ERROR
+
+
+def test_small_data_quantiles_match_pandas():
+    """Test that quantiles are exact (pandas interpolation) while the data fits in k"""
+    df = load_with_nans()
+    profiles = [DataProfile() for _ in range(2)]
+    for i, chunk in enumerate(split_rows(df, 4)):
+        profiles[i % 2].update(chunk)
+    stats = merged(profiles).describe()
+    expected = df.describe()
+    for column in df.columns:
+        for row in ('25%', '50%', '75%', 'min', 'max', 'count'):
+            assert stats[column][row] == expected[column][row]
+
+
+def test_moments_match_describe_and_corr():
+    """Test merged moments against describe() and df.corr() to float tolerance"""
+    df = load_with_nans()
+    accumulators = [MomentAccumulator(df.columns, 'heart_disease') for _ in range(3)]
+    for i, chunk in enumerate(split_rows(df, 7)):
+        accumulators[i % 3].update(chunk)
+    accumulator = merged(accumulators)
+
+    expected = df.describe().loc[['count', 'mean', 'std', 'min', 'max']]
+    pd.testing.assert_frame_equal(accumulator.describe(), expected, rtol=1e-12, atol=0)
+    expected_corr = df.corr()['heart_disease'].drop('heart_disease')
+    correlations = accumulator.correlations()
+    np.testing.assert_allclose(correlations.to_numpy(),
+                               expected_corr[correlations.index].to_numpy(), rtol=0, atol=1e-12)
+
+
+def test_exported_scaler_matches_standard_scaler():
+    """Test that to_scaler() equals StandardScaler().fit on the same rows"""
+    df = pd.read_csv(DATASET_PATH)
+    features = [c for c in df.columns if c != 'heart_disease']
+    accumulators = [MomentAccumulator(df.columns, 'heart_disease') for _ in range(4)]
+    for i, chunk in enumerate(split_rows(df, 10)):
+        accumulators[i % 4].update(chunk)
+    scaler = merged(accumulators).to_scaler(features)
+    reference = StandardScaler().fit(df[features])
+
+    np.testing.assert_allclose(scaler.mean_, reference.mean_, rtol=1e-12, atol=0)
+    np.testing.assert_allclose(scaler.var_, reference.var_, rtol=1e-12, atol=0)
+    np.testing.assert_allclose(scaler.scale_, reference.scale_, rtol=1e-12, atol=0)
+    assert scaler.n_samples_seen_ == reference.n_samples_seen_
+    np.testing.assert_array_equal(scaler.feature_names_in_, reference.feature_names_in_)
+    np.testing.assert_allclose(scaler.transform(df[features]), reference.transform(df[features]),
+                               rtol=0, atol=1e-12)
@@ -0,0 +1,75 @@
+"""
+Parity Tests for the Single-Sort Evaluation Module
+Checks evaluate_scores against sklearn metrics and curves, tied scores included
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+from sklearn.metrics import (accuracy_score, precision_score, recall_score, f1_score,
+                             roc_auc_score, roc_curve, precision_recall_curve,
+                             average_precision_score, confusion_matrix)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from evaluation import evaluate_scores
+
+
+def make_scores(n=2000, decimals=None, seed=0):
+    """Noisy scores correlated with the labels; rounding creates ties"""
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, n)
+    scores = np.clip(0.3 * y_true + rng.normal(0.35, 0.2, n), 0, 1)
+    if decimals is not None:
+        scores = np.round(scores, decimals)
+    return y_true, scores
+
+
+def check_parity(y_true, scores):
+    """Compare every metric and the full (undecimated) curves with sklearn"""
+    summary = evaluate_scores(y_true, scores, max_curve_points=10 ** 9)
+    y_pred = (scores >= 0.5).astype(int)
+
+    assert summary['accuracy'] == accuracy_score(y_true, y_pred)
+    assert np.isclose(summary['precision'], precision_score(y_true, y_pred), rtol=0, atol=1e-12)
+    assert np.isclose(summary['recall'], recall_score(y_true, y_pred), rtol=0, atol=1e-12)
+    assert np.isclose(summary['f1_score'], f1_score(y_true, y_pred), rtol=0, atol=1e-12)
+    assert summary['confusion_matrix'] == confusion_matrix(y_true, y_pred).tolist()
+    assert np.isclose(summary['roc_auc'], roc_auc_score(y_true, scores), rtol=0, atol=1e-12)
+    assert np.isclose(summary['average_precision'], average_precision_score(y_true, scores),
+                      rtol=0, atol=1e-12)
+
+    # ROC: one point per distinct threshold, starting at (0, 0) with an infinite threshold
+    fpr, tpr, thresholds = roc_curve(y_true, scores, drop_intermediate=False)
+    np.testing.assert_allclose(summary['roc_curve']['fpr'], fpr, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(summary['roc_curve']['tpr'], tpr, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(summary['roc_curve']['thresholds'][1:], thresholds[1:])
+
+    # Precision-recall: sklearn orders by increasing threshold and appends (recall 0, precision 1)
+    precision, recall, pr_thresholds = precision_recall_curve(y_true, scores)
+    np.testing.assert_allclose(summary['pr_curve']['precision'], precision[-2::-1],
+                               rtol=0, atol=1e-12)
+    np.testing.assert_allclose(summary['pr_curve']['recall'], recall[-2::-1], rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(summary['pr_curve']['thresholds'], pr_thresholds[::-1])
+
+
+def test_distinct_scores():
+    """Test parity when every score is distinct"""
+    check_parity(*make_scores())
+
+
+def test_tied_scores():
+    """Test parity when many scores are tied"""
+    y_true, scores = make_scores(decimals=1)
+    assert len(np.unique(scores)) < 20
+    check_parity(y_true, scores)
+
+
+def test_threshold_confusion_matrix_from_curve():
+    """Test the confusion matrix derived from the curve when no labels are given"""
+    y_true, scores = make_scores(decimals=2)
+    for threshold in (0.25, 0.5, 0.73):
+        summary = evaluate_scores(y_true, scores, threshold=threshold)
+        expected = confusion_matrix(y_true, (scores >= threshold).astype(int))
+        assert summary['confusion_matrix'] == expected.tolist()
@@ -0,0 +1,123 @@
+"""
+Tests for the Execution Backends Module
+Checks the process pool and Dask backends, and the executor path of the tuners against sklearn
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import GridSearchCV
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from data_preprocessing import preprocess_data
+import resource_budget
+from executors import budget_options, get_executor
+from model_training import HyperparameterTuning
+from resource_budget import BUDGET_ENV_VAR, ResourceBudget
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heart_disease_dataset.csv')
+
+
+def worker_pid(shared, offset):
+    """Task: the worker's process id and a value computed from the shared data"""
+    return os.getpid(), float(shared['X'].sum()) + offset
+
+
+def count_deliveries(shared, value):
+    """Task: record the call on the worker's copy of the shared data"""
+    shared['calls'].append(value)
+    return value * shared['scale'], os.getpid(), len(shared['calls'])
+
+
+def test_process_pool_reused_across_runs():
+    """Test that repeated runs with the same data reuse the workers"""
+    X = np.arange(10.0)
+    pids = set()
+    with get_executor('process', n_workers=2) as executor:
+        for rung in range(4):
+            # A fresh dict of the same arrays, as the tuners build per search
+            results = executor.run(worker_pid, [(k,) for k in range(6)], {'X': X})
+            assert [value for _, value in results] == [45.0 + k for k in range(6)]
+            pids.update(pid for pid, _ in results)
+        assert executor._pool is not None
+    assert len(pids) <= 2
+    assert executor._pool is None
+
+
+def test_process_pool_restarts_for_new_data():
+    """Test that a run with different shared data does not see stale data"""
+    with get_executor('process', n_workers=2) as executor:
+        first = executor.run(worker_pid, [(0,)], {'X': np.ones(3)})
+        second = executor.run(worker_pid, [(0,)], {'X': np.ones(5)})
+    assert first[0][1] == 3.0 and second[0][1] == 5.0
+
+
+def test_dask_executor_ships_shared_data_once():
+    """Test results, per-task timings and one copy of the shared data per Dask worker"""
+    pytest.importorskip('dask.distributed')
+    tasks = [(k,) for k in range(12)]
+    with get_executor('dask', n_workers=2) as executor:
+        results = executor.run(count_deliveries, tasks, {'scale': 10, 'calls': []})
+        timings = executor.timings
+
+    assert [value for value, _, _ in results] == [10 * k for k in range(12)]
+    assert [timing['task'] for timing in timings] == list(range(12))
+    assert all(timing['elapsed'] >= 0 and timing['worker'] for timing in timings)
+
+    # Every task on a worker appended to the same copy: its call counts run 1..n
+    per_worker = {}
+    for _, pid, n_calls in results:
+        per_worker.setdefault(pid, []).append(n_calls)
+    assert len(per_worker) <= 2
+    for counts in per_worker.values():
+        assert sorted(counts) == list(range(1, len(counts) + 1))
+
+
+def test_process_backend_grid_search_matches_grid_search_cv():
+    """Test that tuning on the process backend reproduces GridSearchCV"""
+    X_train, _, y_train, _, _, _ = preprocess_data(pd.read_csv(DATASET_PATH))
+    param_grid = {'max_depth': [3, 5, None], 'min_samples_leaf': [1, 5]}
+    estimator = DecisionTreeClassifier(random_state=42)
+
+    tuner = HyperparameterTuning(random_state=42, cv_folds=5, backend='process',
+                                 backend_options={'n_workers': 2})
+    try:
+        result = tuner._run_grid_search('Decision Tree', estimator, param_grid, X_train, y_train)
+    finally:
+        tuner.close()
+    reference = GridSearchCV(estimator, param_grid, cv=5, scoring='accuracy').fit(X_train, y_train)
+
+    assert result.cv_results_['params'] == reference.cv_results_['params']
+    for column in ['mean_test_score', 'std_test_score'] + [f'split{k}_test_score' for k in range(5)]:
+        np.testing.assert_allclose(result.cv_results_[column], reference.cv_results_[column],
+                                   rtol=0, atol=1e-12)
+    assert result.best_params_ == reference.best_params_
+    assert result.best_score_ == reference.best_score_
+    assert len(tuner.task_timings['Decision Tree']) == 6 * 5
+
+
+def test_pool_size_follows_cpu_budget(monkeypatch):
+    """Test that executors are sized from the CPU budget unless options override it"""
+    monkeypatch.setattr(resource_budget, 'available_cpus', lambda: 8)
+
+    tuner = HyperparameterTuning(backend='process', budget=ResourceBudget(3))
+    executor = tuner._get_executor()
+    assert (executor.n_workers, executor.threads_per_worker) == (3, 1)
+    tuner.close()
+
+    overridden = HyperparameterTuning(backend='process', budget=ResourceBudget(3),
+                                      backend_options={'n_workers': 2})
+    assert overridden._get_executor().n_workers == 2
+    overridden.close()
+
+    # Without an explicit budget the environment sets it, as for render_reports and profile_csv
+    monkeypatch.setenv(BUDGET_ENV_VAR, '4')
+    assert budget_options('process') == {'n_workers': 4, 'threads_per_worker': 1}
+    assert budget_options('process', n_workers=2) == {'n_workers': 2, 'threads_per_worker': 2}
+    assert budget_options('sequential') == {}
+    assert get_executor('process', **budget_options('process')).n_workers == 4
@@ -0,0 +1,126 @@
+"""
+Tests for the Learning Curves Module and Subsample Tuning
+Checks nested stratified subsamples, plateau detection, probe sizes and full-data final models
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from learning_curves import find_plateau, geometric_sizes, nested_stratified_order
+from model_training import HyperparameterTuning
+
+GRID = {'C': [0.01, 0.1, 1], 'penalty': ['l2'], 'solver': ['lbfgs']}
+
+
+def make_data(n_rows=4000, seed=0):
+    """A separable-enough binary problem where small subsamples already plateau"""
+    X, y = make_classification(n_samples=n_rows, n_features=8, n_informative=4,
+                               weights=[0.7], random_state=seed)
+    return pd.DataFrame(X, columns=[f'f{i}' for i in range(8)]), pd.Series(y)
+
+
+@pytest.mark.parametrize('weights', [(0.5, 0.5), (0.7, 0.3), (0.6, 0.3, 0.1)])
+def test_every_prefix_is_nested_and_stratified(weights):
+    """Test that order is a permutation whose every prefix keeps class proportions"""
+    rng = np.random.default_rng(1)
+    y = rng.choice(len(weights), size=1500, p=weights)
+    order = nested_stratified_order(y, random_state=3)
+
+    # A permutation, so order[:n] is contained in order[:m] for n < m with no repeats
+    np.testing.assert_array_equal(np.sort(order), np.arange(len(y)))
+    sizes = np.arange(1, len(y) + 1)
+    for label in np.unique(y):
+        in_prefix = np.cumsum(y[order] == label)
+        expected = sizes * np.mean(y == label)
+        # Jittered keys put each class's i-th row in [i, i+1) / n_k, so a prefix is
+        # off its share by less than one row per class
+        assert np.abs(in_prefix - expected).max() < len(weights)
+
+    np.testing.assert_array_equal(order, nested_stratified_order(y, random_state=3))
+    assert not np.array_equal(order, nested_stratified_order(y, random_state=4))
+
+
+def test_find_plateau_tolerance_and_patience():
+    """Test that a plateau needs `patience` later sizes within `tolerance`"""
+    scores = [0.5, 0.75, 0.875, 0.875, 0.9375]
+    assert find_plateau(scores, tolerance=0.0, patience=2) is None
+    assert find_plateau(scores, tolerance=0.0625, patience=1) == 2
+    assert find_plateau(scores, tolerance=0.0625, patience=2) == 2
+    # An improvement of exactly the tolerance still counts as a plateau
+    assert find_plateau(scores, tolerance=0.125, patience=2) == 1
+    assert find_plateau(scores, tolerance=0.25, patience=1) == 0
+    # Not enough later sizes to confirm yet
+    assert find_plateau(scores[:3], tolerance=0.5, patience=3) is None
+    assert find_plateau([0.8, 0.7, 0.6], tolerance=0.0, patience=2) == 0
+    assert find_plateau([], patience=2) is None
+
+
+@pytest.mark.parametrize('n_rows,min_size,growth,max_fraction', [
+    (100000, 200, 2.0, 0.5), (3000, 200, 1.5, 0.25), (1000, 200, 2.0, 0.1), (150, 200, 2.0, 0.5)])
+def test_geometric_sizes_bounds(n_rows, min_size, growth, max_fraction):
+    """Test the first size, the growth ratio and the upper bound of the probe sizes"""
+    sizes = geometric_sizes(n_rows, min_size, growth, max_fraction)
+    limit = min(n_rows, max(min_size, int(n_rows * max_fraction)))
+
+    assert sizes[0] == min(min_size, n_rows)
+    assert all(b > a for a, b in zip(sizes, sizes[1:]))
+    assert sizes[-1] <= limit
+    # The next size would pass the limit
+    assert int(min(min_size, n_rows) * growth ** len(sizes)) > limit
+
+
+def test_tune_on_subsample_refits_on_all_rows():
+    """Test that the stored model is fit on every training row and row-fits add up"""
+    X, y = make_data()
+    tuner = HyperparameterTuning(random_state=0, cv_folds=3)
+    search = tuner.tune_on_subsample('Logistic Regression', X, y, param_grid=GRID,
+                                     tolerance=0.05, min_size=200, patience=2)
+    info = tuner.subsample_results['Logistic Regression']
+    curve = info['learning_curve']
+    size = info['subsample_size']
+
+    assert curve['plateau_size'] == size == 200
+    assert curve['sizes'] == [200, 400, 800]
+    assert len(search.cv_results_['params']) == 3
+    assert search.best_estimator_.n_features_in_ == X.shape[1]
+
+    model = tuner.best_models['Logistic Regression']
+    assert model is not search.best_estimator_
+    reference = clone(search.best_estimator_).fit(X, y)
+    np.testing.assert_allclose(model.coef_, reference.coef_, rtol=1e-10)
+    assert not np.allclose(model.coef_, search.best_estimator_.coef_)
+
+    # Probes (k - 1) folds' worth of each size, the grid on the subsample, its
+    # refit, then one final fit on all rows
+    assert curve['row_fits'] == (200 + 400 + 800) * 2
+    assert info['row_fits'] == curve['row_fits'] + 3 * 2 * size + size + len(y)
+    assert info['n_rows'] == len(y)
+    assert info['cv_score'] == search.best_score_
+
+
+def test_compare_subsample_tuning_reports_both_paths():
+    """Test that the comparison accounts full-data tuning and saves row-fits"""
+    X, y = make_data(seed=1)
+    tuner = HyperparameterTuning(random_state=0, cv_folds=3)
+    comparison = tuner.compare_subsample_tuning('Logistic Regression', X.iloc[:3000],
+                                                y.iloc[:3000], X.iloc[3000:], y.iloc[3000:],
+                                                param_grid=GRID, tolerance=0.05)
+
+    assert comparison['full_row_fits'] == 3 * 2 * 3000 + 3000
+    assert comparison['subsample_row_fits'] == \
+        tuner.subsample_results['Logistic Regression']['row_fits']
+    assert comparison['subsample_row_fits'] < comparison['full_row_fits']
+    assert comparison['subsample_size'] < 3000
+    for key in ('full_test_accuracy', 'subsample_test_accuracy',
+                'full_test_roc_auc', 'subsample_test_roc_auc'):
+        assert 0.5 < comparison[key] <= 1.0
+    assert isinstance(tuner.best_models['Logistic Regression'], LogisticRegression)
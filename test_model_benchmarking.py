@@ -0,0 +1,66 @@
+"""
+Tests for the Model Benchmarking Module
+Checks that any latency batch size is measured and that selection fails clearly without costs
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.naive_bayes import GaussianNB
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from model_benchmarking import (BATCH_SIZES, benchmark_batch_sizes, benchmark_models,
+                                select_best_model)
+
+
+def test_requested_batch_size_is_benchmarked():
+    """Test that a latency limit at a batch size outside BATCH_SIZES can be applied"""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 4))
+    y = (X[:, 0] > 0).astype(int)
+    models = {'Logistic Regression': LogisticRegression(), 'Naive Bayes': GaussianNB()}
+    for model in models.values():
+        model.fit(X, y)
+
+    batch_sizes = benchmark_batch_sizes(8)
+    assert batch_sizes == tuple(sorted(BATCH_SIZES + (8,)))
+    costs = benchmark_models(models, X, y, X, batch_sizes=batch_sizes, n_repeats=3)
+    comparison = [{'name': name, 'roc_auc': score, **costs[name]}
+                  for name, score in (('Logistic Regression', 0.9), ('Naive Bayes', 0.8))]
+
+    best = select_best_model(comparison, max_latency_ms=1e6, latency_batch_size=8)
+    assert best['name'] == 'Logistic Regression'
+    with pytest.raises(ValueError, match='batch 64'):
+        select_best_model(comparison, max_latency_ms=1e6, latency_batch_size=64)
+    with pytest.raises(ValueError):
+        benchmark_batch_sizes(0)
+
+
+def test_selection_without_costs():
+    """Test that entries without serving costs select by metric but reject cost limits"""
+    comparison = [{'name': 'A', 'roc_auc': 0.7}, {'name': 'B', 'roc_auc': 0.8}]
+    assert select_best_model(comparison)['name'] == 'B'
+    with pytest.raises(ValueError, match='no latency'):
+        select_best_model(comparison, max_latency_ms=5)
+    with pytest.raises(ValueError, match='no measured size'):
+        select_best_model(comparison, max_size_bytes=1024)
+
+
+def test_selection_metric_is_explicit():
+    """Test that the pipeline passes its selection metric through to select_best_model"""
+    from training_pipeline import TrainingPipeline
+
+    comparison = [{'name': 'A', 'accuracy': 0.71, 'roc_auc': 0.74},
+                  {'name': 'B', 'accuracy': 0.69, 'roc_auc': 0.77}]
+    assert select_best_model(comparison)['name'] == 'B'
+    assert select_best_model(comparison, metric='accuracy')['name'] == 'A'
+
+    assert TrainingPipeline('data.csv').constraints['metric'] == 'roc_auc'
+    pipeline = TrainingPipeline('data.csv', selection_metric='accuracy')
+    assert select_best_model(comparison, **pipeline.constraints)['name'] == 'A'
+    with pytest.raises(ValueError, match='selection_metric'):
+        TrainingPipeline('data.csv', selection_metric='speed')
@@ -0,0 +1,131 @@
+"""
+Tests for the Hyperparameter Tuning Module
+Checks the tuning shortcuts against the plain sklearn searches they replace
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import GridSearchCV
+from sklearn.svm import SVC
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import model_training
+from data_preprocessing import preprocess_data
+from model_training import BaselineModels, HyperparameterTuning
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heart_disease_dataset.csv')
+
+
+def load_split():
+    """Load the dataset and return the scaled training split"""
+    df = pd.read_csv(DATASET_PATH)
+    X_train, _, y_train, _, _, _ = preprocess_data(df)
+    return X_train, y_train
+
+
+def test_random_forest_warm_start_matches_grid_search():
+    """Test that warm-started forest tuning reproduces GridSearchCV exactly"""
+    X_train, y_train = load_split()
+    param_grid = {'n_estimators': [5, 10, 20], 'max_depth': [3, None],
+                  'min_samples_leaf': [1, 4]}
+
+    tuner = HyperparameterTuning(random_state=42, cv_folds=5)
+    result = tuner.tune_random_forest(X_train, y_train, param_grid, warm_start=True)
+    reference = GridSearchCV(RandomForestClassifier(random_state=42), param_grid, cv=5,
+                             scoring='accuracy').fit(X_train, y_train)
+
+    assert result.cv_results_['params'] == reference.cv_results_['params']
+    for k in range(5):
+        np.testing.assert_array_equal(result.cv_results_[f'split{k}_test_score'],
+                                      reference.cv_results_[f'split{k}_test_score'])
+    np.testing.assert_allclose(result.cv_results_['mean_test_score'],
+                               reference.cv_results_['mean_test_score'], rtol=0, atol=1e-12)
+    assert result.best_params_ == reference.best_params_
+    assert result.best_score_ == reference.best_score_
+    assert result.time_to_best_ is not None and result.time_to_best_ <= result.elapsed_time_
+
+
+def test_evaluate_models_keeps_predictions_by_default():
+    """Test that evaluate_models still returns raw predictions unless asked not to"""
+    df = pd.read_csv(DATASET_PATH)
+    X_train, X_test, y_train, y_test, _, _ = preprocess_data(df)
+    model = LogisticRegression(max_iter=1000).fit(X_train, y_train)
+    evaluator = BaselineModels(random_state=42)
+    evaluator.models = {'Logistic Regression': model}
+
+    row = evaluator.evaluate_models(X_test, y_test).iloc[0]
+    np.testing.assert_array_equal(row['y_pred'], model.predict(X_test))
+    np.testing.assert_array_equal(row['y_pred_proba'], model.predict_proba(X_test))
+    np.testing.assert_array_equal(row['y_score'], model.predict_proba(X_test)[:, 1])
+
+    # Margins of a model without predict_proba are kept as scores, not as probabilities
+    margin_model = SVC(random_state=42).fit(X_train, y_train)
+    evaluator.models = {'SVM': margin_model}
+    row = evaluator.evaluate_models(X_test, y_test).iloc[0]
+    assert row['y_pred_proba'] is None
+    np.testing.assert_array_equal(row['y_score'], margin_model.decision_function(X_test))
+    evaluator.models = {'Logistic Regression': model}
+
+    compact = evaluator.evaluate_models(X_test, y_test, keep_predictions=False)
+    assert 'y_pred' not in compact.columns and 'y_pred_proba' not in compact.columns
+
+
+def test_svm_without_calibration_serves_probabilities():
+    """Test that calibration=None falls back to SVC(probability=True) everywhere"""
+    df = pd.read_csv(DATASET_PATH)
+    X_train, X_test, y_train, y_test, _, _ = preprocess_data(df)
+
+    tuner = HyperparameterTuning(random_state=42, cv_folds=3, calibration=None)
+    tuner.tune_svm(X_train, y_train, param_grid={'C': [1.0], 'kernel': ['rbf'], 'gamma': ['scale']})
+    model = tuner.best_models['SVM']
+    assert isinstance(model, SVC) and model.probability
+    assert model.predict_proba(X_test).shape == (len(X_test), 2)
+
+    baseline = BaselineModels(random_state=42, calibration=None)
+    baseline.train_svm(X_train, y_train, cv_folds=3)
+    assert baseline.models['SVM'].probability
+    row = baseline.evaluate_models(X_test, y_test).iloc[0]
+    assert 0.0 <= row['ROC-AUC'] <= 1.0
+
+    with pytest.raises(ValueError):
+        HyperparameterTuning(calibration='platt')
+
+
+def test_parallel_baseline_matches_sequential(monkeypatch):
+    """Test that the task-based baseline reproduces the sequential models and CV scores"""
+    df = pd.read_csv(DATASET_PATH)
+    X_train, X_test, y_train, _, _, _ = preprocess_data(df)
+
+    sequential = BaselineModels(random_state=42)
+    sequential.train_all_baseline_models(X_train, y_train, cv_folds=5)
+
+    outputs = []
+    fit_task = model_training._fit_task
+
+    def recording_fit_task(*args):
+        outputs.append(fit_task(*args))
+        return outputs[-1]
+
+    monkeypatch.setattr(model_training, '_fit_task', recording_fit_task)
+    parallel = BaselineModels(random_state=42, backend='sequential')
+    parallel.train_all_parallel(X_train, y_train, cv_folds=5)
+
+    assert parallel.models.keys() == sequential.models.keys()
+    for name, model in sequential.models.items():
+        np.testing.assert_array_equal(parallel.cv_results[name]['cv_scores'],
+                                      sequential.cv_results[name]['cv_scores'])
+        np.testing.assert_array_equal(parallel.models[name].predict_proba(X_test),
+                                      model.predict_proba(X_test))
+
+    # One final fit plus one fit per fold for each model; the stored models
+    # are the objects those final tasks returned, not refits
+    assert len(outputs) == len(parallel.task_timings) == len(sequential.models) * (5 + 1)
+    finals = {name: result for name, fold, result in outputs if fold is None}
+    assert all(parallel.models[name] is model for name, model in finals.items())
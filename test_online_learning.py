@@ -0,0 +1,140 @@
+"""
+Tests for the Online Learning Module
+Checks re-standardization, incremental updates, checkpoints, promotion and rollback
+Author: Jay Prakash
+"""
+
+import json
+import os
+import pickle
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neural_network import MLPClassifier
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from online_learning import OnlineLearner, create_sgd_model, rollback
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heart_disease_dataset.csv')
+
+
+def load_dataset():
+    """Split the dataset into an initial fit, a stream of new rows and a held-out set"""
+    df = pd.read_csv(DATASET_PATH)
+    features = [c for c in df.columns if c != 'heart_disease']
+    initial, stream, held_out = df.iloc[:200], df.iloc[200:350], df.iloc[350:]
+    return features, initial, stream, held_out
+
+
+def fit_initial(model, features, initial):
+    """Fit a scaler and model on the initial rows"""
+    scaler = StandardScaler().fit(initial[features].to_numpy(dtype=np.float64))
+    model.fit(scaler.transform(initial[features].to_numpy(dtype=np.float64)),
+              initial['heart_disease'])
+    return model, scaler
+
+
+def write_models_dir(path, model, scaler, features):
+    """Lay out deployment artifacts the way the training pipeline does"""
+    for name, obj in (('best_heart_disease_model', model), ('scaler', scaler),
+                      ('feature_names', features)):
+        with open(os.path.join(path, f'{name}.pkl'), 'wb') as f:
+            pickle.dump(obj, f)
+    with open(os.path.join(path, 'model_metadata.json'), 'w') as f:
+        json.dump({'model_name': 'Base', 'model_type': type(model).__name__,
+                   'creation_date': '2025-01-01 00:00:00',
+                   'performance_metrics': {'test_accuracy': 0.5}}, f)
+
+
+@pytest.mark.parametrize('make_model', [
+    lambda: create_sgd_model(),
+    lambda: MLPClassifier(hidden_layer_sizes=(16,), max_iter=300, random_state=42)
+])
+def test_scaler_update_preserves_predictions(make_model):
+    """Test that moving the scaler statistics alone does not change predictions"""
+    features, initial, stream, _ = load_dataset()
+    model, scaler = fit_initial(make_model(), features, initial)
+    learner = OnlineLearner(model, scaler, features, checkpoint_every=None)
+
+    X_all = pd.concat([initial, stream])[features].to_numpy(dtype=np.float64)
+    before = model.predict_proba(scaler.transform(X_all))
+    learner._update_scaler(stream[features].to_numpy(dtype=np.float64))
+
+    assert scaler.n_samples_seen_ == len(initial) + len(stream)
+    np.testing.assert_allclose(model.predict_proba(scaler.transform(X_all)), before,
+                               rtol=0, atol=1e-10)
+
+
+def test_frozen_scaler_and_unsupported_models():
+    """Test that freezing keeps the statistics and unsupported models must freeze"""
+    features, initial, stream, _ = load_dataset()
+    model, scaler = fit_initial(create_sgd_model(), features, initial)
+    mean = scaler.mean_.copy()
+    learner = OnlineLearner(model, scaler, features, checkpoint_every=None, update_scaler=False)
+    learner.update(stream[features], stream['heart_disease'])
+    np.testing.assert_array_equal(scaler.mean_, mean)
+
+    naive_bayes, nb_scaler = fit_initial(GaussianNB(), features, initial)
+    with pytest.raises(ValueError):
+        OnlineLearner(naive_bayes, nb_scaler, features)
+    OnlineLearner(naive_bayes, nb_scaler, features, update_scaler=False)
+
+
+def test_update_checkpoint_promote_and_rollback(tmp_path):
+    """Test versioned checkpoints, serving an update and rolling it back"""
+    features, initial, stream, held_out = load_dataset()
+    models_dir = str(tmp_path)
+    model, scaler = fit_initial(create_sgd_model(), features, initial)
+    write_models_dir(models_dir, model, scaler, features)
+
+    learner = OnlineLearner.from_artifacts(models_dir, checkpoint_every=50)
+    written = [learner.update(batch[features], batch['heart_disease'])
+               for _, batch in stream.groupby(np.arange(len(stream)) // 25)]
+    assert [w is not None for w in written] == [False, True] * 3
+    versions = sorted(os.listdir(os.path.join(models_dir, 'versions')))
+    assert versions == ['v0001', 'v0002', 'v0003']
+    for version in versions:
+        with open(os.path.join(models_dir, 'versions', version, 'version.json')) as f:
+            info = json.load(f)
+        assert info['rows_seen'] == 50 * int(version[1:])
+
+    learner.promote(held_out[features], held_out['heart_disease'])
+    with open(os.path.join(models_dir, 'model_metadata.json')) as f:
+        metadata = json.load(f)
+    assert metadata['online_learning']['version'] == 3
+    assert metadata['online_learning']['rows_seen'] == 150
+    assert metadata['online_learning']['base_creation_date'] == '2025-01-01 00:00:00'
+    assert metadata['performance_metrics']['test_accuracy'] != 0.5
+    promoted_metrics = metadata['performance_metrics']
+
+    # The served files are the promoted state
+    X_held = held_out[features].to_numpy(dtype=np.float64)
+    with open(os.path.join(models_dir, 'best_heart_disease_model.pkl'), 'rb') as f:
+        served = pickle.load(f)
+    np.testing.assert_array_equal(served.predict_proba(learner.scaler.transform(X_held)),
+                                  learner.model.predict_proba(learner.scaler.transform(X_held)))
+
+    # Rolling back serves version 1 and records it
+    restored_model, restored_scaler = rollback(models_dir, 1)
+    with open(os.path.join(models_dir, 'versions', 'v0001', 'model.pkl'), 'rb') as f:
+        v1_model = pickle.load(f)
+    np.testing.assert_array_equal(restored_model.coef_, v1_model.coef_)
+    with open(os.path.join(models_dir, 'model_metadata.json')) as f:
+        metadata = json.load(f)
+    assert metadata['online_learning']['version'] == 1
+    assert metadata['online_learning']['base_creation_date'] == '2025-01-01 00:00:00'
+    # Version 1 was never evaluated: no metrics rather than those of version 3
+    assert 'performance_metrics' not in metadata
+    assert not metadata['online_learning']['metrics_refreshed']
+    assert metadata['online_learning']['base_performance_metrics'] == {'test_accuracy': 0.5}
+
+    # Rolling forward restores the metrics stored when version 3 was promoted
+    rollback(models_dir, 3)
+    with open(os.path.join(models_dir, 'model_metadata.json')) as f:
+        metadata = json.load(f)
+    assert metadata['performance_metrics'] == promoted_metrics
+    assert not any(name.endswith('.tmp') for name in os.listdir(models_dir))
@@ -0,0 +1,108 @@
+"""
+Tests for the Report Builder Module
+Checks headless rendering of the full figure set, its manifest and incremental re-rendering
+Author: Jay Prakash
+"""
+
+import glob
+import json
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from report_builder import MANIFEST_FILENAME, build_report_jobs, render_reports
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heart_disease_dataset.csv')
+
+MODELS = ['Logistic Regression', 'Random Forest']
+
+
+def make_evaluation(seed=0, n_test=80):
+    """Model results in the evaluate_models(keep_predictions=True) layout"""
+    rng = np.random.default_rng(seed)
+    y_test = rng.integers(0, 2, n_test)
+    rows = []
+    for name in MODELS:
+        y_score = np.clip(y_test * 0.4 + rng.random(n_test) * 0.6, 0, 1)
+        rows.append({'Model': name, 'Accuracy': 0.8, 'Precision': 0.8, 'Recall': 0.8,
+                     'F1-Score': 0.8, 'ROC-AUC': 0.85,
+                     'y_pred': (y_score > 0.5).astype(int), 'y_score': y_score})
+    return {'results': pd.DataFrame(rows), 'y_test': y_test,
+            'feature_importance': {'age': 0.3, 'cholesterol': 0.7}}
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    return pd.read_csv(DATASET_PATH)
+
+
+def test_sequential_render_writes_every_figure(dataset, tmp_path):
+    """Test that render_reports writes every figure, a complete manifest and no temp files"""
+    jobs, shared = build_report_jobs(dataset, evaluation=make_evaluation())
+    output_dir = str(tmp_path / 'reports')
+    summary = render_reports(jobs, shared, output_dir, backend='sequential')
+
+    filenames = sorted(job.filename for job in jobs)
+    assert sorted(summary['rendered']) == filenames
+    assert summary['skipped'] == []
+    assert sorted(summary['figure_times']) == filenames
+    for filename in filenames:
+        assert os.path.getsize(os.path.join(output_dir, filename)) > 0
+    assert '05_roc_curves.png' in filenames
+    assert '06_confusion_matrix_random_forest.png' in filenames
+    assert '08_feature_importance.png' in filenames
+
+    with open(os.path.join(output_dir, MANIFEST_FILENAME)) as f:
+        manifest = json.load(f)
+    assert sorted(manifest['figures']) == filenames
+    functions = {job.filename: job.function for job in jobs}
+    for filename, entry in manifest['figures'].items():
+        assert entry['function'] == functions[filename]
+        assert len(entry['key']) == 64
+    assert glob.glob(os.path.join(output_dir, '*.tmp')) == []
+
+
+def test_incremental_render_touches_only_changed_figures(dataset, tmp_path):
+    """Test that unchanged figures are skipped in place and changed predictions re-render"""
+    output_dir = str(tmp_path / 'reports')
+    evaluation = make_evaluation()
+    jobs, shared = build_report_jobs(dataset, evaluation=evaluation)
+    render_reports(jobs, shared, output_dir, backend='sequential')
+
+    def mtimes():
+        return {job.filename: os.stat(os.path.join(output_dir, job.filename)).st_mtime_ns
+                for job in jobs}
+
+    before = mtimes()
+    summary = render_reports(jobs, shared, output_dir, backend='sequential')
+    assert summary['rendered'] == []
+    assert len(summary['skipped']) == len(jobs)
+    assert mtimes() == before
+
+    # New hard predictions only: the confusion matrix reads y_pred, the ROC curves do not
+    results = evaluation['results'].copy()
+    results.at[1, 'y_pred'] = 1 - results.at[1, 'y_pred']
+    jobs, shared = build_report_jobs(dataset, evaluation={**evaluation, 'results': results})
+    summary = render_reports(jobs, shared, output_dir, backend='sequential')
+    assert summary['rendered'] == ['06_confusion_matrix_random_forest.png']
+
+    # A retrained model changes both its predictions and its scores
+    results = results.copy()
+    results.at[1, 'y_pred'] = 1 - results.at[1, 'y_pred']
+    results.at[1, 'y_score'] = results.at[1, 'y_score'][::-1].copy()
+    jobs, shared = build_report_jobs(dataset, evaluation={**evaluation, 'results': results})
+    before = mtimes()
+    summary = render_reports(jobs, shared, output_dir, backend='sequential')
+    assert sorted(summary['rendered']) == ['05_roc_curves.png',
+                                           '06_confusion_matrix_random_forest.png']
+    after = mtimes()
+    assert {name for name in before if after[name] != before[name]} == set(summary['rendered'])
+
+    with open(os.path.join(output_dir, MANIFEST_FILENAME)) as f:
+        manifest = json.load(f)
+    assert sorted(manifest['figures']) == sorted(job.filename for job in jobs)
+    assert glob.glob(os.path.join(output_dir, '*.tmp')) == []
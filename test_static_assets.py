@@ -0,0 +1,129 @@
+"""
+Tests for the Static Assets Module and the Main Page
+Checks fingerprinted URLs, the stale-digest fallback and gzip variants via the Flask test client
+Author: Jay Prakash
+"""
+
+import gzip
+import hashlib
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+import app as web
+from static_assets import (ASSET_URL_PREFIX, FINGERPRINT_LENGTH, IMMUTABLE_CACHE_CONTROL,
+                           MIN_COMPRESS_BYTES, AssetManifest)
+
+STATIC_DIR = os.path.join(ROOT_DIR, 'static')
+
+
+def read_static(filename):
+    """Bytes of a file under static/"""
+    with open(os.path.join(STATIC_DIR, filename), 'rb') as f:
+        return f.read()
+
+
+def stale_url(url):
+    """The same asset URL with a digest from an earlier deploy"""
+    stem, digest, ext = url.rsplit('.', 2)
+    return f"{stem}.{'0' * len(digest)}.{ext}"
+
+
+@pytest.fixture
+def client():
+    """Test client of the app as loaded from models/ and static/"""
+    return web.app.test_client()
+
+
+def test_manifest_fingerprints_and_variants(tmp_path):
+    """Test fingerprint lookup, stale digests and which files get a gzip variant"""
+    (tmp_path / 'css').mkdir()
+    large = b'body { margin: 0; }\n' * 200
+    (tmp_path / 'css' / 'site.css').write_bytes(large)
+    (tmp_path / 'small.js').write_bytes(b'console.log(1);')
+    (tmp_path / 'logo.png').write_bytes(b'\x89PNG' + bytes(4000))
+    manifest = AssetManifest(str(tmp_path))
+
+    digest = hashlib.sha256(large).hexdigest()[:FINGERPRINT_LENGTH]
+    url = manifest.url('css/site.css')
+    assert url == f'{ASSET_URL_PREFIX}/css/site.{digest}.css'
+    assert manifest.url('missing.css') == '/static/missing.css'
+
+    asset, current = manifest.lookup(f'css/site.{digest}.css')
+    assert current and asset.filename == 'css/site.css'
+    assert asset.mimetype == 'text/css'
+    asset, current = manifest.lookup(f"css/site.{'0' * FINGERPRINT_LENGTH}.css")
+    assert asset.filename == 'css/site.css' and not current
+    assert manifest.lookup('css/site.css') == (None, False)
+    assert manifest.lookup(f'css/other.{digest}.css') == (None, False)
+
+    assert gzip.decompress(asset.variants['gzip']) == large
+    assert asset.variants['identity'] == large
+    assert list(asset.variants)[-1] == 'identity'
+    # Too small to gain from compression, or already compressed
+    assert list(manifest.assets['small.js'].variants) == ['identity']
+    assert list(manifest.assets['logo.png'].variants) == ['identity']
+    assert manifest.summary()['css/site.css']['identity'] == len(large)
+
+
+def test_asset_route_serves_fingerprinted_files(client):
+    """Test immutable caching, gzip negotiation and 304s for a current fingerprint"""
+    content = read_static('css/styles.css')
+    assert len(content) >= MIN_COMPRESS_BYTES
+    url = web.asset_manifest.url('css/styles.css')
+    assert url.startswith(f'{ASSET_URL_PREFIX}/css/styles.')
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.data == content
+    assert response.mimetype == 'text/css'
+    assert response.headers['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert 'Content-Encoding' not in response.headers
+    identity_etag = response.get_etag()[0]
+
+    response = client.get(url, headers={'Accept-Encoding': 'gzip, deflate'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.data) == content
+    assert len(response.data) < len(content)
+    gzip_etag = response.get_etag()[0]
+    assert gzip_etag != identity_etag
+
+    response = client.get(url, headers={'Accept-Encoding': 'gzip',
+                                        'If-None-Match': f'"{gzip_etag}"'})
+    assert response.status_code == 304
+    assert response.data == b''
+
+
+def test_asset_route_stale_and_unknown(client):
+    """Test that a stale digest gets today's file with no-cache and unknown files a 404"""
+    url = web.asset_manifest.url('js/app.js')
+    response = client.get(stale_url(url))
+    assert response.status_code == 200
+    assert response.data == read_static('js/app.js')
+    assert response.headers['Cache-Control'] == 'no-cache'
+    assert response.get_etag() == client.get(url).get_etag()
+
+    missing = f"{ASSET_URL_PREFIX}/js/missing.{'0' * FINGERPRINT_LENGTH}.js"
+    assert client.get(missing).status_code == 404
+    assert client.get(f'{ASSET_URL_PREFIX}/js/app.js').status_code == 404
+
+
+def test_index_links_fingerprinted_assets(client):
+    """Test that the main page links current asset URLs and serves a gzip variant"""
+    response = client.get('/')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+    page = response.data.decode()
+    for filename in ('css/styles.css', 'js/app.js'):
+        assert web.asset_manifest.url(filename) in page
+    etag = response.get_etag()[0]
+    assert client.get('/', headers={'If-None-Match': f'"{etag}"'}).status_code == 304
+
+    response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.data).decode() == page
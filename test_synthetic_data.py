@@ -0,0 +1,99 @@
+"""
+Tests for the Synthetic Data Module
+Checks seed reproducibility across workers, exact class balance, schema ranges and copula fidelity
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from data_preprocessing import DATASET_SCHEMA
+from synthetic_data import (MAX_DISCRETE_LEVELS, SyntheticDataGenerator, fidelity_report,
+                            generate_dataset)
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heart_disease_dataset.csv')
+
+# Largest Spearman correlation gap between source and synthetic rows; a 400-row
+# source gives correlation estimates with about 0.05 standard error, 0.05-0.07 is typical
+MAX_CORRELATION_GAP = 0.1
+
+
+@pytest.fixture(scope='module')
+def source():
+    return pd.read_csv(DATASET_PATH)
+
+
+@pytest.fixture(scope='module')
+def generator(source):
+    return SyntheticDataGenerator().fit(source)
+
+
+def test_same_seed_same_output_for_any_worker_count(generator, tmp_path):
+    """Test that a seed gives byte-identical output for every backend and worker count"""
+    outputs = []
+    for backend, n_workers in (('sequential', None), ('process', 1), ('process', 3)):
+        path = str(tmp_path / f'{backend}_{n_workers}.csv')
+        generate_dataset(generator, 2500, path, chunk_rows=400, seed=7,
+                         backend=backend, n_workers=n_workers)
+        with open(path, 'rb') as f:
+            outputs.append(f.read())
+        assert not os.path.exists(path + '.parts')
+    assert outputs[0] == outputs[1] == outputs[2]
+
+    npy_dirs = []
+    for n_workers in (1, 2):
+        output_dir = str(tmp_path / f'npy_{n_workers}')
+        generate_dataset(generator, 900, output_dir, fmt='npy', chunk_rows=250, seed=7,
+                         backend='process', n_workers=n_workers)
+        npy_dirs.append(output_dir)
+    for part in sorted(os.listdir(npy_dirs[0])):
+        for column in generator.columns:
+            name = os.path.join(part, f'{column}.npy')
+            np.testing.assert_array_equal(np.load(os.path.join(npy_dirs[0], name)),
+                                          np.load(os.path.join(npy_dirs[1], name)))
+
+    frame = pd.read_csv(os.path.join(tmp_path, 'sequential_None.csv'))
+    assert len(frame) == 2500
+    assert list(frame.columns) == generator.columns
+
+
+def test_exact_class_balance(generator, source):
+    """Test that each sample splits rows across classes by largest remainder of the priors"""
+    prior = source['heart_disease'].mean()
+    for n_rows in (1, 7, 400, 1001, 12345):
+        positives = int(generator.sample(n_rows, random_state=n_rows)['heart_disease'].sum())
+        assert abs(positives - prior * n_rows) <= 0.5
+    assert generator.sample(400, random_state=0)['heart_disease'].sum() == source['heart_disease'].sum()
+
+
+def test_values_respect_schema_ranges_and_levels(generator, source):
+    """Test schema dtypes, source value ranges, category levels and column resolution"""
+    synthetic = generator.sample(20000, random_state=1)
+
+    assert {c: str(t) for c, t in synthetic.dtypes.items()} == DATASET_SCHEMA
+    for column in source.columns:
+        real, synth = source[column], synthetic[column].astype(np.float64)
+        assert synth.min() >= real.min()
+        assert synth.max() <= real.max()
+        if real.nunique() <= MAX_DISCRETE_LEVELS:
+            assert set(synth.unique()) <= set(real.unique())
+    # st_depression is stored with one decimal in the source
+    tenths = synthetic['st_depression'].astype(np.float64) * 10
+    np.testing.assert_allclose(tenths, tenths.round(), atol=1e-4)
+
+
+def test_fidelity_report_correlation_gap(generator, source):
+    """Test that synthetic Spearman correlations stay within MAX_CORRELATION_GAP"""
+    synthetic = generator.sample(20000, random_state=2)
+    report, corr_gap = fidelity_report(source, synthetic)
+
+    assert corr_gap <= MAX_CORRELATION_GAP
+    assert report['new_levels'].sum() == 0
+    assert list(report.index) == list(source.columns)
+    np.testing.assert_allclose(report['synth_mean'], report['real_mean'],
+                               rtol=0.05, atol=0.05)
@@ -0,0 +1,66 @@
+"""
+Parity Tests for the Compiled Tree Ensemble Engine
+Checks that flattened-array inference matches sklearn predict_proba
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.ensemble import (RandomForestClassifier, ExtraTreesClassifier,
+                              GradientBoostingClassifier, AdaBoostClassifier)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from data_preprocessing import preprocess_data
+from tree_inference import compile_ensemble
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heart_disease_dataset.csv')
+
+
+def load_split():
+    """Load the dataset and return the scaled train/test split"""
+    df = pd.read_csv(DATASET_PATH)
+    X_train, X_test, y_train, y_test, _, _ = preprocess_data(df)
+    return X_train.values, X_test.values, y_train.values, y_test.values
+
+
+def check_parity(model):
+    """Fit a model and compare compiled probabilities with sklearn"""
+    X_train, X_test, y_train, _ = load_split()
+    model.fit(X_train, y_train)
+    compiled = compile_ensemble(model)
+
+    for X in (X_train, X_test, X_test[:1]):
+        expected = model.predict_proba(X)
+        actual = compiled.predict_proba(X)
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+        np.testing.assert_array_equal(compiled.predict(X), model.predict(X))
+
+
+def test_decision_tree_parity():
+    """Test compiled Decision Tree against sklearn"""
+    check_parity(DecisionTreeClassifier(random_state=42))
+
+
+def test_random_forest_parity():
+    """Test compiled Random Forest against sklearn"""
+    check_parity(RandomForestClassifier(n_estimators=100, random_state=42))
+
+
+def test_extra_trees_parity():
+    """Test compiled Extra Trees against sklearn"""
+    check_parity(ExtraTreesClassifier(n_estimators=100, max_depth=10, random_state=42))
+
+
+def test_gradient_boosting_parity():
+    """Test compiled Gradient Boosting against sklearn"""
+    check_parity(GradientBoostingClassifier(n_estimators=100, random_state=42))
+
+
+def test_adaboost_parity():
+    """Test compiled AdaBoost against sklearn"""
+    check_parity(AdaBoostClassifier(n_estimators=50, random_state=42))
+
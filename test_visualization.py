@@ -0,0 +1,89 @@
+"""
+Parity Tests for the Visualization Module
+Checks the chunked histogram, box plot and ROC summaries against numpy, matplotlib and sklearn
+Author: Jay Prakash
+"""
+
+import os
+import sys
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pytest
+from matplotlib import cbook
+from sklearn.metrics import auc, roc_auc_score, roc_curve
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from visualization import binned_roc_curve, box_summaries, histogram_counts, roc_points
+
+# Binning only merges scores that share one of 65536 bins, which the curve
+# then treats as ties; on continuous scores the AUC moves by about 1e-6
+MAX_BINNED_AUC_ERROR = 1e-4
+
+
+def make_scores(n_rows, seed=0):
+    """Labels with overlapping normal class-1 scores"""
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, n_rows)
+    return y, rng.normal(y.astype(float), 1.0)
+
+
+@pytest.mark.parametrize('chunk_size', [1_000_000, 1000, 7])
+def test_histogram_counts_match_numpy(chunk_size):
+    """Test that chunked counts and edges equal np.histogram on the whole column"""
+    rng = np.random.default_rng(1)
+    for values in (rng.lognormal(size=5000), rng.integers(29, 78, 5000), np.full(50, 3.0)):
+        counts, edges = histogram_counts(values, bins=30, chunk_size=chunk_size)
+        expected_counts, expected_edges = np.histogram(values, bins=30)
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_array_equal(edges, expected_edges)
+
+
+@pytest.mark.parametrize('chunk_size', [1_000_000, 100])
+def test_box_summaries_match_boxplot_stats(chunk_size):
+    """Test box statistics against cbook.boxplot_stats while each group fits the sketch"""
+    rng = np.random.default_rng(2)
+    values = np.concatenate([rng.normal(130, 15, 1500), [40.0, 41.0, 250.0, 250.0]])
+    groups = rng.integers(0, 2, len(values))
+    summaries = box_summaries(values, groups, chunk_size=chunk_size)
+
+    assert [entry['label'] for entry in summaries] == [0, 1]
+    for entry in summaries:
+        expected = cbook.boxplot_stats(values[groups == entry['label']])[0]
+        for stat in ('q1', 'med', 'q3', 'whislo', 'whishi'):
+            assert entry[stat] == pytest.approx(expected[stat], rel=1e-12)
+        # Duplicate outliers are drawn once
+        np.testing.assert_array_equal(entry['fliers'], np.unique(expected['fliers']))
+
+
+def test_binned_roc_auc_within_bound():
+    """Test that the binned curve's AUC stays within MAX_BINNED_AUC_ERROR of roc_auc_score"""
+    y, scores = make_scores(200_000)
+    fpr, tpr = binned_roc_curve(y, scores, chunk_size=30_000)
+
+    assert (fpr[0], tpr[0]) == (0.0, 0.0) and (fpr[-1], tpr[-1]) == (1.0, 1.0)
+    assert np.all(np.diff(fpr) >= 0) and np.all(np.diff(tpr) >= 0)
+    assert abs(auc(fpr, tpr) - roc_auc_score(y, scores)) <= MAX_BINNED_AUC_ERROR
+
+    # Scores with few distinct values land in separate bins: ties are exact
+    rounded = np.round(scores, 1)
+    fpr, tpr = binned_roc_curve(y, rounded, chunk_size=30_000)
+    assert auc(fpr, tpr) == pytest.approx(roc_auc_score(y, rounded), abs=1e-12)
+
+
+def test_roc_points_exact_and_binned():
+    """Test roc_points against roc_curve below one chunk and the binned bound above it"""
+    y, scores = make_scores(5000, seed=3)
+    fpr, tpr, roc_auc = roc_points({'y_test': y, 'y_score': scores}, max_points=100)
+    expected_fpr, expected_tpr, _ = roc_curve(y, scores)
+
+    assert roc_auc == pytest.approx(auc(expected_fpr, expected_tpr), abs=1e-12)
+    assert len(fpr) <= 100
+    assert (fpr[0], tpr[0], fpr[-1], tpr[-1]) == (0.0, 0.0, 1.0, 1.0)
+
+    probabilities = np.column_stack([1 - scores, scores])
+    assert roc_points({'y_test': y, 'y_pred_proba': probabilities})[2] == roc_auc
+
+    _, _, binned_auc = roc_points({'y_test': y, 'y_score': scores}, chunk_size=1000)
+    assert abs(binned_auc - roc_auc_score(y, scores)) <= MAX_BINNED_AUC_ERROR